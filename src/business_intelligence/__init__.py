@@ -10,11 +10,46 @@ Este módulo contém implementações de BI para:
 - Comparação de dados históricos
 """
 
-from .salary_trend_analyzer import salary_trend_analyzer
-from .regional_heatmap import regional_heatmap
-from .skills_demand_analyzer import skills_demand_analyzer
-from .market_intelligence_reports import market_intelligence
-from .historical_data_comparator import historical_comparator
+import importlib
+import sys
+import types
+
+# Instâncias exportadas e seus módulos: cada módulo (e a sua instância global,
+# que lê os arquivos de dados) só é carregado no primeiro acesso
+_EXPORTS = {
+    'salary_trend_analyzer': '.salary_trend_analyzer',
+    'regional_heatmap': '.regional_heatmap',
+    'skills_demand_analyzer': '.skills_demand_analyzer',
+    'market_intelligence': '.market_intelligence_reports',
+    'historical_comparator': '.historical_data_comparator'
+}
+
+
+def _export_property(name: str, module_name: str) -> property:
+    """
+    Propriedade que carrega a instância exportada no primeiro acesso
+    
+    Alguns submódulos têm o mesmo nome da instância que exportam; o import do
+    submódulo tenta gravá-lo como atributo do pacote, e o setter ignora essa
+    gravação para que o atributo continue sendo a instância.
+    """
+    def getter(module):
+        return getattr(importlib.import_module(module_name, __name__), name)
+    
+    def setter(module, value):
+        pass
+    
+    return property(getter, setter)
+
+
+class _LazyExportsModule(types.ModuleType):
+    """Pacote com as instâncias de BI carregadas sob demanda"""
+
+
+for _name, _module_name in _EXPORTS.items():
+    setattr(_LazyExportsModule, _name, _export_property(_name, _module_name))
+
+sys.modules[__name__].__class__ = _LazyExportsModule
 
 __all__ = [
     'salary_trend_analyzer',
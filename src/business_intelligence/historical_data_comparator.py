@@ -11,11 +11,79 @@ Este módulo implementa:
 
 import json
 import os
+import re
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
-from collections import defaultdict
-import statistics
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Pontos mantidos por série temporal (1 ano de pontos diários)
+MAX_TIME_SERIES_POINTS = 365
+
+# Registros de comparação mantidos (os mais recentes)
+MAX_COMPARISONS = 100
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serializa uma linha JSON compacta em UTF-8 (orjson quando disponível)"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """Desserializa JSON (bytes)"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class ValueRing:
+    """
+    Últimos valores de uma série em ring buffer float64 pré-alocado
+    
+    Cada valor é gravado em duas posições (i e i + capacity), então a janela
+    mais recente é sempre um slice contíguo: inserção e leitura O(1), sem
+    copiar a coluna.
+    """
+    
+    __slots__ = ('capacity', '_buffer', '_head', '_count')
+    
+    def __init__(self, values: np.ndarray, capacity: int = MAX_TIME_SERIES_POINTS):
+        values = values[-capacity:]
+        count = len(values)
+        
+        self.capacity = capacity
+        self._buffer = np.empty(2 * capacity, dtype=np.float64)
+        self._buffer[:count] = values
+        self._buffer[capacity:capacity + count] = values
+        self._head = count % capacity
+        self._count = count
+    
+    def append(self, value: float):
+        """Registra um valor, descartando o mais antigo quando cheio"""
+        head = self._head
+        self._buffer[head] = self._buffer[head + self.capacity] = value
+        self._head = (head + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+    
+    def view(self) -> np.ndarray:
+        """Janela atual (do mais antigo ao mais recente); válida até o próximo append"""
+        end = self._head + self.capacity
+        window = self._buffer[end - self._count:end]
+        window.flags.writeable = False
+        return window
 
 
 @dataclass
@@ -40,6 +108,13 @@ class SeasonalPattern:
     confidence: float
 
 
+@dataclass
+class JobsFrame:
+    """Vagas de um período em formato colunar, com as métricas já calculadas"""
+    frame: pd.DataFrame
+    metrics: Dict[str, Optional[float]] = field(default_factory=dict)
+
+
 class HistoricalDataComparator:
     """
     Comparador de dados históricos para análise temporal
@@ -52,15 +127,58 @@ class HistoricalDataComparator:
     - Projeções futuras
     """
     
+    # Colunas das vagas usadas no cálculo das métricas
+    _JOB_COLUMNS = ['titulo', 'descricao', 'localizacao', 'salario']
+    
+    # Skills básicas contadas em top_skills_frequency (uma única passada de regex por texto)
+    _BASIC_SKILLS = ('python', 'javascript', 'java', 'react', 'sql', 'aws', 'docker')
+    _SKILL_RE = re.compile(r'\b(' + '|'.join(_BASIC_SKILLS) + r')\b', re.IGNORECASE)
+    
+    # Primeiro número de um texto salarial
+    _SALARY_RE = re.compile(r'([\d,\.]+)')
+    
+    # Regiões em ordem de prioridade: as alternativas são testadas na posição 0,
+    # na ordem, e o grupo que casou (lastgroup) identifica a região
+    _REGION_RE = re.compile(
+        r'\A(?:(?=.*(?:sp|são paulo))(?P<sp>)'
+        r'|(?=.*(?:rj|rio))(?P<rj>)'
+        r'|(?=.*(?:remoto|home office))(?P<remote>))',
+        re.DOTALL
+    )
+    _REGION_NAMES = {'sp': 'São Paulo', 'rj': 'Rio de Janeiro', 'remote': 'Remoto'}
+    
+    # Listas de vagas recentes mantidas no cache de frames/métricas
+    _JOBS_CACHE_SIZE = 8
+    
     def __init__(self, data_file: str = "data/business_intelligence/historical_comparisons.json"):
         self.data_file = data_file
         self.data_dir = os.path.dirname(data_file)
         
-        # Criar diretório se não existir
-        os.makedirs(self.data_dir, exist_ok=True)
+        # Séries temporais ficam em arquivos JSONL por métrica (append-only)
+        self.time_series_dir = os.path.join(self.data_dir, "time_series")
+        self.time_series_index_file = os.path.join(self.time_series_dir, "index.json")
+        
+        # Registros de comparação também ficam num JSONL próprio (append-only)
+        self.comparisons_file = os.path.join(self.data_dir, "comparisons.jsonl")
+        self._comparisons_lines = 0
+        
+        # Criar diretórios se não existirem
+        os.makedirs(self.time_series_dir, exist_ok=True)
+        
+        # Linhas gravadas em cada arquivo de série desde a última compactação
+        self._time_series_lines: Dict[str, int] = {}
+        
+        # Coluna 'value' de cada série em ring buffer (montada sob demanda)
+        self._value_columns: Dict[str, ValueRing] = {}
+        
+        # Frames/métricas por lista de vagas: compare_periods chamado para vários
+        # períodos com a mesma lista atual reaproveita o cálculo
+        self._jobs_cache: Dict[int, Tuple[List[Dict], Tuple, JobsFrame]] = {}
         
         # Carregar dados históricos
         self.historical_data = self._load_historical_data()
+        self._load_time_series()
+        self._load_comparisons()
         
         # Períodos padrão para comparação
         self.comparison_periods = {
@@ -71,11 +189,16 @@ class HistoricalDataComparator:
         }
     
     def _load_historical_data(self) -> Dict:
-        """Carrega dados históricos de comparações"""
+        """
+        Carrega dados históricos de comparações
+        
+        O JSON agregado é só lido: séries temporais e comparações vivem nos
+        arquivos JSONL, e o que vier do formato antigo é migrado para eles.
+        """
         if os.path.exists(self.data_file):
             try:
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(self.data_file, 'rb') as f:
+                    return _loads(f.read())
             except:
                 pass
         
@@ -92,37 +215,139 @@ class HistoricalDataComparator:
             }
         }
     
-    def _save_historical_data(self):
-        """Salva dados históricos"""
+    def _time_series_path(self, metric_name: str) -> str:
+        """Caminho do arquivo JSONL da série de uma métrica"""
+        filename = re.sub(r'[^\w.-]', '_', metric_name) + '.jsonl'
+        return os.path.join(self.time_series_dir, filename)
+    
+    def _load_time_series(self):
+        """Carrega as séries temporais dos arquivos JSONL (migrando as do JSON antigo)"""
+        time_series = self.historical_data.setdefault("time_series", {})
+        
+        metrics = []
+        if os.path.exists(self.time_series_index_file):
+            try:
+                with open(self.time_series_index_file, 'r', encoding='utf-8') as f:
+                    metrics = json.load(f)
+            except Exception:
+                metrics = []
+        
+        for metric_name in metrics:
+            points = []
+            try:
+                with open(self._time_series_path(metric_name), 'rb') as f:
+                    points = [_loads(line) for line in f if line.strip()]
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"Erro ao carregar série temporal {metric_name}: {e}")
+            
+            self._time_series_lines[metric_name] = len(points)
+            time_series[metric_name] = deque(points, maxlen=MAX_TIME_SERIES_POINTS)
+        
+        # Séries que só existem no formato antigo (dentro do JSON agregado)
+        legacy_metrics = [metric for metric in time_series if metric not in metrics]
+        if legacy_metrics:
+            for metric_name in legacy_metrics:
+                time_series[metric_name] = deque(time_series[metric_name], maxlen=MAX_TIME_SERIES_POINTS)
+                self._compact_time_series(metric_name)
+            self._save_time_series_index()
+    
+    def _save_time_series_index(self):
+        """Grava a lista de métricas com série temporal"""
+        try:
+            with open(self.time_series_index_file, 'w', encoding='utf-8') as f:
+                json.dump(sorted(self.historical_data["time_series"]), f, ensure_ascii=False)
+        except Exception as e:
+            print(f"Erro ao salvar índice de séries temporais: {e}")
+    
+    def _compact_time_series(self, metric_name: str):
+        """Reescreve o arquivo da série só com os pontos mantidos em memória"""
+        points = self.historical_data["time_series"][metric_name]
         try:
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(self.historical_data, f, indent=2, ensure_ascii=False)
+            with open(self._time_series_path(metric_name), 'wb') as f:
+                f.write(b''.join(_dumps(point) + b'\n' for point in points))
+            self._time_series_lines[metric_name] = len(points)
         except Exception as e:
-            print(f"Erro ao salvar dados históricos: {e}")
+            print(f"Erro ao compactar série temporal {metric_name}: {e}")
+    
+    def _load_comparisons(self):
+        """Carrega as comparações do JSONL (migrando as do JSON antigo)"""
+        legacy = self.historical_data.get("comparisons") or []
+        
+        if os.path.exists(self.comparisons_file):
+            records = []
+            try:
+                with open(self.comparisons_file, 'rb') as f:
+                    records = [_loads(line) for line in f if line.strip()]
+            except Exception as e:
+                print(f"Erro ao carregar comparações: {e}")
+            
+            self._comparisons_lines = len(records)
+            self.historical_data["comparisons"] = deque(records, maxlen=MAX_COMPARISONS)
+        else:
+            self.historical_data["comparisons"] = deque(legacy, maxlen=MAX_COMPARISONS)
+            if legacy:
+                self._compact_comparisons()
     
-    def add_time_series_data(self, metric_name: str, data_point: Dict):
+    def _compact_comparisons(self):
+        """Reescreve o arquivo de comparações só com os registros mantidos em memória"""
+        records = self.historical_data["comparisons"]
+        try:
+            with open(self.comparisons_file, 'wb') as f:
+                f.write(b''.join(_dumps(record) + b'\n' for record in records))
+            self._comparisons_lines = len(records)
+        except Exception as e:
+            print(f"Erro ao compactar comparações: {e}")
+    
+    def add_time_series_data(self, metric_name: str, data_point: Dict,
+                             timestamp: Optional[str] = None):
         """
         Adiciona ponto de dados à série temporal
         
         Args:
             metric_name: Nome da métrica
             data_point: Dados do ponto temporal
+            timestamp: Timestamp ISO do ponto (padrão: o do próprio ponto ou agora);
+                cargas em lote podem passar o mesmo valor para vários pontos
         """
-        timestamp = data_point.get('timestamp', datetime.now().isoformat())
+        # Só consultar o relógio quando o ponto não traz timestamp
+        if timestamp is None:
+            timestamp = data_point.get('timestamp') or datetime.now().isoformat()
         
-        if metric_name not in self.historical_data["time_series"]:
-            self.historical_data["time_series"][metric_name] = []
+        time_series = self.historical_data["time_series"]
+        new_metric = metric_name not in time_series
+        if new_metric:
+            time_series[metric_name] = deque(maxlen=MAX_TIME_SERIES_POINTS)
         
-        # Adicionar ponto com timestamp
+        # Adicionar ponto com timestamp; a deque mantém só os últimos 365 pontos (1 ano)
         data_point['timestamp'] = timestamp
-        self.historical_data["time_series"][metric_name].append(data_point)
+        time_series[metric_name].append(data_point)
         
-        # Manter apenas os últimos 365 pontos (1 ano)
-        if len(self.historical_data["time_series"][metric_name]) > 365:
-            self.historical_data["time_series"][metric_name] = \
-                self.historical_data["time_series"][metric_name][-365:]
-        
-        self._save_historical_data()
+        # Atualizar a coluna de valores já montada em vez de remontá-la dos dicts
+        column = self._value_columns.get(metric_name)
+        if column is not None:
+            value = data_point.get('value')
+            try:
+                column.append(np.nan if value is None else value)
+            except (TypeError, ValueError):
+                del self._value_columns[metric_name]
+        
+        # Persistir só o novo ponto; o arquivo é compactado ao acumular o dobro
+        # dos pontos mantidos (custo amortizado O(1) por ponto)
+        lines = self._time_series_lines.get(metric_name, 0) + 1
+        if lines > 2 * MAX_TIME_SERIES_POINTS:
+            self._compact_time_series(metric_name)
+        else:
+            try:
+                with open(self._time_series_path(metric_name), 'ab') as f:
+                    f.write(_dumps(data_point) + b'\n')
+                self._time_series_lines[metric_name] = lines
+            except Exception as e:
+                print(f"Erro ao salvar série temporal {metric_name}: {e}")
+        
+        if new_metric:
+            self._save_time_series_index()
     
     def compare_periods(self, jobs_current: List[Dict], 
                        jobs_previous: List[Dict], 
@@ -149,9 +374,13 @@ class HistoricalDataComparator:
             'regional_distribution'
         ]
         
+        # Frames colunares montados uma vez e reaproveitados por todas as métricas
+        frame_current = self._get_jobs_frame(jobs_current)
+        frame_previous = self._get_jobs_frame(jobs_previous)
+        
         for metric in metrics_to_compare:
             comparison = self._compare_metric(
-                metric, jobs_current, jobs_previous, period_name
+                metric, frame_current, frame_previous, period_name
             )
             if comparison:
                 comparisons[metric] = comparison
@@ -173,21 +402,30 @@ class HistoricalDataComparator:
             }
         }
         
+        # A deque mantém apenas as últimas 100 comparações
         self.historical_data["comparisons"].append(comparison_record)
         
-        # Manter apenas as últimas 100 comparações
-        if len(self.historical_data["comparisons"]) > 100:
-            self.historical_data["comparisons"] = self.historical_data["comparisons"][-100:]
+        # Persistir só o novo registro; o arquivo é compactado ao acumular o dobro
+        # dos registros mantidos
+        lines = self._comparisons_lines + 1
+        if lines > 2 * MAX_COMPARISONS:
+            self._compact_comparisons()
+        else:
+            try:
+                with open(self.comparisons_file, 'ab') as f:
+                    f.write(_dumps(comparison_record) + b'\n')
+                self._comparisons_lines = lines
+            except Exception as e:
+                print(f"Erro ao salvar comparação: {e}")
         
-        self._save_historical_data()
         return comparisons
     
-    def _compare_metric(self, metric_name: str, current_jobs: List[Dict], 
-                       previous_jobs: List[Dict], period_name: str) -> Optional[HistoricalComparison]:
+    def _compare_metric(self, metric_name: str, current_jobs: JobsFrame, 
+                       previous_jobs: JobsFrame, period_name: str) -> Optional[HistoricalComparison]:
         """Compara uma métrica específica entre períodos"""
         try:
-            current_value = self._calculate_metric_value(metric_name, current_jobs)
-            previous_value = self._calculate_metric_value(metric_name, previous_jobs)
+            current_value = self._get_metric_value(metric_name, current_jobs)
+            previous_value = self._get_metric_value(metric_name, previous_jobs)
             
             if current_value is None or previous_value is None:
                 return None
@@ -219,12 +457,12 @@ class HistoricalDataComparator:
                 current_period={
                     'value': current_value,
                     'period': 'current',
-                    'job_count': len(current_jobs)
+                    'job_count': len(current_jobs.frame)
                 },
                 previous_period={
                     'value': previous_value,
                     'period': 'previous',
-                    'job_count': len(previous_jobs)
+                    'job_count': len(previous_jobs.frame)
                 },
                 change_percentage=change_pct,
                 trend=trend,
@@ -235,9 +473,62 @@ class HistoricalDataComparator:
             print(f"Erro ao comparar métrica {metric_name}: {e}")
             return None
     
-    def _calculate_metric_value(self, metric_name: str, jobs: List[Dict]) -> Optional[float]:
-        """Calcula valor de uma métrica específica"""
-        if not jobs:
+    def _get_jobs_frame(self, jobs: List[Dict]) -> JobsFrame:
+        """
+        Retorna o frame (e métricas já calculadas) de uma lista de vagas
+        
+        O cache é por identidade da lista; a assinatura (tamanho e identidade
+        da primeira/última vaga) detecta listas alteradas no lugar. A lista
+        fica referenciada no cache, então seu id não é reutilizado.
+        """
+        signature = (len(jobs), id(jobs[0]), id(jobs[-1])) if jobs else (0, None, None)
+        cached = self._jobs_cache.get(id(jobs))
+        if cached is not None and cached[0] is jobs and cached[1] == signature:
+            return cached[2]
+        
+        jobs_frame = JobsFrame(frame=self._jobs_to_frame(jobs))
+        self._jobs_cache.pop(id(jobs), None)
+        self._jobs_cache[id(jobs)] = (jobs, signature, jobs_frame)
+        
+        # Descartar as entradas mais antigas
+        while len(self._jobs_cache) > self._JOBS_CACHE_SIZE:
+            del self._jobs_cache[next(iter(self._jobs_cache))]
+        
+        return jobs_frame
+    
+    def _get_metric_value(self, metric_name: str, jobs: JobsFrame) -> Optional[float]:
+        """Valor da métrica, calculado uma vez por frame"""
+        if metric_name not in jobs.metrics:
+            jobs.metrics[metric_name] = self._calculate_metric_value(metric_name, jobs.frame)
+        return jobs.metrics[metric_name]
+    
+    def _value_column(self, metric_name: str) -> np.ndarray:
+        """
+        Coluna 'value' da série temporal como array float64 (NaN onde não há valor)
+        
+        Montada uma vez a partir dos pontos e depois atualizada a cada novo
+        ponto: benchmarks e projeções leem só essa coluna em vez de percorrer
+        os dicts de cada ponto.
+        """
+        column = self._value_columns.get(metric_name)
+        if column is None:
+            series = self.historical_data["time_series"].get(metric_name, [])
+            column = ValueRing(np.array([point.get('value') for point in series], dtype=np.float64))
+            self._value_columns[metric_name] = column
+        return column.view()
+    
+    def _jobs_to_frame(self, jobs: List[Dict]) -> pd.DataFrame:
+        """Converte a lista de vagas, em uma passada, no frame colunar usado pelas métricas"""
+        frame = pd.DataFrame.from_records(jobs, columns=self._JOB_COLUMNS).fillna('').astype(str)
+        
+        # Localização em minúsculas, compartilhada por remote_percentage e
+        # regional_distribution (uma única conversão por frame)
+        frame['localizacao_lower'] = frame['localizacao'].str.lower()
+        return frame
+    
+    def _calculate_metric_value(self, metric_name: str, jobs: pd.DataFrame) -> Optional[float]:
+        """Calcula valor de uma métrica específica (operações vetorizadas sobre o frame)"""
+        if jobs.empty:
             return None
         
         try:
@@ -245,54 +536,48 @@ class HistoricalDataComparator:
                 return float(len(jobs))
             
             elif metric_name == 'avg_salary':
-                salaries = []
-                for job in jobs:
-                    salary = self._extract_salary_value(job.get('salario', ''))
-                    if salary:
-                        salaries.append(salary)
-                return statistics.mean(salaries) if salaries else 0
+                salary_text = jobs['salario']
+                informed = (salary_text != '') & ~salary_text.str.lower().isin(['não informado', 'a combinar'])
+                first_number = (
+                    salary_text.str.replace('.', '', regex=False)
+                    .str.replace(',', '.', regex=False)
+                    .str.extract(self._SALARY_RE, expand=False)
+                )
+                salaries = pd.to_numeric(first_number, errors='coerce')
+                salaries = salaries[informed & salaries.notna() & (salaries != 0)]
+                return float(salaries.mean()) if not salaries.empty else 0
             
             elif metric_name == 'remote_percentage':
-                remote_count = 0
-                for job in jobs:
-                    location = job.get('localizacao', '').lower()
-                    if any(term in location for term in ['remoto', 'home office', 'hibrido']):
-                        remote_count += 1
-                return (remote_count / len(jobs)) * 100
+                is_remote = jobs['localizacao_lower'].str.contains('remoto|home office|hibrido', regex=True)
+                return float(is_remote.mean()) * 100
             
             elif metric_name == 'top_skills_frequency':
                 # Frequência média das top 5 skills
-                skills_count = defaultdict(int)
-                for job in jobs:
-                    description = f"{job.get('titulo', '')} {job.get('descricao', '')}"
-                    skills = self._extract_basic_skills(description)
-                    for skill in skills:
-                        skills_count[skill] += 1
+                text = jobs['titulo'] + ' ' + jobs['descricao']
+                matches = text.str.extractall(self._SKILL_RE)[0].str.lower()
                 
-                if skills_count:
-                    top_5_counts = sorted(skills_count.values(), reverse=True)[:5]
-                    return statistics.mean(top_5_counts) if top_5_counts else 0
+                if not matches.empty:
+                    # Cada skill conta uma vez por vaga
+                    job_skills = matches.droplevel('match').reset_index().drop_duplicates()
+                    top_5_counts = job_skills[0].value_counts().nlargest(5)
+                    return float(top_5_counts.mean())
                 return 0
             
             elif metric_name == 'regional_distribution':
                 # Índice de concentração regional (entropia)
-                regional_counts = defaultdict(int)
-                for job in jobs:
-                    region = self._normalize_region(job.get('localizacao', ''))
-                    regional_counts[region] += 1
+                location = jobs['localizacao_lower']
+                matched = location.str.extract(self._REGION_RE).notna()
+                # Códigos: não especificado, SP, RJ, remoto, outras
+                region_codes = np.select(
+                    [location == '', matched['sp'], matched['rj'], matched['remote']],
+                    [0, 1, 2, 3],
+                    default=4
+                )
+                regional_counts = np.bincount(region_codes, minlength=5)
                 
-                if not regional_counts:
-                    return 0
-                
-                # Calcular entropia como medida de distribuição
-                total = sum(regional_counts.values())
-                entropy = 0
-                for count in regional_counts.values():
-                    p = count / total
-                    if p > 0:
-                        entropy -= p * (p ** 0.5)  # Simplified entropy
-                
-                return entropy
+                # Calcular entropia como medida de distribuição (regiões vazias somam 0)
+                p = regional_counts / len(region_codes)
+                return float(-(p * np.sqrt(p)).sum())  # Simplified entropy
             
         except Exception as e:
             print(f"Erro ao calcular métrica {metric_name}: {e}")
@@ -304,8 +589,7 @@ class HistoricalDataComparator:
             return None
         
         # Extração básica de números
-        import re
-        numbers = re.findall(r'[\d,\.]+', salary_text.replace('.', '').replace(',', '.'))
+        numbers = self._SALARY_RE.findall(salary_text.replace('.', '').replace(',', '.'))
         if numbers:
             try:
                 return float(numbers[0])
@@ -315,30 +599,15 @@ class HistoricalDataComparator:
     
     def _extract_basic_skills(self, text: str) -> List[str]:
         """Extração básica de skills"""
-        basic_skills = ['python', 'javascript', 'java', 'react', 'sql', 'aws', 'docker']
-        found_skills = []
-        text_lower = text.lower()
-        
-        for skill in basic_skills:
-            if skill in text_lower:
-                found_skills.append(skill)
-        
-        return found_skills
+        return list(dict.fromkeys(match.lower() for match in self._SKILL_RE.findall(text)))
     
     def _normalize_region(self, location: str) -> str:
         """Normalização básica de região"""
         if not location:
             return 'Não especificado'
         
-        location_lower = location.lower()
-        if 'sp' in location_lower or 'são paulo' in location_lower:
-            return 'São Paulo'
-        elif 'rj' in location_lower or 'rio' in location_lower:
-            return 'Rio de Janeiro'
-        elif 'remoto' in location_lower or 'home office' in location_lower:
-            return 'Remoto'
-        else:
-            return 'Outras'
+        match = self._REGION_RE.match(location.lower())
+        return self._REGION_NAMES[match.lastgroup] if match else 'Outras'
     
     def detect_seasonal_patterns(self, metric_name: str, lookback_days: int = 180) -> Optional[SeasonalPattern]:
         """
@@ -359,34 +628,34 @@ class HistoricalDataComparator:
             return None
         
         try:
-            # Agrupar dados por semana
-            weekly_data = defaultdict(list)
-            monthly_data = defaultdict(list)
-            
-            cutoff_date = datetime.now() - timedelta(days=lookback_days)
-            
-            for point in time_series:
-                try:
-                    timestamp = datetime.fromisoformat(point['timestamp'].replace('Z', '+00:00'))
-                    if timestamp >= cutoff_date:
-                        week_of_year = timestamp.isocalendar()[1]
-                        month = timestamp.month
-                        value = point.get('value', 0)
-                        
-                        weekly_data[week_of_year].append(value)
-                        monthly_data[month].append(value)
-                except:
-                    continue
+            # Converter timestamps de uma vez (inválidos viram NaT); horários sem
+            # fuso são tratados como UTC, assim como o instante de corte
+            timestamps = pd.to_datetime(
+                [point.get('timestamp') for point in time_series],
+                errors='coerce', format='ISO8601', utc=True
+            )
+            values = np.array([point.get('value', 0) for point in time_series], dtype=np.float64)
+            
+            cutoff_date = pd.Timestamp(datetime.now() - timedelta(days=lookback_days), tz='UTC')
+            
+            recent = timestamps.notna() & (timestamps >= cutoff_date) & ~np.isnan(values)
+            timestamps = timestamps[recent]
+            values = pd.Series(values[recent])
+            
+            # Agrupar dados por semana (na ordem em que os períodos aparecem)
+            weekly_averages = values.groupby(timestamps.isocalendar().week.to_numpy(), sort=False).mean()
             
             # Analisar padrão semanal
-            if len(weekly_data) >= 4:
-                weekly_pattern = self._analyze_pattern(weekly_data, 'weekly')
+            if len(weekly_averages) >= 4:
+                weekly_pattern = self._analyze_pattern(weekly_averages, 'weekly')
                 if weekly_pattern:
                     return weekly_pattern
             
             # Analisar padrão mensal
-            if len(monthly_data) >= 3:
-                monthly_pattern = self._analyze_pattern(monthly_data, 'monthly')
+            monthly_averages = values.groupby(timestamps.month.to_numpy(), sort=False).mean()
+            
+            if len(monthly_averages) >= 3:
+                monthly_pattern = self._analyze_pattern(monthly_averages, 'monthly')
                 if monthly_pattern:
                     return monthly_pattern
             
@@ -395,38 +664,28 @@ class HistoricalDataComparator:
         
         return None
     
-    def _analyze_pattern(self, grouped_data: Dict, frequency: str) -> Optional[SeasonalPattern]:
-        """Analisa padrão em dados agrupados"""
+    def _analyze_pattern(self, period_averages: pd.Series, frequency: str) -> Optional[SeasonalPattern]:
+        """Analisa padrão nas médias por período (índice = período)"""
         try:
-            # Calcular médias por período
-            period_averages = {}
-            for period, values in grouped_data.items():
-                if values:
-                    period_averages[period] = statistics.mean(values)
-            
             if len(period_averages) < 3:
                 return None
             
             # Calcular estatísticas
-            all_averages = list(period_averages.values())
-            overall_mean = statistics.mean(all_averages)
-            std_dev = statistics.stdev(all_averages) if len(all_averages) > 1 else 0
+            averages = period_averages.to_numpy(dtype=np.float64)
+            overall_mean = float(averages.mean())
+            std_dev = float(averages.std(ddof=1))
             
             if std_dev == 0:
                 return None
             
-            # Identificar picos e vales
-            peak_periods = []
-            low_periods = []
-            
-            for period, avg in period_averages.items():
-                if avg > overall_mean + std_dev * 0.5:  # Acima de 0.5 desvios padrão
-                    peak_periods.append(str(period))
-                elif avg < overall_mean - std_dev * 0.5:  # Abaixo de 0.5 desvios padrão
-                    low_periods.append(str(period))
+            # Identificar picos e vales (acima/abaixo de 0.5 desvios padrão)
+            periods = period_averages.index.astype(str)
+            threshold = std_dev * 0.5
+            peak_periods = periods[averages > overall_mean + threshold].tolist()
+            low_periods = periods[averages < overall_mean - threshold].tolist()
             
             # Calcular amplitude (variação relativa)
-            amplitude = (max(all_averages) - min(all_averages)) / overall_mean * 100
+            amplitude = float(np.ptp(averages)) / overall_mean * 100
             
             # Calcular confiança baseada na consistência
             confidence = min(100, (std_dev / overall_mean * 100)) if overall_mean > 0 else 0
@@ -471,31 +730,30 @@ class HistoricalDataComparator:
         if metric_name not in self.historical_data["time_series"]:
             return benchmarks
         
-        time_series = self.historical_data["time_series"][metric_name]
-        values = []
-        
-        for point in time_series:
-            value = point.get('value')
-            if value is not None:
-                values.append(value)
-        
-        if not values:
-            return benchmarks
-        
         try:
+            column = self._value_column(metric_name)
+            values = column[~np.isnan(column)]
+            
+            if values.size == 0:
+                return benchmarks
+            
+            # Estatísticas de ordem numa única chamada (np.partition, sem ordenar tudo)
+            minimum, percentile_25, median, percentile_75, maximum = np.quantile(
+                values, [0.0, 0.25, 0.5, 0.75, 1.0]
+            )
+            
             benchmarks.update({
-                'min': min(values),
-                'max': max(values),
-                'average': statistics.mean(values),
-                'median': statistics.median(values),
-                'data_points': len(values)
+                'min': float(minimum),
+                'max': float(maximum),
+                'average': float(values.mean()),
+                'median': float(median),
+                'data_points': int(values.size)
             })
             
             # Percentis se há dados suficientes
-            if len(values) >= 4:
-                sorted_values = sorted(values)
-                benchmarks['percentile_25'] = sorted_values[len(values) // 4]
-                benchmarks['percentile_75'] = sorted_values[3 * len(values) // 4]
+            if values.size >= 4:
+                benchmarks['percentile_25'] = float(percentile_25)
+                benchmarks['percentile_75'] = float(percentile_75)
             
         except Exception as e:
             print(f"Erro ao calcular benchmarks: {e}")
@@ -525,47 +783,29 @@ class HistoricalDataComparator:
         if metric_name not in self.historical_data["time_series"]:
             return projection
         
-        time_series = self.historical_data["time_series"][metric_name][-20:]  # Últimos 20 pontos
-        
-        if len(time_series) < 5:
-            return projection
-        
         try:
-            # Extrair valores e calcular tendência simples
-            values = []
-            for point in time_series:
-                value = point.get('value')
-                if value is not None:
-                    values.append(value)
+            last_points = self._value_column(metric_name)[-20:]  # Últimos 20 pontos
             
-            if len(values) < 3:
+            if last_points.size < 5:
                 return projection
             
-            # Calcular tendência linear simples
-            n = len(values)
-            x_values = list(range(n))
+            # Extrair valores e calcular tendência simples
+            values = last_points[~np.isnan(last_points)]
             
-            # Regressão linear simples
-            sum_x = sum(x_values)
-            sum_y = sum(values)
-            sum_xy = sum(x * y for x, y in zip(x_values, values))
-            sum_x2 = sum(x * x for x in x_values)
+            if values.size < 3:
+                return projection
             
-            # Coeficientes da linha de tendência
-            slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
-            intercept = (sum_y - slope * sum_x) / n
+            # Regressão linear simples (mínimos quadrados de grau 1)
+            n = values.size
+            slope, intercept = np.polyfit(np.arange(n), values, 1)
+            slope = float(slope)
             
             # Projetar valores futuros
-            last_x = n - 1
-            projected_values = []
-            
-            for i in range(1, periods_ahead + 1):
-                future_x = last_x + i
-                projected_value = slope * future_x + intercept
-                projected_values.append({
-                    'period': i,
-                    'projected_value': projected_value
-                })
+            future_x = np.arange(n, n + periods_ahead)
+            projected_values = [
+                {'period': i, 'projected_value': float(value)}
+                for i, value in enumerate(slope * future_x + intercept, start=1)
+            ]
             
             # Determinar direção da tendência
             if abs(slope) < 0.1:
@@ -576,9 +816,9 @@ class HistoricalDataComparator:
                 trend_direction = 'decreasing'
             
             # Calcular confiança baseada na variabilidade
-            variance = statistics.variance(values) if len(values) > 1 else 0
-            mean_value = statistics.mean(values)
-            cv = (variance ** 0.5) / mean_value if mean_value > 0 else 1
+            std_dev = values.std(ddof=1)
+            mean_value = values.mean()
+            cv = std_dev / mean_value if mean_value > 0 else 1
             
             if cv < 0.1:
                 confidence = 'high'
@@ -592,7 +832,7 @@ class HistoricalDataComparator:
                 'confidence': confidence,
                 'trend_direction': trend_direction,
                 'slope': slope,
-                'data_points_used': len(values)
+                'data_points_used': n
             })
             
         except Exception as e:
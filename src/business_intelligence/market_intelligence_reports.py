@@ -9,15 +9,130 @@ Este módulo gera relatórios executivos abrangentes:
 - Relatórios personalizados por perfil
 """
 
+import atexit
+import copy
+import heapq
 import json
 import os
+import re
+import time
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
-import statistics
 
+import numpy as np
+import pandas as pd
 
-@dataclass
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Intervalo mínimo (segundos) entre gravações dos dados de relatórios
+REPORTS_SAVE_INTERVAL = 30.0
+
+# Regras de alerta do dashboard executivo: (indicador, condição, alerta); a
+# mensagem é formatada com o valor do indicador
+_MARKET_ALERT_RULES = (
+    ('market_temperature', lambda value: value == 'hot', {
+        'type': 'opportunity',
+        'severity': 'high',
+        'message': 'Mercado aquecido: Alta velocidade de postagem de vagas',
+        'action': 'Considere acelerar processos de recrutamento'
+    }),
+    ('remote_work_percentage', lambda value: value > 30, {
+        'type': 'trend',
+        'severity': 'medium',
+        'message': 'Alto índice de trabalho remoto: {value:.1f}%',
+        'action': 'Considere políticas de trabalho flexível'
+    }),
+    ('avg_salary', lambda value: value > 8000, {
+        'type': 'market',
+        'severity': 'medium',
+        'message': 'Salários acima da média: R$ {value:,.2f}',
+        'action': 'Mercado competitivo em salários'
+    }),
+)
+
+
+def _json_default(obj: Any) -> Any:
+    """Converte tipos não nativos do JSON (datas e escalares numpy)"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Tipo não serializável em JSON: {type(obj).__name__}")
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serializa em JSON UTF-8 indentado (orjson quando disponível)"""
+    if HAS_ORJSON:
+        return orjson.dumps(
+            obj, default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """Desserializa JSON (bytes)"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _keyword_regex(keyword: str) -> str:
+    """
+    Regex de uma palavra-chave, casada por palavra e não por substring
+    
+    Siglas curtas (ti, rh, pj, clt, dev) só casam como palavra inteira, para
+    não aparecerem dentro de outras ("ti" em "marketing"); as demais casam no
+    início de palavra, aceitando flexões ("desenvolvedora", "vendedores").
+    """
+    escaped = re.escape(keyword)
+    return rf'\b{escaped}\b' if len(keyword) <= 3 else rf'\b{escaped}'
+
+
+def _keywords_pattern(keywords: List[str]) -> re.Pattern:
+    """Regex que encontra qualquer uma das palavras-chave"""
+    return re.compile('|'.join(_keyword_regex(keyword) for keyword in keywords))
+
+
+def _first_category_pattern(categories: Dict[str, List[str]]) -> re.Pattern:
+    """
+    Regex que identifica a primeira categoria (na ordem do dicionário) com
+    alguma palavra-chave no texto
+    
+    As alternativas são testadas na posição 0, na ordem, e o grupo que casou
+    (lastgroup) é o nome da categoria; o texto é percorrido em C, sem laços
+    Python por palavra-chave. A âncora \\A garante a semântica de match
+    também em str.extract (que usa search): sem ela, textos sem palavra-chave
+    repetiriam os lookaheads em cada posição (custo quadrático).
+    """
+    return re.compile(
+        r'\A(?:' + '|'.join(
+            r'(?=.*(?:' + '|'.join(_keyword_regex(keyword) for keyword in keywords) + r'))(?P<' + category + '>)'
+            for category, keywords in categories.items()
+        ) + ')',
+        re.DOTALL
+    )
+
+
+def _first_category_codes(texts: pd.Series, pattern: re.Pattern) -> np.ndarray:
+    """
+    Posição (na ordem de prioridade) da categoria que casou em cada texto
+    
+    Textos sem categoria recebem o número de categorias, então o mínimo entre
+    dois campos é a categoria vencedora considerando ambos.
+    """
+    matched = texts.str.extract(pattern).notna().to_numpy()
+    return np.where(matched.any(axis=1), matched.argmax(axis=1), matched.shape[1])
+
+
+@dataclass(frozen=True, slots=True)
 class MarketInsight:
     """Representa um insight de mercado"""
     title: str
@@ -29,6 +144,28 @@ class MarketInsight:
     confidence_score: float  # 0-100
 
 
+@dataclass(frozen=True, slots=True)
+class DashboardView:
+    """Indicadores do dashboard usados por alertas e recomendações, lidos uma vez"""
+    market_temperature: str
+    remote_work_percentage: float
+    avg_salary: float
+    emerging_skills: List[Dict]
+    emerging_markets: List[Dict]
+    
+    @classmethod
+    def from_dashboard(cls, dashboard: Dict) -> 'DashboardView':
+        overview = dashboard.get('market_overview', {})
+        trends = dashboard.get('trends', {})
+        return cls(
+            market_temperature=overview.get('market_temperature', 'neutral'),
+            remote_work_percentage=overview.get('remote_work_percentage', 0),
+            avg_salary=dashboard.get('key_metrics', {}).get('avg_salary', 0),
+            emerging_skills=trends.get('emerging_skills', []),
+            emerging_markets=trends.get('regional_trends', {}).get('emerging_markets', [])
+        )
+
+
 class MarketIntelligenceReports:
     """
     Gerador de relatórios de inteligência de mercado
@@ -41,6 +178,51 @@ class MarketIntelligenceReports:
     - Alertas de mercado
     """
     
+    # Campos das vagas usados nos relatórios (frame colunar)
+    _JOB_COLUMNS = ['titulo', 'descricao', 'localizacao', 'empresa', 'data_coleta']
+    
+    # Campos lidos por analyze_job_salary (chave do cache de análises salariais)
+    _SALARY_FIELDS = ('salario', 'descricao', 'titulo', 'localizacao', 'link', 'fonte_url', 'empresa')
+    _SALARY_CACHE_SIZE = 8192
+    
+    # Dashboards recentes reaproveitados para as mesmas vagas no mesmo minuto
+    _DASHBOARD_CACHE_SIZE = 16
+    _DASHBOARD_CACHE_SECONDS = 60
+    
+    # Setores dominantes (baseado em títulos), em ordem de prioridade
+    _SECTOR_KEYWORDS = {
+        'tecnologia': ['desenvolvedor', 'programador', 'tech', 'software', 'ti'],
+        'vendas': ['vendedor', 'vendas', 'comercial'],
+        'marketing': ['marketing', 'digital', 'social media'],
+        'recursos_humanos': ['rh', 'recursos humanos', 'pessoas'],
+        'financeiro': ['financeiro', 'contabil', 'contador'],
+        'saude': ['enfermeiro', 'medico', 'saude', 'hospital']
+    }
+    _SECTOR_RE = _first_category_pattern(_SECTOR_KEYWORDS)
+    
+    # Palavras-chave dos relatórios setoriais
+    _REPORT_SECTOR_KEYWORDS = {
+        'tecnologia': ['desenvolvedor', 'programador', 'tech', 'software', 'ti', 'dev'],
+        'vendas': ['vendedor', 'vendas', 'comercial'],
+        'marketing': ['marketing', 'digital', 'social media'],
+        'financeiro': ['financeiro', 'contabil', 'contador', 'financas']
+    }
+    _REPORT_SECTOR_RES = {
+        sector: _keywords_pattern(keywords) for sector, keywords in _REPORT_SECTOR_KEYWORDS.items()
+    }
+    
+    # Tipos de trabalho, em ordem de prioridade
+    _WORK_TYPE_KEYWORDS = {
+        'clt': ['clt', 'efetivo'],
+        'pj': ['pj', 'pessoa juridica', 'freelancer'],
+        'estagio': ['estagio', 'trainee'],
+        'temporario': ['temporario', 'contrato']
+    }
+    _WORK_TYPE_RE = _first_category_pattern(_WORK_TYPE_KEYWORDS)
+    
+    # Termos de trabalho remoto na localização
+    _REMOTE_RE = _keywords_pattern(['remoto', 'home office', 'hibrido'])
+    
     def __init__(self, data_file: str = "data/business_intelligence/market_reports.json"):
         self.data_file = data_file
         self.data_dir = os.path.dirname(data_file)
@@ -51,8 +233,33 @@ class MarketIntelligenceReports:
         # Carregar dados de relatórios
         self.reports_data = self._load_reports_data()
         
-        # Inicializar analisadores
-        self._initialize_analyzers()
+        # Gravações agrupadas: alterações marcam os dados como pendentes e o
+        # arquivo é regravado no máximo a cada REPORTS_SAVE_INTERVAL (e na saída)
+        self._dirty = False
+        self._last_save: Optional[float] = None
+        atexit.register(self.flush)
+        
+        # Extrações salariais por conteúdo da vaga: dashboards sucessivos sobre
+        # vagas repetidas não reprocessam o texto do salário
+        self._salary_cache: Dict[Tuple, Optional[Dict]] = {}
+        
+        # Dashboards executivos por conteúdo das vagas e intervalo de tempo (ver
+        # generate_executive_dashboard); as listas dos chamadores não são retidas
+        self._dashboard_cache: Dict[Tuple[int, int, int], Dict] = {}
+        
+        # Analisadores são importados no primeiro uso (ver propriedade analyzers)
+        self._analyzers: Optional[Dict[str, Any]] = None
+    
+    @property
+    def analyzers(self) -> Dict[str, Any]:
+        """Analisadores de BI, inicializados no primeiro acesso"""
+        if self._analyzers is None:
+            self._initialize_analyzers()
+        return self._analyzers
+    
+    @analyzers.setter
+    def analyzers(self, analyzers: Dict[str, Any]):
+        self._analyzers = analyzers
     
     def _initialize_analyzers(self):
         """Inicializa os analisadores de BI"""
@@ -76,8 +283,8 @@ class MarketIntelligenceReports:
         """Carrega dados históricos de relatórios"""
         if os.path.exists(self.data_file):
             try:
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(self.data_file, 'rb') as f:
+                    return _loads(f.read())
             except:
                 pass
         
@@ -96,11 +303,24 @@ class MarketIntelligenceReports:
     def _save_reports_data(self):
         """Salva dados de relatórios"""
         try:
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(self.reports_data, f, indent=2, ensure_ascii=False)
+            with open(self.data_file, 'wb') as f:
+                f.write(_dumps(self.reports_data))
+            self._dirty = False
+            self._last_save = time.monotonic()
         except Exception as e:
             print(f"Erro ao salvar dados de relatórios: {e}")
     
+    def _mark_dirty(self):
+        """Marca os dados como alterados e grava se o intervalo mínimo já passou"""
+        self._dirty = True
+        if self._last_save is None or time.monotonic() - self._last_save >= REPORTS_SAVE_INTERVAL:
+            self._save_reports_data()
+    
+    def flush(self):
+        """Grava em disco as alterações pendentes dos dados de relatórios"""
+        if self._dirty:
+            self._save_reports_data()
+    
     def generate_executive_dashboard(self, jobs: List[Dict]) -> Dict:
         """
         Gera dashboard executivo com principais KPIs
@@ -111,6 +331,23 @@ class MarketIntelligenceReports:
         Returns:
             Dashboard com métricas executivas
         """
+        # Mesmas vagas (por conteúdo) no mesmo intervalo de tempo: devolver cópia
+        # do dashboard já gerado. As análises salariais continuam registradas no
+        # histórico do analisador a cada dashboard, como sem o cache.
+        cache_key = None
+        if jobs:
+            cache_key = self._dashboard_cache_key(jobs)
+            cached = self._dashboard_cache.get(cache_key)
+            if cached is not None:
+                if 'salary' in self.analyzers:
+                    for job in jobs:
+                        self._analyze_job_salary(job)
+                
+                stats = self.reports_data.setdefault("statistics", {})
+                stats["dashboard_cache_hits"] = stats.get("dashboard_cache_hits", 0) + 1
+                self._mark_dirty()
+                return copy.deepcopy(cached)
+        
         dashboard = {
             'generation_date': datetime.now().isoformat(),
             'total_jobs_analyzed': len(jobs),
@@ -125,28 +362,92 @@ class MarketIntelligenceReports:
             dashboard['market_overview']['status'] = 'Dados insuficientes'
             return dashboard
         
+        # Frame colunar montado uma vez e compartilhado pelas análises
+        frame = self._jobs_to_frame(jobs)
+        
         # Visão geral do mercado
-        dashboard['market_overview'] = self._generate_market_overview(jobs)
+        dashboard['market_overview'] = self._generate_market_overview(jobs, frame)
         
         # Métricas-chave
-        dashboard['key_metrics'] = self._calculate_key_metrics(jobs)
+        dashboard['key_metrics'] = self._calculate_key_metrics(jobs, frame)
         
         # Análise de tendências
         dashboard['trends'] = self._analyze_market_trends(jobs)
         
+        # Indicadores compartilhados por alertas e recomendações
+        view = DashboardView.from_dashboard(dashboard)
+        
         # Alertas automáticos
-        dashboard['alerts'] = self._generate_market_alerts(dashboard)
+        dashboard['alerts'] = self._generate_market_alerts(dashboard, view)
         
         # Recomendações executivas
-        dashboard['recommendations'] = self._generate_executive_recommendations(dashboard)
+        dashboard['recommendations'] = self._generate_executive_recommendations(dashboard, view)
         
         # Salvar dashboard
         self.reports_data["dashboards"]["executive"] = dashboard
-        self._save_reports_data()
+        self._mark_dirty()
+        
+        # Guardar cópia no cache, descartando as entradas mais antigas
+        self._dashboard_cache.pop(cache_key, None)
+        self._dashboard_cache[cache_key] = copy.deepcopy(dashboard)
+        while len(self._dashboard_cache) > self._DASHBOARD_CACHE_SIZE:
+            del self._dashboard_cache[next(iter(self._dashboard_cache))]
         
         return dashboard
     
-    def _generate_market_overview(self, jobs: List[Dict]) -> Dict:
+    def _dashboard_cache_key(self, jobs: List[Dict]) -> Tuple[int, int, int]:
+        """
+        Chave do cache de dashboards: impressão digital do conteúdo das vagas
+        
+        Strings têm o hash memorizado pelo Python, então vagas repetidas custam
+        pouco; outros valores (listas de tags, números) entram pelo repr.
+        """
+        fingerprint = hash(tuple(
+            tuple((key, value if isinstance(value, str) else repr(value)) for key, value in job.items())
+            for job in jobs
+        ))
+        return (fingerprint, len(jobs), int(time.time() // self._DASHBOARD_CACHE_SECONDS))
+    
+    def _analyze_job_salary(self, job: Dict) -> Optional[Dict]:
+        """
+        Análise salarial de uma vaga, registrada no histórico do analisador
+        
+        Só a extração e a classificação (puras) são memorizadas pelos campos
+        que o analisador lê; o registro no histórico acontece a cada chamada,
+        como em analyze_job_salary.
+        """
+        analyzer = self.analyzers['salary']
+        key = tuple(job.get(field) for field in self._SALARY_FIELDS)
+        try:
+            analysis = self._salary_cache[key]
+        except KeyError:
+            analysis = self._salary_cache[key] = analyzer.extract_job_salary(job)
+        except TypeError:
+            # Campo não hashable: analisar sem cache
+            return analyzer.analyze_job_salary(job)
+        
+        # Descartar as entradas mais antigas
+        if len(self._salary_cache) > self._SALARY_CACHE_SIZE:
+            del self._salary_cache[next(iter(self._salary_cache))]
+        
+        if analysis is None:
+            return None
+        return analyzer.record_salary_analysis(analysis)
+    
+    def _jobs_to_frame(self, jobs: List[Dict]) -> pd.DataFrame:
+        """
+        Converte a lista de vagas, em uma passada, no frame colunar usado pelos relatórios
+        
+        Título, descrição e localização já ficam em minúsculas, então cada campo
+        é normalizado uma única vez por dashboard.
+        """
+        frame = pd.DataFrame.from_records(jobs, columns=self._JOB_COLUMNS).fillna('').astype(str)
+        for column in ('titulo', 'descricao', 'localizacao'):
+            frame[column] = frame[column].str.lower()
+        return frame
+    
+    def _generate_market_overview(self, jobs: List[Dict],
+                                  frame: Optional[pd.DataFrame] = None) -> Dict:
         """Gera visão geral do mercado"""
         overview = {
             'market_size': len(jobs),
@@ -158,17 +459,16 @@ class MarketIntelligenceReports:
         }
         
         try:
-            # Velocidade de postagem (jobs dos últimos 7 dias)
-            recent_jobs = 0
-            week_ago = datetime.now() - timedelta(days=7)
+            if frame is None:
+                frame = self._jobs_to_frame(jobs)
             
-            for job in jobs:
-                try:
-                    job_date = datetime.fromisoformat(job.get('data_coleta', '').replace('Z', '+00:00'))
-                    if job_date >= week_ago:
-                        recent_jobs += 1
-                except:
-                    continue
+            # Velocidade de postagem (jobs dos últimos 7 dias); datas convertidas de
+            # uma vez (inválidas viram NaT), sem fuso tratadas como UTC, assim como o corte
+            collected_at = pd.to_datetime(
+                frame['data_coleta'], errors='coerce', format='ISO8601', utc=True
+            )
+            week_ago = pd.Timestamp(datetime.now() - timedelta(days=7), tz='UTC')
+            recent_jobs = int((collected_at >= week_ago).sum())
             
             overview['job_posting_velocity'] = recent_jobs
             
@@ -180,30 +480,15 @@ class MarketIntelligenceReports:
             else:
                 overview['market_temperature'] = 'cool'
             
-            # Setores dominantes (baseado em títulos)
-            sector_keywords = {
-                'tecnologia': ['desenvolvedor', 'programador', 'tech', 'software', 'ti'],
-                'vendas': ['vendedor', 'vendas', 'comercial'],
-                'marketing': ['marketing', 'digital', 'social media'],
-                'recursos_humanos': ['rh', 'recursos humanos', 'pessoas'],
-                'financeiro': ['financeiro', 'contabil', 'contador'],
-                'saude': ['enfermeiro', 'medico', 'saude', 'hospital']
-            }
-            
-            sector_counts = {sector: 0 for sector in sector_keywords}
-            
-            for job in jobs:
-                titulo = job.get('titulo', '').lower()
-                for sector, keywords in sector_keywords.items():
-                    if any(keyword in titulo for keyword in keywords):
-                        sector_counts[sector] += 1
-                        break
+            # Setores dominantes (baseado em títulos): uma coluna por setor, preenchida
+            # só no setor de maior prioridade que casou
+            sector_counts = frame['titulo'].str.extract(self._SECTOR_RE).notna().sum()
             
             # Top 3 setores
-            sorted_sectors = sorted(sector_counts.items(), key=lambda x: x[1], reverse=True)
+            top_sectors = sector_counts.nlargest(3)
             overview['dominant_sectors'] = [
-                {'sector': sector, 'job_count': count, 'percentage': (count/len(jobs))*100}
-                for sector, count in sorted_sectors[:3] if count > 0
+                {'sector': sector, 'job_count': int(count), 'percentage': (count/len(jobs))*100}
+                for sector, count in top_sectors.items() if count > 0
             ]
             
             # Distribuição geográfica
@@ -214,11 +499,7 @@ class MarketIntelligenceReports:
                 }
             
             # Percentual de trabalho remoto
-            remote_count = 0
-            for job in jobs:
-                location = job.get('localizacao', '').lower()
-                if any(term in location for term in ['remoto', 'home office', 'hibrido']):
-                    remote_count += 1
+            remote_count = int(frame['localizacao'].str.contains(self._REMOTE_RE).sum())
             
             overview['remote_work_percentage'] = (remote_count / len(jobs)) * 100
             
@@ -227,7 +508,8 @@ class MarketIntelligenceReports:
         
         return overview
     
-    def _calculate_key_metrics(self, jobs: List[Dict]) -> Dict:
+    def _calculate_key_metrics(self, jobs: List[Dict],
+                               frame: Optional[pd.DataFrame] = None) -> Dict:
         """Calcula métricas-chave do mercado"""
         metrics = {
             'avg_salary': 0,
@@ -239,65 +521,60 @@ class MarketIntelligenceReports:
         }
         
         try:
+            if frame is None:
+                frame = self._jobs_to_frame(jobs)
+            
             # Análise salarial
             if 'salary' in self.analyzers:
-                salaries = []
-                for job in jobs:
-                    salary_analysis = self.analyzers['salary'].analyze_job_salary(job)
-                    if salary_analysis and salary_analysis.get('avg_salary'):
-                        salaries.append(salary_analysis['avg_salary'])
+                analyses = (self._analyze_job_salary(job) for job in jobs)
+                salaries = np.fromiter(
+                    (analysis['salary_avg'] for analysis in analyses
+                     if analysis and analysis.get('salary_avg')),
+                    dtype=np.float64
+                )
                 
-                if salaries:
-                    metrics['avg_salary'] = statistics.mean(salaries)
+                if salaries.size:
+                    metrics['avg_salary'] = float(salaries.mean())
                     metrics['salary_range'] = {
-                        'min': min(salaries),
-                        'max': max(salaries)
+                        'min': float(salaries.min()),
+                        'max': float(salaries.max())
                     }
             
             # Top skills
             if 'skills' in self.analyzers:
                 skills_data = self.analyzers['skills'].analyze_skills_demand(jobs)
-                top_skills = sorted(
-                    [(skill, data.frequency) for skill, data in skills_data.items()],
-                    key=lambda x: x[1], reverse=True
-                )[:5]
+                top_skills = heapq.nlargest(
+                    5, ((skill, data.frequency) for skill, data in skills_data.items()),
+                    key=lambda x: x[1]
+                )
                 metrics['top_skills'] = [
                     {'skill': skill, 'frequency': freq} for skill, freq in top_skills
                 ]
             
             # Top empresas
-            company_counts = {}
-            for job in jobs:
-                company = job.get('empresa', '').strip()
-                if company and company.lower() != 'não informado':
-                    company_counts[company] = company_counts.get(company, 0) + 1
+            companies = frame['empresa'].str.strip()
+            companies = companies[(companies != '') & (companies.str.lower() != 'não informado')]
+            company_counts = Counter(companies)
             
-            top_companies = sorted(company_counts.items(), key=lambda x: x[1], reverse=True)[:5]
             metrics['top_companies'] = [
-                {'company': company, 'job_count': count} for company, count in top_companies
+                {'company': company, 'job_count': count}
+                for company, count in company_counts.most_common(5)
             ]
             
-            # Tipos de trabalho
-            work_type_keywords = {
-                'clt': ['clt', 'efetivo'],
-                'pj': ['pj', 'pessoa juridica', 'freelancer'],
-                'estagio': ['estagio', 'trainee'],
-                'temporario': ['temporario', 'contrato']
-            }
-            
-            type_counts = {wtype: 0 for wtype in work_type_keywords}
-            for job in jobs:
-                description = f"{job.get('titulo', '')} {job.get('descricao', '')}".lower()
-                for wtype, keywords in work_type_keywords.items():
-                    if any(keyword in description for keyword in keywords):
-                        type_counts[wtype] += 1
-                        break
+            # Tipos de trabalho: título e descrição avaliados separadamente (sem montar
+            # o texto concatenado de cada vaga); vence a categoria de maior prioridade
+            work_types = list(self._WORK_TYPE_KEYWORDS)
+            type_codes = np.minimum(
+                _first_category_codes(frame['titulo'], self._WORK_TYPE_RE),
+                _first_category_codes(frame['descricao'], self._WORK_TYPE_RE)
+            )
+            type_counts = np.bincount(type_codes, minlength=len(work_types) + 1)[:len(work_types)]
             
-            total_typed = sum(type_counts.values())
+            total_typed = int(type_counts.sum())
             if total_typed > 0:
                 metrics['job_types'] = {
-                    wtype: (count / total_typed) * 100 
-                    for wtype, count in type_counts.items() if count > 0
+                    wtype: (int(count) / total_typed) * 100 
+                    for wtype, count in zip(work_types, type_counts) if count > 0
                 }
             
         except Exception as e:
@@ -339,53 +616,38 @@ class MarketIntelligenceReports:
         
         return trends
     
-    def _generate_market_alerts(self, dashboard: Dict) -> List[Dict]:
+    def _generate_market_alerts(self, dashboard: Dict,
+                                view: Optional[DashboardView] = None) -> List[Dict]:
         """Gera alertas automáticos baseados no dashboard"""
         alerts = []
         
         try:
-            # Alerta de mercado quente
-            market_temp = dashboard['market_overview'].get('market_temperature', 'neutral')
-            if market_temp == 'hot':
-                alerts.append({
-                    'type': 'opportunity',
-                    'severity': 'high',
-                    'message': 'Mercado aquecido: Alta velocidade de postagem de vagas',
-                    'action': 'Considere acelerar processos de recrutamento'
-                })
-            
-            # Alerta de trabalho remoto
-            remote_pct = dashboard['market_overview'].get('remote_work_percentage', 0)
-            if remote_pct > 30:
-                alerts.append({
-                    'type': 'trend',
-                    'severity': 'medium',
-                    'message': f'Alto índice de trabalho remoto: {remote_pct:.1f}%',
-                    'action': 'Considere políticas de trabalho flexível'
-                })
+            if view is None:
+                view = DashboardView.from_dashboard(dashboard)
             
-            # Alerta de salários
-            avg_salary = dashboard['key_metrics'].get('avg_salary', 0)
-            if avg_salary > 8000:
-                alerts.append({
-                    'type': 'market',
-                    'severity': 'medium',
-                    'message': f'Salários acima da média: R$ {avg_salary:,.2f}',
-                    'action': 'Mercado competitivo em salários'
-                })
+            for indicator, condition, template in _MARKET_ALERT_RULES:
+                value = getattr(view, indicator)
+                if condition(value):
+                    alert = dict(template)
+                    alert['message'] = template['message'].format(value=value)
+                    alerts.append(alert)
             
         except Exception as e:
             print(f"Erro ao gerar alertas: {e}")
         
         return alerts
     
-    def _generate_executive_recommendations(self, dashboard: Dict) -> List[str]:
+    def _generate_executive_recommendations(self, dashboard: Dict,
+                                            view: Optional[DashboardView] = None) -> List[str]:
         """Gera recomendações executivas"""
         recommendations = []
         
         try:
+            if view is None:
+                view = DashboardView.from_dashboard(dashboard)
+            
             # Recomendações baseadas em temperatura do mercado
-            market_temp = dashboard['market_overview'].get('market_temperature', 'neutral')
+            market_temp = view.market_temperature
             if market_temp == 'hot':
                 recommendations.append(
                     "Mercado aquecido: Acelere processos de contratação para aproveitar alta demanda"
@@ -396,7 +658,7 @@ class MarketIntelligenceReports:
                 )
             
             # Recomendações de skills
-            emerging_skills = dashboard['trends'].get('emerging_skills', [])
+            emerging_skills = view.emerging_skills
             if emerging_skills:
                 top_skill = emerging_skills[0]['skill']
                 recommendations.append(
@@ -404,8 +666,7 @@ class MarketIntelligenceReports:
                 )
             
             # Recomendações regionais
-            regional_trends = dashboard['trends'].get('regional_trends', {})
-            emerging_markets = regional_trends.get('emerging_markets', [])
+            emerging_markets = view.emerging_markets
             if emerging_markets:
                 market = emerging_markets[0]['region']
                 recommendations.append(
@@ -413,8 +674,7 @@ class MarketIntelligenceReports:
                 )
             
             # Recomendação de trabalho remoto
-            remote_pct = dashboard['market_overview'].get('remote_work_percentage', 0)
-            if remote_pct > 25:
+            if view.remote_work_percentage > 25:
                 recommendations.append(
                     "Considere expandir opções de trabalho remoto para competir melhor"
                 )
@@ -439,20 +699,10 @@ class MarketIntelligenceReports:
         }
         
         # Filtrar vagas do setor
-        sector_jobs = []
-        sector_keywords = {
-            'tecnologia': ['desenvolvedor', 'programador', 'tech', 'software', 'ti', 'dev'],
-            'vendas': ['vendedor', 'vendas', 'comercial'],
-            'marketing': ['marketing', 'digital', 'social media'],
-            'financeiro': ['financeiro', 'contabil', 'contador', 'financas']
-        }
-        
-        keywords = sector_keywords.get(sector.lower(), [sector.lower()])
+        sector_re = self._REPORT_SECTOR_RES.get(sector.lower()) or _keywords_pattern([sector.lower()])
+        sector_search = sector_re.search
         
-        for job in jobs:
-            titulo = job.get('titulo', '').lower()
-            if any(keyword in titulo for keyword in keywords):
-                sector_jobs.append(job)
+        sector_jobs = [job for job in jobs if sector_search(job.get('titulo', '').lower())]
         
         report['job_count'] = len(sector_jobs)
         report['market_share'] = (len(sector_jobs) / len(jobs)) * 100 if jobs else 0
@@ -465,10 +715,10 @@ class MarketIntelligenceReports:
             
             if 'skills' in self.analyzers:
                 skills_data = self.analyzers['skills'].analyze_skills_demand(sector_jobs)
-                top_skills = sorted(
-                    [(skill, data.frequency) for skill, data in skills_data.items()],
-                    key=lambda x: x[1], reverse=True
-                )[:5]
+                top_skills = heapq.nlargest(
+                    5, ((skill, data.frequency) for skill, data in skills_data.items()),
+                    key=lambda x: x[1]
+                )
                 report['required_skills'] = [skill for skill, freq in top_skills]
         
         return report
@@ -483,8 +733,15 @@ class MarketIntelligenceReports:
             'recommendations': []
         }
         
+        # Nomes de empresa em minúsculas uma única vez; cada empresa alvo vira uma
+        # busca vetorizada sobre a coluna
+        company_names = pd.Series(
+            [job.get('empresa', '') for job in jobs], dtype=object
+        ).fillna('').astype(str).str.lower()
+        
         for company in target_companies:
-            company_jobs = [job for job in jobs if company.lower() in job.get('empresa', '').lower()]
+            matches = company_names.str.contains(company.lower(), regex=False).to_numpy()
+            company_jobs = [jobs[i] for i in np.flatnonzero(matches)]
             
             if company_jobs:
                 # Métricas da empresa
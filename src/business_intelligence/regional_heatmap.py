@@ -8,13 +8,118 @@ Este módulo gera mapas de calor para visualizar:
 - Análise de competição regional
 """
 
+import atexit
 import json
 import os
+import re
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
-from collections import defaultdict, Counter
 import statistics
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    from .salary_trend_analyzer import salary_trend_analyzer
+except ImportError:
+    salary_trend_analyzer = None
+
+
+# Intervalo mínimo (segundos) entre gravações dos dados regionais
+REGIONAL_SAVE_INTERVAL = 30.0
+
+
+def _json_default(obj: Any) -> Any:
+    """Converte tipos não nativos do JSON (datas e escalares numpy)"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Tipo não serializável em JSON: {type(obj).__name__}")
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serializa em JSON UTF-8 indentado (orjson quando disponível)"""
+    if HAS_ORJSON:
+        return orjson.dumps(
+            obj, default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """Desserializa JSON (bytes)"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _city_regex(city: str) -> str:
+    """
+    Regex de uma cidade ou sigla
+    
+    Siglas curtas (sp, rj, mg, df, abc) só casam como palavra inteira, para não
+    aparecerem dentro de outros nomes ("sp" em "espírito santo"); nomes de
+    cidades continuam casando como substring.
+    """
+    escaped = re.escape(city)
+    return rf'\b{escaped}\b' if len(city) <= 3 else escaped
+
+
+def _first_city_pattern(city_to_region: Dict[str, str]) -> re.Pattern:
+    """
+    Regex que identifica a primeira cidade (na ordem do dicionário) presente
+    no texto
+    
+    As alternativas são testadas na posição 0, na ordem; o grupo vazio que
+    casou (lastindex) indica a cidade, e o texto é percorrido em C, sem laço
+    Python por cidade. A âncora \\A mantém a semântica de match também em
+    str.extract, evitando repetir os lookaheads em cada posição.
+    """
+    return re.compile(
+        r'\A(?:' + '|'.join(rf'(?=.*?{_city_regex(city)})()' for city in city_to_region) + ')',
+        re.DOTALL
+    )
+
+
+@lru_cache(maxsize=4096)
+def _first_city_index(location: str, pattern: re.Pattern) -> int:
+    """
+    Índice da primeira cidade presente na localização (-1 se nenhuma)
+    
+    Memorizado porque as vagas repetem as mesmas poucas localizações.
+    """
+    match = pattern.match(location.lower().strip())
+    return match.lastindex - 1 if match else -1
+
+
+def _top_labels(labels: np.ndarray, counts: np.ndarray, k: int = 5) -> List[str]:
+    """
+    Os k rótulos mais frequentes, como Counter.most_common(k)
+    
+    Uma seleção parcial (np.partition) encontra o limiar da k-ésima contagem
+    sem ordenar tudo; só os candidatos são ordenados, de forma estável, para
+    que empates mantenham a ordem de aparição.
+    """
+    if len(counts) > k:
+        threshold = -np.partition(-counts, k - 1)[k - 1]
+        candidates = np.flatnonzero(counts >= threshold)
+    else:
+        candidates = np.arange(len(counts))
+    
+    order = candidates[np.argsort(-counts[candidates], kind='stable')][:k]
+    return labels[order].tolist()
 
 
 @dataclass
@@ -42,6 +147,63 @@ class RegionalHeatmap:
     - Detecção de mercados emergentes
     """
     
+    _JOB_COLUMNS = ['titulo', 'empresa', 'localizacao', 'salario', 'data_coleta']
+    
+    # Faixas do score de oportunidade: limites (valores acima de cada um) e pontos
+    _JOB_COUNT_BINS = np.array([5, 10, 20, 50])
+    _JOB_COUNT_POINTS = np.array([0, 10, 20, 30, 40])
+    _SALARY_BINS = np.array([2000, 4000, 6000, 8000])
+    _SALARY_POINTS = np.array([0, 10, 15, 20, 25])
+    _COMPETITION_POINTS = {'low': 20, 'medium': 10, 'high': 0}
+    _GROWTH_POINTS = {'growing': 15, 'stable': 5, 'declining': 0}
+    
+    # Mapeamento de regiões e suas coordenadas (para visualização); somente
+    # leitura e compartilhado entre instâncias
+    region_coordinates = MappingProxyType({
+        'São Paulo': {'lat': -23.5505, 'lon': -46.6333, 'population': 12400000},
+        'Rio de Janeiro': {'lat': -22.9068, 'lon': -43.1729, 'population': 6748000},
+        'Brasília': {'lat': -15.8267, 'lon': -47.9218, 'population': 3094325},
+        'Minas Gerais': {'lat': -19.9167, 'lon': -43.9345, 'population': 21411923},
+        'Remoto': {'lat': 0, 'lon': 0, 'population': 0},  # Virtual
+        'Híbrido': {'lat': 0, 'lon': 0, 'population': 0},  # Virtual
+        'Outras': {'lat': -15.7801, 'lon': -47.9292, 'population': 5000000}  # Centro do Brasil
+    })
+    
+    # Classificação de cidades por região
+    city_to_region = MappingProxyType({
+        # São Paulo
+        'sao paulo': 'São Paulo',
+        'sp': 'São Paulo',
+        'santos': 'São Paulo',
+        'campinas': 'São Paulo',
+        'abc': 'São Paulo',
+        
+        # Rio de Janeiro
+        'rio de janeiro': 'Rio de Janeiro',
+        'rj': 'Rio de Janeiro',
+        'niterói': 'Rio de Janeiro',
+        
+        # Minas Gerais
+        'belo horizonte': 'Minas Gerais',
+        'mg': 'Minas Gerais',
+        'uberlandia': 'Minas Gerais',
+        
+        # Brasília
+        'brasilia': 'Brasília',
+        'df': 'Brasília',
+        
+        # Modalidades
+        'home office': 'Remoto',
+        'remoto': 'Remoto',
+        'hibrido': 'Híbrido'
+    })
+    
+    # Regex única para a normalização de localizações e nomes das regiões por
+    # posição da cidade (a última posição é a categoria "Outras")
+    _region_pattern = _first_city_pattern(city_to_region)
+    _region_names = tuple(city_to_region.values())
+    _region_labels = np.array(_region_names + ('Outras',), dtype=object)
+    
     def __init__(self, data_file: str = "data/business_intelligence/regional_heatmap.json"):
         self.data_file = data_file
         self.data_dir = os.path.dirname(data_file)
@@ -52,52 +214,18 @@ class RegionalHeatmap:
         # Carregar dados regionais
         self.regional_data = self._load_regional_data()
         
-        # Mapeamento de regiões e suas coordenadas (para visualização)
-        self.region_coordinates = {
-            'São Paulo': {'lat': -23.5505, 'lon': -46.6333, 'population': 12400000},
-            'Rio de Janeiro': {'lat': -22.9068, 'lon': -43.1729, 'population': 6748000},
-            'Brasília': {'lat': -15.8267, 'lon': -47.9218, 'population': 3094325},
-            'Minas Gerais': {'lat': -19.9167, 'lon': -43.9345, 'population': 21411923},
-            'Remoto': {'lat': 0, 'lon': 0, 'population': 0},  # Virtual
-            'Híbrido': {'lat': 0, 'lon': 0, 'population': 0},  # Virtual
-            'Outras': {'lat': -15.7801, 'lon': -47.9292, 'population': 5000000}  # Centro do Brasil
-        }
-        
-        # Classificação de cidades por região
-        self.city_to_region = {
-            # São Paulo
-            'sao paulo': 'São Paulo',
-            'sp': 'São Paulo',
-            'santos': 'São Paulo',
-            'campinas': 'São Paulo',
-            'abc': 'São Paulo',
-            
-            # Rio de Janeiro
-            'rio de janeiro': 'Rio de Janeiro',
-            'rj': 'Rio de Janeiro',
-            'niterói': 'Rio de Janeiro',
-            
-            # Minas Gerais
-            'belo horizonte': 'Minas Gerais',
-            'mg': 'Minas Gerais',
-            'uberlandia': 'Minas Gerais',
-            
-            # Brasília
-            'brasilia': 'Brasília',
-            'df': 'Brasília',
-            
-            # Modalidades
-            'home office': 'Remoto',
-            'remoto': 'Remoto',
-            'hibrido': 'Híbrido'
-        }
+        # Gravações agrupadas: alterações marcam os dados como pendentes e o
+        # arquivo é regravado no máximo a cada REGIONAL_SAVE_INTERVAL (e na saída)
+        self._dirty = False
+        self._last_save: Optional[float] = None
+        atexit.register(self.flush)
     
     def _load_regional_data(self) -> Dict:
         """Carrega dados regionais históricos"""
         if os.path.exists(self.data_file):
             try:
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(self.data_file, 'rb') as f:
+                    return _loads(f.read())
             except:
                 pass
         
@@ -115,42 +243,113 @@ class RegionalHeatmap:
     def _save_regional_data(self):
         """Salva dados regionais"""
         try:
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(self.regional_data, f, indent=2, ensure_ascii=False)
+            with open(self.data_file, 'wb') as f:
+                f.write(_dumps(self.regional_data))
+            self._dirty = False
+            self._last_save = time.monotonic()
         except Exception as e:
             print(f"Erro ao salvar dados regionais: {e}")
     
+    def _mark_dirty(self):
+        """Marca os dados como alterados e grava se o intervalo mínimo já passou"""
+        self._dirty = True
+        if self._last_save is None or time.monotonic() - self._last_save >= REGIONAL_SAVE_INTERVAL:
+            self._save_regional_data()
+    
+    def flush(self):
+        """Grava em disco as alterações pendentes dos dados regionais"""
+        if self._dirty:
+            self._save_regional_data()
+    
     def normalize_region(self, location: str) -> str:
         """Normaliza localização para região padrão"""
         if not location:
             return 'Não especificado'
         
-        location_lower = location.lower().strip()
-        
         # Buscar correspondência direta
-        for city_key, region in self.city_to_region.items():
-            if city_key in location_lower:
-                return region
+        index = _first_city_index(location, self._region_pattern)
+        if index >= 0:
+            return self._region_names[index]
         
         # Se não encontrou, categorizar como "Outras"
         return 'Outras'
     
+    def normalize_region_series(self, locations: pd.Series) -> np.ndarray:
+        """Versão vetorizada de normalize_region para uma coluna inteira"""
+        raw = locations.fillna('').astype(str)
+        matched = raw.str.lower().str.strip().str.extract(self._region_pattern).notna().to_numpy()
+        
+        codes = np.where(matched.any(axis=1), matched.argmax(axis=1), len(self._region_names))
+        
+        normalized = self._region_labels[codes]
+        normalized[raw.eq('').to_numpy()] = 'Não especificado'
+        return normalized
+    
     def extract_salary_value(self, salary_text: str) -> Optional[float]:
         """Extração simples de valor salarial"""
         if not salary_text or salary_text.lower() in ['não informado', 'a combinar']:
             return None
         
         # Usar o analisador de salários se disponível
-        try:
-            from .salary_trend_analyzer import salary_trend_analyzer
+        if salary_trend_analyzer is not None:
             salary_range = salary_trend_analyzer.extract_salary_from_text(salary_text)
             if salary_range:
                 return (salary_range[0] + salary_range[1]) / 2
-        except:
-            pass
         
         return None
     
+    def extract_salary_series(self, salaries: pd.Series) -> np.ndarray:
+        """
+        Versão vetorizada de extract_salary_value para uma coluna inteira
+        
+        Aplica os padrões do analisador de salários, na mesma ordem, a todos os
+        textos de uma vez; cada linha recebe a média da primeira faixa válida
+        encontrada, ou NaN quando não há salário.
+        """
+        texts = salaries.fillna('').astype(str).str.lower().reset_index(drop=True)
+        values = np.full(len(texts), np.nan)
+        if salary_trend_analyzer is None or texts.empty:
+            return values
+        
+        pending = ~texts.isin(['', 'não informado', 'a combinar']).to_numpy()
+        scale = np.where(texts.str.contains('mil|k').to_numpy(), 1000.0, 1.0)
+        
+        for pattern in salary_trend_analyzer.salary_patterns:
+            if not pending.any():
+                break
+            
+            matches = texts[pending].str.extractall(pattern, flags=re.IGNORECASE)
+            if matches.empty:
+                continue
+            
+            rows = matches.index.get_level_values(0).to_numpy()
+            low = matches[0].str.replace(',', '.').astype(float).to_numpy() * scale[rows]
+            high = matches[1].replace('', np.nan).str.replace(',', '.').astype(float).to_numpy() * scale[rows]
+            high = np.where(np.isnan(high), low, high)
+            
+            # Primeira correspondência válida (R$ 1k - R$ 50k) de cada linha
+            valid = (low >= 1000) & (low <= 50000) & (high >= 1000) & (high <= 50000)
+            rows, low, high = rows[valid], low[valid], high[valid]
+            first = np.unique(rows, return_index=True)[1]
+            rows = rows[first]
+            
+            values[rows] = (low[first] + high[first]) / 2
+            pending[rows] = False
+        
+        return values
+    
+    def _jobs_to_frame(self, jobs: List[Dict]) -> pd.DataFrame:
+        """Converte a lista de vagas no frame colunar usado pela agregação regional"""
+        frame = pd.DataFrame.from_records(jobs, columns=self._JOB_COLUMNS)
+        
+        # Só vagas sem o campo recebem a data atual; None e datas inválidas
+        # viram NaT na conversão e ficam fora da análise de crescimento
+        now = datetime.now().isoformat()
+        frame['data_coleta'] = [job.get('data_coleta', now) for job in jobs]
+        for column in ('titulo', 'empresa', 'localizacao', 'salario'):
+            frame[column] = frame[column].fillna('').astype(str)
+        return frame
+    
     def analyze_jobs_by_region(self, jobs: List[Dict]) -> Dict[str, RegionalData]:
         """
         Analisa vagas e agrega dados por região
@@ -161,67 +360,75 @@ class RegionalHeatmap:
         Returns:
             Dicionário com dados regionais agregados
         """
-        regional_aggregates = defaultdict(lambda: {
-            'job_count': 0,
-            'salaries': [],
-            'positions': [],
-            'companies': [],
-            'timestamps': []
-        })
-        
-        # Processar cada vaga
-        for job in jobs:
-            region = self.normalize_region(job.get('localizacao', ''))
-            
-            # Agregar dados
-            regional_aggregates[region]['job_count'] += 1
-            regional_aggregates[region]['positions'].append(job.get('titulo', ''))
-            regional_aggregates[region]['companies'].append(job.get('empresa', ''))
-            regional_aggregates[region]['timestamps'].append(
-                job.get('data_coleta', datetime.now().isoformat())
-            )
-            
-            # Tentar extrair salário
-            salary = self.extract_salary_value(job.get('salario', ''))
-            if salary:
-                regional_aggregates[region]['salaries'].append(salary)
+        frame = self._jobs_to_frame(jobs)
+        
+        # Normalizar cada localização e cada texto salarial distinto uma única vez
+        location_codes, locations = pd.factorize(frame['localizacao'])
+        frame['region'] = self.normalize_region_series(pd.Series(locations))[location_codes]
+        salary_codes, salary_texts = pd.factorize(frame['salario'])
+        frame['salary'] = self.extract_salary_series(pd.Series(salary_texts))[salary_codes]
+        
+        # Datas de coleta convertidas uma única vez para toda a coluna
+        frame['collected_at'] = pd.to_datetime(
+            frame['data_coleta'], errors='coerce', format='ISO8601', utc=True
+        )
+        
+        # Agregar todas as regiões de uma vez, na ordem em que aparecem
+        grouped = frame.groupby('region', sort=False)
+        summary = grouped.agg(
+            job_count=('titulo', 'size'),
+            avg_salary=('salary', 'mean'),
+            salary_min=('salary', 'min'),
+            salary_max=('salary', 'max'),
+            unique_companies=('empresa', 'nunique')
+        )
+        timestamps = dict(tuple(grouped['collected_at']))
+        
+        # Top posições: contagens na ordem de aparição, seleção parcial por região
+        position_counts = frame.groupby(['region', 'titulo'], sort=False).size()
+        top_positions = {
+            region: _top_labels(counts.index.get_level_values('titulo').to_numpy(), counts.to_numpy())
+            for region, counts in position_counts.groupby(level='region', sort=False)
+        }
+        
+        # Tendência e competição por região; os scores saem todos de uma vez
+        summary['growth_trend'] = [
+            self._analyze_regional_growth(region, timestamps[region]) for region in summary.index
+        ]
+        summary['competition_level'] = [
+            self._calculate_competition_level(int(job_count), int(unique_companies))
+            for job_count, unique_companies in zip(summary['job_count'], summary['unique_companies'])
+        ]
+        summary['opportunity_score'] = self._score_vectorized(
+            summary['job_count'].to_numpy(),
+            summary['avg_salary'].fillna(0).to_numpy(),
+            summary['competition_level'].to_numpy(),
+            summary['growth_trend'].to_numpy()
+        )
         
         # Converter para objetos RegionalData
         regional_data = {}
         
-        for region, data in regional_aggregates.items():
-            # Calcular estatísticas salariais
-            if data['salaries']:
-                avg_salary = statistics.mean(data['salaries'])
-                salary_range = (min(data['salaries']), max(data['salaries']))
+        for row in summary.itertuples():
+            region = row.Index
+            
+            # Estatísticas salariais
+            if row.avg_salary == row.avg_salary:  # Não é NaN
+                avg_salary = float(row.avg_salary)
+                salary_range = (float(row.salary_min), float(row.salary_max))
             else:
                 avg_salary = 0
                 salary_range = (0, 0)
             
-            # Top posições
-            position_counts = Counter(data['positions'])
-            top_positions = [pos for pos, count in position_counts.most_common(5)]
-            
-            # Análise de tendência temporal
-            growth_trend = self._analyze_regional_growth(region, data['timestamps'])
-            
-            # Nível de competição
-            competition_level = self._calculate_competition_level(data['job_count'], len(set(data['companies'])))
-            
-            # Score de oportunidade
-            opportunity_score = self._calculate_opportunity_score(
-                data['job_count'], avg_salary, competition_level, growth_trend
-            )
-            
             regional_data[region] = RegionalData(
                 region=region,
-                job_count=data['job_count'],
+                job_count=int(row.job_count),
                 avg_salary=avg_salary,
                 salary_range=salary_range,
-                top_positions=top_positions,
-                growth_trend=growth_trend,
-                competition_level=competition_level,
-                opportunity_score=opportunity_score
+                top_positions=top_positions[region],
+                growth_trend=row.growth_trend,
+                competition_level=row.competition_level,
+                opportunity_score=int(row.opportunity_score)
             )
         
         # Salvar dados agregados
@@ -247,39 +454,28 @@ class RegionalHeatmap:
             "last_analysis": datetime.now().isoformat()
         }
         
-        self._save_regional_data()
+        self._mark_dirty()
         return regional_data
     
-    def _analyze_regional_growth(self, region: str, timestamps: List[str]) -> str:
+    def _analyze_regional_growth(self, region: str, timestamps) -> str:
         """Analisa tendência de crescimento da região"""
         if len(timestamps) < 10:  # Poucos dados
             return 'stable'
         
         try:
-            # Agrupar por dia
-            daily_counts = defaultdict(int)
-            for timestamp in timestamps:
-                try:
-                    dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                    day_key = dt.date().isoformat()
-                    daily_counts[day_key] += 1
-                except:
-                    continue
+            # Agrupar por dia (timestamps inválidos viram NaT e são ignorados)
+            days = pd.to_datetime(
+                pd.Series(timestamps), errors='coerce', format='ISO8601', utc=True
+            ).dt.floor('D')
+            daily_counts = days.value_counts().sort_index().to_numpy()
             
             if len(daily_counts) < 3:
                 return 'stable'
             
-            # Verificar tendência dos últimos dias
-            sorted_days = sorted(daily_counts.items())
-            recent_days = sorted_days[-7:]  # Últimos 7 dias
-            
-            if len(recent_days) < 3:
-                return 'stable'
-            
-            # Calcular tendência
-            counts = [count for day, count in recent_days]
-            first_half = statistics.mean(counts[:len(counts)//2])
-            second_half = statistics.mean(counts[len(counts)//2:])
+            # Verificar tendência dos últimos 7 dias
+            counts = daily_counts[-7:]
+            first_half = counts[:len(counts)//2].mean()
+            second_half = counts[len(counts)//2:].mean()
             
             if second_half > first_half * 1.2:
                 return 'growing'
@@ -309,45 +505,31 @@ class RegionalHeatmap:
     def _calculate_opportunity_score(self, job_count: int, avg_salary: float, 
                                    competition_level: str, growth_trend: str) -> float:
         """Calcula score de oportunidade (0-100)"""
-        score = 0
+        return int(self._score_vectorized(
+            np.array([job_count]), np.array([avg_salary]),
+            np.array([competition_level]), np.array([growth_trend])
+        )[0])
+    
+    def _score_vectorized(self, job_count: np.ndarray, avg_salary: np.ndarray,
+                          competition: np.ndarray, trend: np.ndarray) -> np.ndarray:
+        """
+        Score de oportunidade (0-100) de várias regiões de uma vez
         
+        As faixas de vagas e salário viram índices via searchsorted (limites
+        estritos, como os ">" da versão escalar) e os níveis de competição e
+        crescimento viram pontos por mapeamento, sem ramificações por região.
+        """
         # Base score por número de vagas (0-40 pontos)
-        if job_count > 50:
-            score += 40
-        elif job_count > 20:
-            score += 30
-        elif job_count > 10:
-            score += 20
-        elif job_count > 5:
-            score += 10
+        job_pts = self._JOB_COUNT_POINTS[np.searchsorted(self._JOB_COUNT_BINS, job_count, side='left')]
         
         # Bonus por salário (0-25 pontos)
-        if avg_salary > 8000:
-            score += 25
-        elif avg_salary > 6000:
-            score += 20
-        elif avg_salary > 4000:
-            score += 15
-        elif avg_salary > 2000:
-            score += 10
-        
-        # Bonus por baixa competição (0-20 pontos)
-        competition_bonus = {
-            'low': 20,
-            'medium': 10,
-            'high': 0
-        }
-        score += competition_bonus.get(competition_level, 0)
+        salary_pts = self._SALARY_POINTS[np.searchsorted(self._SALARY_BINS, avg_salary, side='left')]
         
-        # Bonus por crescimento (0-15 pontos)
-        growth_bonus = {
-            'growing': 15,
-            'stable': 5,
-            'declining': 0
-        }
-        score += growth_bonus.get(growth_trend, 0)
+        # Bonus por baixa competição (0-20) e por crescimento (0-15 pontos)
+        competition_pts = pd.Series(competition, dtype=object).map(self._COMPETITION_POINTS).fillna(0).to_numpy(dtype=np.int64)
+        growth_pts = pd.Series(trend, dtype=object).map(self._GROWTH_POINTS).fillna(0).to_numpy(dtype=np.int64)
         
-        return min(score, 100)  # Máximo 100
+        return np.minimum(job_pts + salary_pts + competition_pts + growth_pts, 100)  # Máximo 100
     
     def generate_heatmap_data(self) -> Dict:
         """
@@ -397,7 +579,7 @@ class RegionalHeatmap:
         
         # Salvar dados do heatmap
         self.regional_data["heatmap_data"] = heatmap_data
-        self._save_regional_data()
+        self._mark_dirty()
         
         return heatmap_data
     
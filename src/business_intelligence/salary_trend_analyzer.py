@@ -192,7 +192,20 @@ class SalaryTrendAnalyzer:
     
     def analyze_job_salary(self, job: Dict) -> Optional[Dict]:
         """
-        Analisa salário de uma vaga específica
+        Analisa salário de uma vaga específica e o registra no histórico
+        
+        Returns:
+            Dicionário com análise salarial ou None
+        """
+        analysis = self.extract_job_salary(job)
+        if analysis is None:
+            return None
+        
+        return self.record_salary_analysis(analysis)
+    
+    def extract_job_salary(self, job: Dict) -> Optional[Dict]:
+        """
+        Extrai e classifica o salário de uma vaga, sem registrá-lo no histórico
         
         Returns:
             Dicionário com análise salarial ou None
@@ -222,11 +235,15 @@ class SalaryTrendAnalyzer:
             'company': job.get('empresa', 'Não informado')
         }
         
-        # Adicionar aos dados históricos
-        self.salary_data["historical_data"].append(analysis)
+        return analysis
+    
+    def record_salary_analysis(self, analysis: Dict) -> Dict:
+        """Adiciona uma análise salarial aos dados históricos, com o horário do registro"""
+        record = dict(analysis, timestamp=datetime.now().isoformat())
+        self.salary_data["historical_data"].append(record)
         self.salary_data["statistics"]["total_samples"] += 1
         
-        return analysis
+        return record
     
     def calculate_trends(self, days_back: int = 30) -> Dict[str, SalaryTrend]:
         """
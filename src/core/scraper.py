@@ -201,7 +201,7 @@ async def scrape_catho_jobs(max_concurrent_jobs: int = 3, max_pages: int = 5) ->
                     print(f"\n✅ Coleta concluída! Total: {len(all_jobs)} vagas encontradas")
                     
                     # Cleanup
-                    alert_system.stop_background_monitoring()
+                    await alert_system.aclose()
                     for detail_page in detail_pages:
                         await detail_page.close()
                     
@@ -343,7 +343,7 @@ async def scrape_catho_jobs_optimized(
                         auto_tuner.print_tuning_report()
                     
                     # Cleanup
-                    alert_system.stop_background_monitoring()
+                    await alert_system.aclose()
                     for detail_page in detail_pages:
                         await detail_page.close()
                     
@@ -287,7 +287,7 @@ async def scrape_catho_jobs_pooled(
                         connection_pool.print_stats()
                     
                     # Cleanup
-                    alert_system.stop_background_monitoring()
+                    await alert_system.aclose()
                     await connection_pool.shutdown()
                     
                     print("🔄 Fechando navegador automaticamente...")
@@ -8,19 +8,37 @@ atualizações do sistema e eventos importantes.
 import asyncio
 import json
 import time
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
 import hashlib
+import urllib.error
 import urllib.request
 import urllib.parse
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import requests
+    HAS_REQUESTS = True
+except ImportError:
+    HAS_REQUESTS = False
+
 from ..utils.menu_system import MenuSystem, Colors
+from ..systems.retry_system import RetryStrategy
 
 
 class WebhookHandler:
     """Gerencia sistema de webhooks e notificações"""
     
+    # Back-off exponencial com jitter para erros de rede, 429 e 5xx
+    RETRY_STRATEGY = RetryStrategy(max_attempts=4, base_delay=1.0, max_delay=30.0)
+    RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+    
     def __init__(self):
         self.menu = MenuSystem()
         self.webhooks_dir = Path("data/webhooks")
@@ -433,30 +451,11 @@ class WebhookHandler:
     async def _send_webhook(self, webhook: Dict, payload: Dict) -> bool:
         """Envia dados para um webhook"""
         try:
-            # Tentar usar requests primeiro (mais comum)
-            try:
-                import requests
-                response = requests.post(
-                    webhook['url'],
-                    json=payload,
-                    timeout=10,
-                    headers={'Content-Type': 'application/json'}
-                )
-                success = response.status_code < 400
-            except ImportError:
-                # Fallback para urllib se requests não estiver disponível
-                data = json.dumps(payload).encode('utf-8')
-                req = urllib.request.Request(
-                    webhook['url'],
-                    data=data,
-                    headers={'Content-Type': 'application/json'}
-                )
-                
-                try:
-                    with urllib.request.urlopen(req, timeout=10) as response:
-                        success = response.getcode() < 400
-                except urllib.error.HTTPError as e:
-                    success = e.code < 400
+            # Serializar uma única vez; o corpo já codificado vai direto no POST
+            data = self._encode_payload(payload)
+            headers = {'Content-Type': 'application/json'}
+            
+            success = await self._post_with_retry(webhook['url'], data, headers)
             
             # Atualizar estatísticas
             stats = webhook.setdefault('stats', {})
@@ -481,6 +480,74 @@ class WebhookHandler:
             
             return False
     
+    async def _post_with_retry(self, url: str, data: bytes, headers: Dict) -> bool:
+        """Faz o POST repetindo em falhas de conexão, timeouts, 429 e 5xx"""
+        strategy = self.RETRY_STRATEGY
+        
+        for attempt in range(1, strategy.max_attempts + 1):
+            last_attempt = attempt >= strategy.max_attempts
+            
+            try:
+                # POST bloqueante em thread, para não travar o event loop
+                status, retry_after = await asyncio.to_thread(self._post_once, url, data, headers)
+            except Exception as e:
+                if last_attempt or not self._is_transient_error(e):
+                    raise
+                await asyncio.sleep(strategy.calculate_delay(attempt))
+                continue
+            
+            if status < 400:
+                return True
+            
+            if status not in self.RETRYABLE_STATUS or last_attempt:
+                return False
+            
+            delay = strategy.calculate_delay(attempt)
+            if retry_after:
+                try:
+                    delay = min(float(retry_after), strategy.max_delay)
+                except ValueError:
+                    pass
+            
+            await asyncio.sleep(delay)
+        
+        return False
+    
+    @staticmethod
+    def _is_transient_error(error: Exception) -> bool:
+        """
+        Indica se o erro de envio merece nova tentativa
+        
+        Só falhas de conexão e timeouts são repetidas; erros de configuração
+        (URL sem esquema, URL inválida) falham na primeira tentativa.
+        """
+        if HAS_REQUESTS and isinstance(error, requests.RequestException):
+            return isinstance(error, (requests.ConnectionError, requests.Timeout))
+        if isinstance(error, urllib.error.URLError):
+            return isinstance(error.reason, OSError)
+        return isinstance(error, (ConnectionError, TimeoutError))
+    
+    def _post_once(self, url: str, data: bytes, headers: Dict) -> Tuple[int, Optional[str]]:
+        """Executa um único POST e retorna (status, cabeçalho Retry-After)"""
+        # Usar requests se disponível (mais comum)
+        if HAS_REQUESTS:
+            response = requests.post(url, data=data, timeout=10, headers=headers)
+            return response.status_code, response.headers.get('Retry-After')
+        
+        # Fallback para urllib se requests não estiver disponível
+        req = urllib.request.Request(url, data=data, headers=headers)
+        try:
+            with urllib.request.urlopen(req, timeout=10) as response:
+                return response.getcode(), None
+        except urllib.error.HTTPError as e:
+            return e.code, e.headers.get('Retry-After')
+    
+    def _encode_payload(self, payload: Dict) -> bytes:
+        """Serializa o payload em bytes JSON (orjson quando disponível)"""
+        if HAS_ORJSON:
+            return orjson.dumps(payload)
+        return json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    
     def _generate_webhook_id(self) -> str:
         """Gera ID único para webhook"""
         timestamp = str(int(time.time()))
@@ -546,23 +613,29 @@ class WebhookHandler:
     
     def _apply_webhook_filters(self, jobs: List[Dict], filters: Dict) -> List[Dict]:
         """Aplica filtros de webhook nas vagas"""
-        filtered_jobs = jobs
-        
-        # Filtro por empresas
-        if filters.get('companies'):
-            companies = [c.lower() for c in filters['companies']]
-            filtered_jobs = [
-                job for job in filtered_jobs 
-                if any(company in job.get('empresa', '').lower() for company in companies)
-            ]
-        
-        # Filtro por palavras-chave no título
-        if filters.get('keywords'):
-            keywords = [k.lower() for k in filters['keywords']]
-            filtered_jobs = [
-                job for job in filtered_jobs 
-                if any(keyword in job.get('titulo', '').lower() for keyword in keywords)
-            ]
+        companies = [c.lower() for c in filters.get('companies') or []]
+        keywords = [k.lower() for k in filters.get('keywords') or []]
+        
+        if not companies and not keywords:
+            return jobs
+        
+        # Passagem única: cada vaga é descartada no primeiro filtro que falhar,
+        # começando pelo campo mais curto (empresa) antes do título
+        filtered_jobs = []
+        for job in jobs:
+            # Filtro por empresas
+            if companies:
+                company = job.get('empresa', '').lower()
+                if not any(c in company for c in companies):
+                    continue
+            
+            # Filtro por palavras-chave no título
+            if keywords:
+                title = job.get('titulo', '').lower()
+                if not any(k in title for k in keywords):
+                    continue
+            
+            filtered_jobs.append(job)
         
         return filtered_jobs
     
@@ -624,9 +697,32 @@ class WebhookHandler:
             }
 
 
+# Vagas sendo notificadas no momento por alguma chamada de notify_new_jobs
+_inflight_jobs: set = set()
+
+
+def _job_key(job: Dict) -> str:
+    """Chave de deduplicação de uma vaga"""
+    return job.get('link') or f"{job.get('titulo', '')}|{job.get('empresa', '')}"
+
+
 # Função para integração com outros módulos
 async def notify_new_jobs(jobs: List[Dict]) -> None:
     """Notifica webhooks sobre novas vagas encontradas"""
+    # Ignorar vagas que outra chamada concorrente já está notificando
+    claimed_keys = []
+    pending_jobs = []
+    for job in jobs:
+        key = _job_key(job)
+        if key in _inflight_jobs:
+            continue
+        _inflight_jobs.add(key)
+        claimed_keys.append(key)
+        pending_jobs.append(job)
+    
+    if not pending_jobs:
+        return
+    
     try:
         handler = WebhookHandler()
         webhooks = handler.config.get('webhooks', [])
@@ -638,14 +734,23 @@ async def notify_new_jobs(jobs: List[Dict]) -> None:
             if 'new_jobs' not in webhook.get('events', []):
                 continue
             
+            filters = webhook.get('filters', {})
+            min_jobs = filters.get('min_jobs', 1)
+            
+            # Filtrar só reduz a lista: se já não há vagas suficientes, pular
+            if len(pending_jobs) < min_jobs:
+                continue
+            
             # Aplicar filtros
-            filtered_jobs = handler._apply_webhook_filters(jobs, webhook.get('filters', {}))
+            filtered_jobs = handler._apply_webhook_filters(pending_jobs, filters)
             
-            if len(filtered_jobs) >= webhook.get('filters', {}).get('min_jobs', 1):
+            if len(filtered_jobs) >= min_jobs:
                 payload = handler._create_job_notification_payload(webhook, filtered_jobs)
                 await handler._send_webhook(webhook, payload)
     except Exception as e:
         print(f"⚠️ Erro ao enviar notificações webhook: {e}")
+    finally:
+        _inflight_jobs.difference_update(claimed_keys)
 
 
 async def notify_scraping_complete(total_jobs: int, duration: str) -> None:
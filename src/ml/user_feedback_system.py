@@ -8,12 +8,33 @@ as recomendações de vagas ao longo do tempo.
 
 import json
 import os
+import sqlite3
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from collections import defaultdict, Counter
 import statistics
 from dataclasses import dataclass, asdict
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _dumps(obj) -> str:
+    """Serializa uma linha do banco em JSON compacto (orjson quando disponível)"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def _loads(data: str):
+    """Desserializa uma linha do banco"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 @dataclass
 class UserInteraction:
@@ -56,10 +77,15 @@ class UserFeedbackSystem:
     def __init__(self, data_file: str = "data/ml/user_feedback.json"):
         self.data_file = data_file
         self.data_dir = os.path.dirname(data_file)
+        self.db_file = os.path.splitext(data_file)[0] + '.db'
         
         # Criar diretório se não existir
         os.makedirs(self.data_dir, exist_ok=True)
         
+        # Banco SQLite (WAL): cada interação vira um INSERT e cada usuário
+        # um UPSERT, em vez de regravar o arquivo inteiro a cada feedback
+        self.conn = self._connect_db()
+        
         # Carregar dados históricos
         self.feedback_data = self._load_feedback_data()
         
@@ -77,31 +103,97 @@ class UserFeedbackSystem:
         # Cache de preferências aprendidas
         self.user_preferences_cache = {}
     
+    def _connect_db(self) -> sqlite3.Connection:
+        """Abre o banco de feedback em modo WAL e cria as tabelas"""
+        conn = sqlite3.connect(self.db_file, isolation_level=None, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS interactions ('
+            'id INTEGER PRIMARY KEY AUTOINCREMENT, user_id TEXT NOT NULL, data TEXT NOT NULL)'
+        )
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS user_preferences ('
+            'user_id TEXT PRIMARY KEY, data TEXT NOT NULL, updated_at TEXT NOT NULL)'
+        )
+        return conn
+    
     def _load_feedback_data(self) -> Dict:
         """Carrega dados históricos de feedback"""
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                pass
-        
-        return {
+        feedback_data = {
             "interactions": [],
             "user_preferences": {},
             "learning_stats": {},
             "model_adjustments": [],
             "last_update": None
         }
+        
+        try:
+            feedback_data["interactions"] = [
+                _loads(data) for (data,) in
+                self.conn.execute('SELECT data FROM interactions ORDER BY id')
+            ]
+            for user_id, data, updated_at in self.conn.execute(
+                'SELECT user_id, data, updated_at FROM user_preferences'
+            ):
+                feedback_data["user_preferences"][user_id] = _loads(data)
+                if not feedback_data["last_update"] or updated_at > feedback_data["last_update"]:
+                    feedback_data["last_update"] = updated_at
+        except Exception as e:
+            print(f"Erro ao carregar dados de feedback: {e}")
+        
+        # Migrar arquivo JSON legado na primeira execução; depois de migrado o
+        # arquivo é renomeado para não ser importado de novo
+        if not feedback_data["interactions"] and os.path.exists(self.data_file):
+            try:
+                with open(self.data_file, 'r', encoding='utf-8') as f:
+                    legacy_data = json.load(f)
+                feedback_data.update(legacy_data)
+                if self._save_feedback_data(
+                    feedback_data["interactions"],
+                    feedback_data["user_preferences"].keys(),
+                    feedback_data
+                ):
+                    os.replace(self.data_file, self.data_file + '.migrated')
+            except Exception as e:
+                print(f"Erro ao migrar dados de feedback: {e}")
+        
+        return feedback_data
     
-    def _save_feedback_data(self):
-        """Salva dados de feedback"""
+    def _save_feedback_data(self, interactions: List[Dict], user_ids,
+                            feedback_data: Optional[Dict] = None) -> bool:
+        """
+        Persiste interações e grava as preferências dos usuários como estão em memória
+        
+        Usado na migração do JSON legado; novas interações passam por
+        _save_user_interactions, que soma as alterações à linha do banco.
+        """
+        feedback_data = feedback_data if feedback_data is not None else self.feedback_data
+        now_iso = datetime.now().isoformat()
+        
         try:
-            self.feedback_data["last_update"] = datetime.now().isoformat()
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(self.feedback_data, f, indent=2, ensure_ascii=False)
+            self.conn.execute('BEGIN')
+            self.conn.executemany(
+                'INSERT INTO interactions (user_id, data) VALUES (?, ?)',
+                [
+                    (interaction['user_id'], _dumps(interaction))
+                    for interaction in interactions
+                ]
+            )
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO user_preferences (user_id, data, updated_at) VALUES (?, ?, ?)',
+                [
+                    (user_id, _dumps(feedback_data["user_preferences"][user_id]), now_iso)
+                    for user_id in user_ids
+                ]
+            )
+            self.conn.execute('COMMIT')
+            feedback_data["last_update"] = now_iso
+            return True
         except Exception as e:
+            if self.conn.in_transaction:
+                self.conn.execute('ROLLBACK')
             print(f"Erro ao salvar dados de feedback: {e}")
+            return False
     
     def record_interaction(self, user_id: str, job_data: Dict, 
                           interaction_type: str, match_score: float,
@@ -121,51 +213,100 @@ class UserFeedbackSystem:
         Returns:
             Objeto de interação criado
         """
-        interaction = UserInteraction(
-            user_id=user_id,
-            job_id=job_data.get('job_id', str(hash(str(job_data)))),
-            job_title=job_data.get('title', job_data.get('titulo', '')),
-            interaction_type=interaction_type,
-            timestamp=datetime.now().isoformat(),
-            match_score=match_score,
-            skills_overlap=skills_overlap or [],
-            metadata={
-                'company': job_data.get('company', job_data.get('empresa', '')),
-                'location': job_data.get('location', job_data.get('localizacao', '')),
-                'seniority': job_data.get('seniority', ''),
-                'salary_info': job_data.get('salary_info', {}),
-                'job_skills': job_data.get('skills', []),
-                **(metadata or {})
-            }
+        interaction = self._build_interaction(
+            user_id, job_data, interaction_type, match_score,
+            skills_overlap, metadata, datetime.now().isoformat()
         )
+        interaction_data = asdict(interaction)
         
         # Adicionar aos dados de feedback
-        self.feedback_data["interactions"].append(asdict(interaction))
-        
-        # Atualizar preferências do usuário
-        self._update_user_preferences(interaction)
+        self.feedback_data["interactions"].append(interaction_data)
         
-        # Salvar dados
-        self._save_feedback_data()
+        # Atualizar preferências do usuário e salvar dados
+        self._record_user_interactions(user_id, [interaction], [interaction_data])
         
         return interaction
     
-    def _update_user_preferences(self, interaction: UserInteraction):
-        """Atualiza preferências do usuário baseado na interação"""
-        user_id = interaction.user_id
+    def record_interactions(self, user_id: str, items: List[Dict]) -> List[UserInteraction]:
+        """
+        Registra várias interações de uma vez
         
-        if user_id not in self.feedback_data["user_preferences"]:
-            self.feedback_data["user_preferences"][user_id] = {
-                'preferred_skills': {},
-                'preferred_companies': {},
-                'preferred_locations': {},
-                'preferred_salary_ranges': {},
-                'interaction_patterns': {},
-                'total_interactions': 0,
-                'learning_confidence': 0.0
-            }
+        O timestamp é calculado uma única vez para o lote e todas as
+        interações são gravadas numa única transação ao final.
         
-        prefs = self.feedback_data["user_preferences"][user_id]
+        Args:
+            user_id: ID do usuário
+            items: Lista de dicts com as chaves aceitas por record_interaction
+                   (job_data, interaction_type, match_score, skills_overlap, metadata)
+            
+        Returns:
+            Lista de interações criadas
+        """
+        now_iso = datetime.now().isoformat()
+        interactions = []
+        interactions_data = []
+        
+        for item in items:
+            interaction = self._build_interaction(
+                user_id,
+                item['job_data'],
+                item['interaction_type'],
+                item.get('match_score', 0.0),
+                item.get('skills_overlap'),
+                item.get('metadata'),
+                now_iso
+            )
+            interaction_data = asdict(interaction)
+            self.feedback_data["interactions"].append(interaction_data)
+            interactions.append(interaction)
+            interactions_data.append(interaction_data)
+        
+        if interactions:
+            self._record_user_interactions(user_id, interactions, interactions_data)
+        
+        return interactions
+    
+    def _build_interaction(self, user_id: str, job_data: Dict,
+                           interaction_type: str, match_score: float,
+                           skills_overlap: Optional[List[str]],
+                           metadata: Optional[Dict], timestamp: str) -> UserInteraction:
+        """Cria o objeto de interação a partir dos dados da vaga"""
+        interaction_metadata = {
+            'company': job_data.get('company', job_data.get('empresa', '')),
+            'location': job_data.get('location', job_data.get('localizacao', '')),
+            'seniority': job_data.get('seniority', ''),
+            'salary_info': job_data.get('salary_info', {}),
+            'job_skills': job_data.get('skills', [])
+        }
+        if metadata:
+            interaction_metadata.update(metadata)
+        
+        return UserInteraction(
+            user_id=user_id,
+            job_id=job_data.get('job_id', str(hash(str(job_data)))),
+            job_title=job_data.get('title', job_data.get('titulo', '')),
+            interaction_type=interaction_type,
+            timestamp=timestamp,
+            match_score=match_score,
+            skills_overlap=skills_overlap or [],
+            metadata=interaction_metadata
+        )
+    
+    @staticmethod
+    def _new_preferences() -> Dict:
+        """Preferências vazias de um usuário"""
+        return {
+            'preferred_skills': {},
+            'preferred_companies': {},
+            'preferred_locations': {},
+            'preferred_salary_ranges': {},
+            'interaction_patterns': {},
+            'total_interactions': 0,
+            'learning_confidence': 0.0
+        }
+    
+    def _apply_interaction(self, prefs: Dict, interaction: UserInteraction):
+        """Soma a interação às preferências informadas"""
         weight = self.interaction_weights.get(interaction.interaction_type, 0.1)
         
         # Atualizar preferências de skills
@@ -190,14 +331,76 @@ class UserFeedbackSystem:
             prefs['interaction_patterns'].get(interaction.interaction_type, 0) + 1
         
         prefs['total_interactions'] += 1
+    
+    @staticmethod
+    def _merge_preferences(prefs: Dict, delta: Dict):
+        """Soma às preferências as alterações acumuladas em delta"""
+        for field in ('preferred_skills', 'preferred_companies', 'preferred_locations', 'interaction_patterns'):
+            target = prefs.setdefault(field, {})
+            for key, value in delta[field].items():
+                target[key] = target.get(key, 0) + value
+        
+        prefs['total_interactions'] = prefs.get('total_interactions', 0) + delta['total_interactions']
         
         # Calcular confiança do aprendizado
         prefs['learning_confidence'] = min(1.0, prefs['total_interactions'] / 20.0)
+    
+    def _record_user_interactions(self, user_id: str, interactions: List[UserInteraction],
+                                  interactions_data: List[Dict]):
+        """Atualiza as preferências do usuário com as interações e persiste tudo"""
+        delta = self._new_preferences()
+        for interaction in interactions:
+            self._apply_interaction(delta, interaction)
+        
+        prefs = self._save_user_interactions(user_id, interactions_data, delta)
+        if prefs is None:
+            # Falha ao gravar: manter ao menos as preferências em memória atualizadas
+            prefs = self.feedback_data["user_preferences"].setdefault(user_id, self._new_preferences())
+            self._merge_preferences(prefs, delta)
+        else:
+            self.feedback_data["user_preferences"][user_id] = prefs
         
         # Limpar cache
         if user_id in self.user_preferences_cache:
             del self.user_preferences_cache[user_id]
     
+    def _save_user_interactions(self, user_id: str, interactions_data: List[Dict],
+                                delta: Dict) -> Optional[Dict]:
+        """
+        Grava as interações e soma delta às preferências do usuário no banco
+        
+        A linha de preferências é relida dentro da transação (BEGIN IMMEDIATE
+        já reserva a escrita), então instâncias que compartilham o banco não
+        sobrescrevem as atualizações umas das outras (a cópia em memória de
+        cada instância só reflete as demais na sua próxima gravação para o
+        usuário). Retorna as preferências gravadas, ou None em caso de erro.
+        """
+        now_iso = datetime.now().isoformat()
+        
+        try:
+            self.conn.execute('BEGIN IMMEDIATE')
+            self.conn.executemany(
+                'INSERT INTO interactions (user_id, data) VALUES (?, ?)',
+                [(user_id, _dumps(interaction)) for interaction in interactions_data]
+            )
+            row = self.conn.execute(
+                'SELECT data FROM user_preferences WHERE user_id = ?', (user_id,)
+            ).fetchone()
+            prefs = _loads(row[0]) if row else self._new_preferences()
+            self._merge_preferences(prefs, delta)
+            self.conn.execute(
+                'INSERT OR REPLACE INTO user_preferences (user_id, data, updated_at) VALUES (?, ?, ?)',
+                (user_id, _dumps(prefs), now_iso)
+            )
+            self.conn.execute('COMMIT')
+            self.feedback_data["last_update"] = now_iso
+            return prefs
+        except Exception as e:
+            if self.conn.in_transaction:
+                self.conn.execute('ROLLBACK')
+            print(f"Erro ao salvar dados de feedback: {e}")
+            return None
+    
     def get_user_preferences(self, user_id: str) -> Optional[UserPreferenceLearning]:
         """
         Obtém preferências aprendidas do usuário
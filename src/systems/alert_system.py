@@ -16,19 +16,30 @@ Funcionalidades:
 
 import asyncio
 import json
+import re
+import sys
 import time
-import smtplib
-import requests
-from typing import Dict, List, Any, Optional, Callable, Union
-from dataclasses import dataclass, field, asdict
-from collections import defaultdict, deque
+from typing import Dict, List, Any, Optional, Callable, Union, Tuple, Iterable
+from dataclasses import dataclass, field
+from functools import cached_property
 from datetime import datetime, timedelta
 from pathlib import Path
 from enum import Enum
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 import threading
 import hashlib
+import heapq
+from array import array
+from operator import attrgetter
+
+# aiohttp é importado no primeiro envio HTTP (NotificationSender._load_aiohttp);
+# None enquanto ainda não houve tentativa
+HAS_AIOHTTP: Optional[bool] = None
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 try:
     from .structured_logger import structured_logger, Component, LogLevel
@@ -61,7 +72,7 @@ class AlertStatus(Enum):
     SUPPRESSED = "suppressed"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NotificationConfig:
     """Configuração de um canal de notificação"""
     channel: NotificationChannel
@@ -70,9 +81,20 @@ class NotificationConfig:
     min_severity: AlertSeverity = AlertSeverity.LOW
     max_alerts_per_hour: int = 60
     template: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte para dicionário serializável (enums como valores)"""
+        return {
+            'channel': self.channel.value,
+            'enabled': self.enabled,
+            'config': dict(self.config),
+            'min_severity': self.min_severity.value,
+            'max_alerts_per_hour': self.max_alerts_per_hour,
+            'template': self.template
+        }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AlertRule:
     """Regra de alerta melhorada"""
     name: str
@@ -87,6 +109,23 @@ class AlertRule:
     escalation_severity: Optional[AlertSeverity] = None
     suppression_rules: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte para dicionário serializável (enums como valores)"""
+        return {
+            'name': self.name,
+            'description': self.description,
+            'condition': self.condition,
+            'threshold': self.threshold,
+            'severity': self.severity.value,
+            'channels': [channel.value for channel in self.channels],
+            'enabled': self.enabled,
+            'cooldown_minutes': self.cooldown_minutes,
+            'escalation_after_minutes': self.escalation_after_minutes,
+            'escalation_severity': self.escalation_severity.value if self.escalation_severity else None,
+            'suppression_rules': list(self.suppression_rules),
+            'metadata': dict(self.metadata)
+        }
 
 
 @dataclass
@@ -107,6 +146,151 @@ class AlertInstance:
     escalated: bool = False
     context: Dict[str, Any] = field(default_factory=dict)
     notifications_sent: List[Dict[str, Any]] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte para dicionário serializável (enums como valores)"""
+        return {
+            'id': self.id,
+            'rule_name': self.rule_name,
+            'title': self.title,
+            'description': self.description,
+            'severity': self.severity.value,
+            'status': self.status.value,
+            'created_at': self.created_at,
+            'last_triggered': self.last_triggered,
+            'trigger_count': self.trigger_count,
+            'acknowledged_at': self.acknowledged_at,
+            'acknowledged_by': self.acknowledged_by,
+            'resolved_at': self.resolved_at,
+            'escalated': self.escalated,
+            'context': dict(self.context),
+            'notifications_sent': list(self.notifications_sent)
+        }
+    
+    @cached_property
+    def created_at_str(self) -> str:
+        """Data de criação formatada (calculada uma vez por alerta)"""
+        return datetime.fromtimestamp(self.created_at).strftime('%Y-%m-%d %H:%M:%S')
+    
+    @cached_property
+    def context_json(self) -> str:
+        """Contexto formatado em JSON (o contexto é fixado na criação do alerta)"""
+        if HAS_ORJSON:
+            try:
+                return orjson.dumps(
+                    self.context, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ).decode()
+            except TypeError:
+                pass
+        return json.dumps(self.context, indent=2, ensure_ascii=False)
+
+
+def _enum_value(obj: Any) -> Any:
+    """Hook `default` do json: serializa enums pelo valor"""
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps_bytes(obj: Any) -> bytes:
+    """Serializa em JSON compacto UTF-8 (orjson quando disponível)"""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def _write_file(path: Path, data: bytes, mode: str = 'wb'):
+    """
+    Grava bytes no arquivo, criando o diretório só quando ele não existe
+    
+    O open é tentado primeiro: gravações num diretório existente não fazem
+    stat/mkdir, e o diretório é (re)criado apenas na primeira gravação ou se
+    tiver sido removido durante a execução.
+    """
+    try:
+        f = open(path, mode)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        f = open(path, mode)
+    
+    with f:
+        f.write(data)
+
+
+# Rótulos em maiúsculas por severidade/status (a severidade muda na escalação)
+_SEVERITY_UPPER: Dict[AlertSeverity, str] = {severity: severity.value.upper() for severity in AlertSeverity}
+_STATUS_UPPER: Dict[AlertStatus, str] = {status: status.value.upper() for status in AlertStatus}
+
+# Ícones por severidade usados no console
+_SEVERITY_ICONS: Dict[AlertSeverity, str] = {
+    AlertSeverity.LOW: '🔵',
+    AlertSeverity.MEDIUM: '🟡',
+    AlertSeverity.HIGH: '🔴',
+    AlertSeverity.CRITICAL: '💀'
+}
+
+# Ícones por status usados no dashboard
+_STATUS_ICONS: Dict[AlertStatus, str] = {
+    AlertStatus.ACTIVE: "🔴",
+    AlertStatus.ACKNOWLEDGED: "🟡",
+    AlertStatus.RESOLVED: "🟢",
+    AlertStatus.SUPPRESSED: "⚫"
+}
+
+# Ordem numérica das severidades para comparação com o mínimo de cada canal
+_SEVERITY_RANK: Dict[AlertSeverity, int] = {
+    AlertSeverity.LOW: 1,
+    AlertSeverity.MEDIUM: 2,
+    AlertSeverity.HIGH: 3,
+    AlertSeverity.CRITICAL: 4
+}
+_RANK_SEVERITY: Dict[int, AlertSeverity] = {rank: severity for severity, rank in _SEVERITY_RANK.items()}
+
+# Alertas sem nova ocorrência há mais que isso são resolvidos automaticamente
+STALE_ALERT_SECONDS = 86400
+
+# Gravação do histórico em disco: a cada intervalo ou ao acumular um lote
+HISTORY_FLUSH_INTERVAL = 1.0
+HISTORY_FLUSH_BATCH = 256
+
+# Nome de exibição de cada canal
+_CHANNEL_UPPER: Dict[NotificationChannel, str] = {channel: channel.value.upper() for channel in NotificationChannel}
+
+# Índice fixo de cada canal nos contadores de notificações
+_CHANNEL_INDEX: Dict[NotificationChannel, int] = {channel: i for i, channel in enumerate(NotificationChannel)}
+
+
+# Placeholders no formato {nome} usados nos templates
+_TEMPLATE_VAR_RE = re.compile(r'\{(\w+)\}')
+
+
+def _compile_template(text: str) -> Callable[[AlertInstance, Dict[str, Callable]], str]:
+    """
+    Pré-compila um template em trechos literais e nomes de variáveis
+    
+    O texto é analisado uma única vez; a renderização só concatena os trechos
+    e calcula as variáveis que de fato aparecem no template. Placeholders sem
+    getter correspondente são mantidos literalmente.
+    """
+    parts = _TEMPLATE_VAR_RE.split(text)
+    literals = parts[0::2]
+    names = parts[1::2]
+    
+    if not names:
+        return lambda alert, getters: text
+    
+    def render(alert: AlertInstance, getters: Dict[str, Callable]) -> str:
+        output = [literals[0]]
+        for name, literal in zip(names, literals[1:]):
+            getter = getters.get(name)
+            output.append(getter(alert) if getter else f'{{{name}}}')
+            output.append(literal)
+        return ''.join(output)
+    
+    return render
 
 
 @dataclass
@@ -115,19 +299,56 @@ class NotificationTemplate:
     title: str
     body: str
     variables: Dict[str, str] = field(default_factory=dict)
+    
+    def __post_init__(self):
+        self._title_fn = _compile_template(self.title)
+        self._body_fn = _compile_template(self.body)
+    
+    def render_title(self, alert: AlertInstance, getters: Dict[str, Callable]) -> str:
+        """Renderiza o título com os dados do alerta"""
+        return self._title_fn(alert, getters)
+    
+    def render_body(self, alert: AlertInstance, getters: Dict[str, Callable]) -> str:
+        """Renderiza o corpo com os dados do alerta"""
+        return self._body_fn(alert, getters)
+
+
+# Variáveis disponíveis nos templates, calculadas sob demanda por alerta
+TEMPLATE_VARIABLES: Dict[str, Callable[[AlertInstance], str]] = {
+    'alert_id': lambda alert: alert.id,
+    'title': lambda alert: alert.title,
+    'description': lambda alert: alert.description,
+    'severity': lambda alert: _SEVERITY_UPPER[alert.severity],
+    'status': lambda alert: _STATUS_UPPER[alert.status],
+    'created_at': lambda alert: alert.created_at_str,
+    'trigger_count': lambda alert: str(alert.trigger_count),
+    'context': lambda alert: alert.context_json
+}
 
 
 class NotificationSender:
     """Classe base para envio de notificações"""
     
+    # Getters das variáveis de template usados por este canal
+    template_variables: Dict[str, Callable[[AlertInstance], str]] = TEMPLATE_VARIABLES
+    
+    # Módulo aiohttp, importado sob demanda no primeiro envio HTTP
+    _aiohttp = None
+    
+    # Sessão HTTP compartilhada por todos os senders (keep-alive e pool de conexões)
+    _http_session: Optional["aiohttp.ClientSession"] = None
+    _http_session_loop: Optional[asyncio.AbstractEventLoop] = None
+    
     def __init__(self, config: NotificationConfig):
         self.config = config
-        self.send_count = defaultdict(int)
-        self.last_reset = time.time()
+        
+        # Token bucket: envios disponíveis até a próxima recarga (relógio monotônico)
+        self._tokens = config.max_alerts_per_hour
+        self._refill_at = time.monotonic() + 3600
     
     async def send(self, alert: AlertInstance, template: NotificationTemplate) -> bool:
         """Envia notificação"""
-        # Verificar rate limiting
+        # Verificar rate limiting (reserva um token antes do envio)
         if not self._check_rate_limit():
             if structured_logger:
                 structured_logger.warn(
@@ -138,9 +359,6 @@ class NotificationSender:
         
         try:
             success = await self._send_notification(alert, template)
-            if success:
-                self.send_count[self.config.channel.value] += 1
-            return success
         except Exception as e:
             if structured_logger:
                 structured_logger.error(
@@ -148,22 +366,120 @@ class NotificationSender:
                     component=Component.SYSTEM,
                     error=str(e)
                 )
-            return False
+            success = False
+        
+        # Só envios bem-sucedidos contam para o limite
+        if not success:
+            self._tokens += 1
+        return success
     
     def _check_rate_limit(self) -> bool:
-        """Verifica se não excedeu rate limit"""
-        current_time = time.time()
+        """Verifica se não excedeu rate limit e consome um token"""
+        now = time.monotonic()
         
-        # Reset contador a cada hora
-        if current_time - self.last_reset > 3600:
-            self.send_count.clear()
-            self.last_reset = current_time
+        # Recarregar tokens a cada hora
+        if now >= self._refill_at:
+            self._tokens = self.config.max_alerts_per_hour
+            self._refill_at = now + 3600
         
-        return self.send_count[self.config.channel.value] < self.config.max_alerts_per_hour
+        if self._tokens <= 0:
+            return False
+        
+        self._tokens -= 1
+        return True
     
     async def _send_notification(self, alert: AlertInstance, template: NotificationTemplate) -> bool:
         """Implementação específica do envio (override em subclasses)"""
         raise NotImplementedError
+    
+    @classmethod
+    def _load_aiohttp(cls):
+        """Importa o aiohttp na primeira chamada e guarda o módulo na classe (None se ausente)"""
+        global HAS_AIOHTTP
+        if HAS_AIOHTTP is None:
+            try:
+                import aiohttp
+                NotificationSender._aiohttp = aiohttp
+                HAS_AIOHTTP = True
+            except ImportError:
+                HAS_AIOHTTP = False
+        return NotificationSender._aiohttp
+    
+    @classmethod
+    def _get_http_session(cls) -> "aiohttp.ClientSession":
+        """Retorna a sessão HTTP compartilhada, criando-a se necessário"""
+        aiohttp = cls._load_aiohttp()
+        session = NotificationSender._http_session
+        loop = asyncio.get_running_loop()
+        if session is None or session.closed or NotificationSender._http_session_loop is not loop:
+            if session is not None and not session.closed:
+                cls._discard_http_session(session, NotificationSender._http_session_loop)
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                ttl_dns_cache=300,
+                keepalive_timeout=60
+            )
+            session = aiohttp.ClientSession(connector=connector)
+            NotificationSender._http_session = session
+            NotificationSender._http_session_loop = loop
+        return session
+    
+    @staticmethod
+    def _discard_http_session(session: "aiohttp.ClientSession", session_loop: asyncio.AbstractEventLoop):
+        """Fecha a sessão de outro event loop antes de substituí-la"""
+        if session_loop.is_running():
+            # Loop ainda ativo (em outro thread): fechar a sessão nele
+            asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+            return
+        
+        # Loop parado ou encerrado: soltar o conector e fechar suas conexões
+        # diretamente (com o loop encerrado o aiohttp só marca como fechado)
+        connector = session.connector
+        session.detach()
+        if connector is not None:
+            connector.close()
+    
+    @classmethod
+    async def close_http_session(cls):
+        """Fecha a sessão HTTP compartilhada"""
+        session = NotificationSender._http_session
+        NotificationSender._http_session = None
+        NotificationSender._http_session_loop = None
+        if session is not None and not session.closed:
+            await session.close()
+    
+    async def _post_json(
+        self,
+        url: str,
+        payload: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10
+    ) -> int:
+        """Envia payload JSON via POST sem bloquear o event loop e retorna o status HTTP"""
+        # Corpo pré-codificado em bytes: evita o encoder JSON interno do cliente HTTP
+        body = _dumps_bytes(payload)
+        headers = {'Content-Type': 'application/json', **(headers or {})}
+        
+        aiohttp = self._load_aiohttp()
+        if aiohttp is not None:
+            session = self._get_http_session()
+            async with session.post(
+                url,
+                data=body,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                return response.status
+        
+        # Fallback: requests síncrono executado em thread separada
+        # (importado só aqui para não pesar na carga do módulo)
+        import requests
+        
+        response = await asyncio.to_thread(
+            requests.post, url, data=body, headers=headers, timeout=timeout
+        )
+        return response.status_code
 
 
 class EmailSender(NotificationSender):
@@ -175,10 +491,15 @@ class EmailSender(NotificationSender):
         if not all(k in config for k in ['smtp_server', 'smtp_port', 'username', 'password', 'to_emails']):
             return False
         
+        # Importados sob demanda: só quem usa o canal de email paga pela carga
+        import smtplib
+        from email.mime.text import MIMEText
+        from email.mime.multipart import MIMEMultipart
+        
         try:
             # Formatear template
-            formatted_title = self._format_template(template.title, alert)
-            formatted_body = self._format_template(template.body, alert)
+            formatted_title = template.render_title(alert, self.template_variables)
+            formatted_body = template.render_body(alert, self.template_variables)
             
             # Criar mensagem
             msg = MIMEMultipart()
@@ -201,30 +522,16 @@ class EmailSender(NotificationSender):
             if structured_logger:
                 structured_logger.error(f"Email send failed: {e}", component=Component.SYSTEM)
             return False
-    
-    def _format_template(self, template: str, alert: AlertInstance) -> str:
-        """Formatar template com dados do alerta"""
-        variables = {
-            'alert_id': alert.id,
-            'title': alert.title,
-            'description': alert.description,
-            'severity': alert.severity.value.upper(),
-            'status': alert.status.value.upper(),
-            'created_at': datetime.fromtimestamp(alert.created_at).strftime('%Y-%m-%d %H:%M:%S'),
-            'trigger_count': str(alert.trigger_count),
-            'context': json.dumps(alert.context, indent=2)
-        }
-        
-        # Substituir variáveis no template
-        for key, value in variables.items():
-            template = template.replace(f'{{{key}}}', str(value))
-        
-        return template
 
 
 class WebhookSender(NotificationSender):
     """Envio de notificações via webhook"""
     
+    # O contexto já vai estruturado no payload
+    template_variables = {
+        name: getter for name, getter in TEMPLATE_VARIABLES.items() if name != 'context'
+    }
+    
     async def _send_notification(self, alert: AlertInstance, template: NotificationTemplate) -> bool:
         config = self.config.config
         
@@ -235,8 +542,8 @@ class WebhookSender(NotificationSender):
             # Preparar payload
             payload = {
                 'alert_id': alert.id,
-                'title': self._format_template(template.title, alert),
-                'description': self._format_template(template.body, alert),
+                'title': template.render_title(alert, self.template_variables),
+                'description': template.render_body(alert, self.template_variables),
                 'severity': alert.severity.value,
                 'status': alert.status.value,
                 'created_at': alert.created_at,
@@ -250,41 +557,44 @@ class WebhookSender(NotificationSender):
                 headers.update(config['headers'])
             
             # Enviar webhook
-            response = requests.post(
+            status = await self._post_json(
                 config['url'],
-                json=payload,
+                payload,
                 headers=headers,
                 timeout=config.get('timeout', 10)
             )
             
-            return response.status_code < 400
+            return status < 400
             
         except Exception as e:
             if structured_logger:
                 structured_logger.error(f"Webhook send failed: {e}", component=Component.SYSTEM)
             return False
-    
-    def _format_template(self, template: str, alert: AlertInstance) -> str:
-        """Mesmo método de formatação do EmailSender"""
-        variables = {
-            'alert_id': alert.id,
-            'title': alert.title,
-            'description': alert.description,
-            'severity': alert.severity.value.upper(),
-            'status': alert.status.value.upper(),
-            'created_at': datetime.fromtimestamp(alert.created_at).strftime('%Y-%m-%d %H:%M:%S'),
-            'trigger_count': str(alert.trigger_count)
-        }
-        
-        for key, value in variables.items():
-            template = template.replace(f'{{{key}}}', str(value))
-        
-        return template
 
 
 class SlackSender(NotificationSender):
     """Envio de notificações para Slack"""
     
+    # Formatação específica para Slack com markdown
+    template_variables = {
+        name: getter for name, getter in TEMPLATE_VARIABLES.items() if name != 'context'
+    }
+    template_variables.update({
+        'severity': lambda alert: f"*{_SEVERITY_UPPER[alert.severity]}*",
+        'status': lambda alert: f"*{_STATUS_UPPER[alert.status]}*"
+    })
+    
+    # Partes constantes do attachment por severidade (cor e rodapé)
+    _attachment_skeletons = {
+        severity: {'color': color, 'footer': 'Sistema de Alertas Web Scraper'}
+        for severity, color in (
+            (AlertSeverity.LOW, '#36a64f'),        # Verde
+            (AlertSeverity.MEDIUM, '#ff9900'),     # Laranja
+            (AlertSeverity.HIGH, '#ff0000'),       # Vermelho
+            (AlertSeverity.CRITICAL, '#8b0000')    # Vermelho escuro
+        )
+    }
+    
     async def _send_notification(self, alert: AlertInstance, template: NotificationTemplate) -> bool:
         config = self.config.config
         
@@ -292,79 +602,47 @@ class SlackSender(NotificationSender):
             return False
         
         try:
-            # Mapear severidade para cor
-            color_map = {
-                AlertSeverity.LOW: '#36a64f',        # Verde
-                AlertSeverity.MEDIUM: '#ff9900',     # Laranja
-                AlertSeverity.HIGH: '#ff0000',       # Vermelho
-                AlertSeverity.CRITICAL: '#8b0000'    # Vermelho escuro
-            }
-            
-            # Criar attachment do Slack
-            attachment = {
-                'color': color_map.get(alert.severity, '#36a64f'),
-                'title': self._format_template(template.title, alert),
-                'text': self._format_template(template.body, alert),
-                'fields': [
-                    {
-                        'title': 'Severidade',
-                        'value': alert.severity.value.upper(),
-                        'short': True
-                    },
-                    {
-                        'title': 'Status',
-                        'value': alert.status.value.upper(),
-                        'short': True
-                    },
-                    {
-                        'title': 'Ocorrências',
-                        'value': str(alert.trigger_count),
-                        'short': True
-                    },
-                    {
-                        'title': 'Criado em',
-                        'value': datetime.fromtimestamp(alert.created_at).strftime('%Y-%m-%d %H:%M:%S'),
-                        'short': True
-                    }
-                ],
-                'footer': 'Sistema de Alertas Web Scraper',
-                'ts': int(alert.created_at)
-            }
+            # Copiar o esqueleto da severidade e preencher só os campos do alerta
+            attachment = self._attachment_skeletons[alert.severity].copy()
+            attachment['title'] = template.render_title(alert, self.template_variables)
+            attachment['text'] = template.render_body(alert, self.template_variables)
+            attachment['fields'] = [
+                {
+                    'title': 'Severidade',
+                    'value': _SEVERITY_UPPER[alert.severity],
+                    'short': True
+                },
+                {
+                    'title': 'Status',
+                    'value': _STATUS_UPPER[alert.status],
+                    'short': True
+                },
+                {
+                    'title': 'Ocorrências',
+                    'value': str(alert.trigger_count),
+                    'short': True
+                },
+                {
+                    'title': 'Criado em',
+                    'value': alert.created_at_str,
+                    'short': True
+                }
+            ]
+            attachment['ts'] = int(alert.created_at)
             
             payload = {
                 'attachments': [attachment]
             }
             
             # Enviar para Slack
-            response = requests.post(
-                config['webhook_url'],
-                json=payload,
-                timeout=10
-            )
+            status = await self._post_json(config['webhook_url'], payload)
             
-            return response.status_code == 200
+            return status == 200
             
         except Exception as e:
             if structured_logger:
                 structured_logger.error(f"Slack send failed: {e}", component=Component.SYSTEM)
             return False
-    
-    def _format_template(self, template: str, alert: AlertInstance) -> str:
-        """Formatação específica para Slack com markdown"""
-        variables = {
-            'alert_id': alert.id,
-            'title': alert.title,
-            'description': alert.description,
-            'severity': f"*{alert.severity.value.upper()}*",
-            'status': f"*{alert.status.value.upper()}*",
-            'created_at': datetime.fromtimestamp(alert.created_at).strftime('%Y-%m-%d %H:%M:%S'),
-            'trigger_count': str(alert.trigger_count)
-        }
-        
-        for key, value in variables.items():
-            template = template.replace(f'{{{key}}}', str(value))
-        
-        return template
 
 
 class ConsoleSender(NotificationSender):
@@ -372,29 +650,26 @@ class ConsoleSender(NotificationSender):
     
     async def _send_notification(self, alert: AlertInstance, template: NotificationTemplate) -> bool:
         try:
-            # Mapear severidade para ícones
-            severity_icons = {
-                AlertSeverity.LOW: '🔵',
-                AlertSeverity.MEDIUM: '🟡',
-                AlertSeverity.HIGH: '🔴',
-                AlertSeverity.CRITICAL: '💀'
-            }
+            icon = _SEVERITY_ICONS.get(alert.severity, '⚪')
             
-            icon = severity_icons.get(alert.severity, '⚪')
-            
-            print(f"\n{icon} ALERTA {alert.severity.value.upper()}")
-            print("=" * 60)
-            print(f"ID: {alert.id}")
-            print(f"Título: {alert.title}")
-            print(f"Descrição: {alert.description}")
-            print(f"Status: {alert.status.value.upper()}")
-            print(f"Criado em: {datetime.fromtimestamp(alert.created_at).strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"Ocorrências: {alert.trigger_count}")
+            # Montar o bloco inteiro e escrevê-lo de uma vez no stdout
+            lines = [
+                f"\n{icon} ALERTA {_SEVERITY_UPPER[alert.severity]}",
+                "=" * 60,
+                f"ID: {alert.id}",
+                f"Título: {alert.title}",
+                f"Descrição: {alert.description}",
+                f"Status: {_STATUS_UPPER[alert.status]}",
+                f"Criado em: {alert.created_at_str}",
+                f"Ocorrências: {alert.trigger_count}"
+            ]
             
             if alert.context:
-                print(f"Contexto: {json.dumps(alert.context, indent=2)}")
+                lines.append(f"Contexto: {alert.context_json}")
+            
+            lines.append("=" * 60)
             
-            print("=" * 60)
+            sys.stdout.write("\n".join(lines) + "\n")
             
             return True
             
@@ -405,16 +680,26 @@ class ConsoleSender(NotificationSender):
 
 
 class FileSender(NotificationSender):
-    """Envio de notificações para arquivo"""
+    """
+    Envio de notificações para arquivo
+    
+    As entradas são acumuladas em memória e gravadas em lote: todos os alertas
+    enfileirados na mesma iteração do event loop viram um único append,
+    executado em thread para não bloquear o loop. O envio só é considerado bem
+    sucedido depois que o lote com a sua entrada é gravado; se a gravação
+    falhar, as entradas voltam para a fila e seguem no próximo lote.
+    """
+    
+    def __init__(self, config: NotificationConfig):
+        super().__init__(config)
+        self.file_path = Path(config.config.get('file_path', 'data/alerts/alerts.log'))
+        self._pending: List[bytes] = []
+        # Resolvido com o resultado da gravação do lote que contém as entradas pendentes
+        self._pending_written: Optional[asyncio.Future] = None
+        self._flush_task: Optional[asyncio.Task] = None
     
     async def _send_notification(self, alert: AlertInstance, template: NotificationTemplate) -> bool:
         try:
-            config = self.config.config
-            file_path = Path(config.get('file_path', 'data/alerts/alerts.log'))
-            
-            # Criar diretório se não existir
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            
             # Preparar entrada do log
             log_entry = {
                 'timestamp': datetime.fromtimestamp(alert.created_at).isoformat(),
@@ -427,16 +712,125 @@ class FileSender(NotificationSender):
                 'context': alert.context
             }
             
-            # Escrever no arquivo
-            with open(file_path, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(log_entry, ensure_ascii=False) + '\n')
+            # Enfileirar para a próxima gravação em lote
+            self._pending.append(_dumps_bytes(log_entry) + b'\n')
             
-            return True
+            loop = asyncio.get_running_loop()
+            written = self._pending_written
+            if written is None or written.get_loop() is not loop:
+                written = self._pending_written = loop.create_future()
+            
+            if self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._flush_soon())
             
         except Exception as e:
             if structured_logger:
                 structured_logger.error(f"File send failed: {e}", component=Component.SYSTEM)
             return False
+        
+        # Sucesso só quando a entrada estiver em disco (shield: cancelar este
+        # envio não cancela a espera dos demais alertas do lote)
+        return await asyncio.shield(written)
+    
+    async def _flush_soon(self):
+        """Grava o lote após os demais envios da iteração atual serem enfileirados"""
+        await asyncio.sleep(0)
+        try:
+            await self.flush()
+        except Exception as e:
+            if structured_logger:
+                structured_logger.error(f"File send failed: {e}", component=Component.SYSTEM)
+    
+    async def flush(self):
+        """Grava todas as entradas pendentes, com um único append por lote"""
+        # Entradas que chegam durante a gravação formam o lote seguinte
+        while self._pending:
+            batch, self._pending = self._pending, []
+            written, self._pending_written = self._pending_written, None
+            try:
+                await asyncio.to_thread(self._write_batch, b''.join(batch))
+            except Exception:
+                # Entradas voltam para a fila; quem aguardava este lote recebe a falha
+                self._pending[:0] = batch
+                self._resolve_written(written, False)
+                raise
+            self._resolve_written(written, True)
+    
+    @staticmethod
+    def _resolve_written(written: Optional[asyncio.Future], result: bool):
+        """Informa o resultado da gravação a quem aguarda o lote"""
+        if written is not None and not written.done() and not written.get_loop().is_closed():
+            written.set_result(result)
+    
+    def _write_batch(self, data: bytes):
+        """Append síncrono do lote (executado fora do event loop)"""
+        _write_file(self.file_path, data, 'ab')
+
+
+class AlertHistoryBuffer:
+    """
+    Histórico compacto de alertas em ring buffer (struct-of-arrays)
+    
+    Guarda apenas os campos usados em estatísticas e exportação, em arrays
+    paralelos de tamanho fixo, sem manter referências aos AlertInstance
+    (e aos seus dicts de contexto/notificações).
+    """
+    
+    def __init__(self, capacity: int = 10000):
+        self.capacity = capacity
+        self.ids: List[Optional[str]] = [None] * capacity
+        self.rule_names: List[Optional[str]] = [None] * capacity
+        self.severity_ranks = array('b', bytes(capacity))
+        self.created_at = array('d', [0.0]) * capacity
+        self.trigger_counts = array('l', [0]) * capacity
+        # Posição do registro mais recente de cada alerta (para redisparos)
+        self._slots: Dict[str, int] = {}
+        self._head = 0
+        self._count = 0
+    
+    def append(self, alert: AlertInstance):
+        """Registra um alerta, sobrescrevendo o mais antigo quando cheio"""
+        head = self._head
+        overwritten = self.ids[head]
+        if overwritten is not None and self._slots.get(overwritten) == head:
+            del self._slots[overwritten]
+        
+        self._slots[alert.id] = head
+        self.ids[head] = alert.id
+        self.rule_names[head] = alert.rule_name
+        self.severity_ranks[head] = _SEVERITY_RANK[alert.severity]
+        self.created_at[head] = alert.created_at
+        self.trigger_counts[head] = alert.trigger_count
+        
+        self._head = (head + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+    
+    def update_trigger_count(self, alert: AlertInstance):
+        """Atualiza o trigger_count do registro de um alerta redisparado"""
+        slot = self._slots.get(alert.id)
+        if slot is not None:
+            self.trigger_counts[slot] = alert.trigger_count
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def records(self, last: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Retorna os últimos registros (do mais antigo ao mais recente)"""
+        count = self._count if last is None else min(last, self._count)
+        start = (self._head - count) % self.capacity
+        
+        records = []
+        for offset in range(count):
+            i = (start + offset) % self.capacity
+            records.append({
+                'id': self.ids[i],
+                'rule_name': self.rule_names[i],
+                'severity': _RANK_SEVERITY[self.severity_ranks[i]].value,
+                'created_at': self.created_at[i],
+                'trigger_count': self.trigger_counts[i]
+            })
+        return records
 
 
 class AlertSystem:
@@ -446,16 +840,28 @@ class AlertSystem:
         self.config_dir = Path(config_dir)
         self.config_dir.mkdir(exist_ok=True)
         
+        # Diretório de exportação criado só na primeira exportação
+        self._export_dir = Path("data/alerts/exports")
+        
         # Estado do sistema
         self.active_alerts: Dict[str, AlertInstance] = {}
+        # Contagem incremental de alertas ativos por severidade (mantida sob _lock)
+        self._active_by_severity: Dict[AlertSeverity, int] = {severity: 0 for severity in AlertSeverity}
+        # Min-heap (last_triggered, alert_id) para achar alertas expirados sem varrer todos
+        self._expiry_heap: List[Tuple[float, str]] = []
         self.alert_rules: Dict[str, AlertRule] = {}
         self.notification_configs: Dict[NotificationChannel, NotificationConfig] = {}
         self.notification_senders: Dict[NotificationChannel, NotificationSender] = {}
         self.templates: Dict[str, NotificationTemplate] = {}
         
         # Histórico e estatísticas
-        self.alert_history: deque = deque(maxlen=10000)
-        self.notification_stats = defaultdict(int)
+        # Em memória só os registros recentes; em disco, um registro por alerta criado
+        self.alert_history = AlertHistoryBuffer(capacity=10000)
+        self.history_path = Path("data/alerts/alert_history.jsonl")
+        self._pending_history: List[tuple] = []
+        self._history_flush_task: Optional[asyncio.Task] = None
+        self._notification_success = array('Q', [0]) * len(_CHANNEL_INDEX)
+        self._notification_failed = array('Q', [0]) * len(_CHANNEL_INDEX)
         
         # Background tasks
         self._running = False
@@ -464,6 +870,13 @@ class AlertSystem:
         # Lock para thread safety
         self._lock = threading.Lock()
         
+        # Notificações em andamento por alerta (coalescência de disparos em rajada)
+        self._in_flight: Dict[str, asyncio.Event] = {}
+        
+        # Escalação agendada por alerta no prazo exato da regra
+        self._escalation_timers: Dict[str, asyncio.TimerHandle] = {}
+        self._escalation_tasks: set = set()
+        
         # Inicializar configurações padrão
         self._load_default_configs()
         self._load_default_templates()
@@ -570,6 +983,19 @@ Contexto detalhado:
                 }
             )
     
+    def add_alert_rules(self, rules: Iterable[AlertRule]):
+        """Adiciona várias regras de alerta com uma única aquisição do lock"""
+        new_rules = {rule.name: rule for rule in rules}
+        with self._lock:
+            self.alert_rules.update(new_rules)
+        
+        if structured_logger:
+            structured_logger.info(
+                f"Alert rules added: {len(new_rules)}",
+                component=Component.SYSTEM,
+                context={'rules': list(new_rules)}
+            )
+    
     async def trigger_alert(
         self,
         rule_name: str,
@@ -592,47 +1018,77 @@ Contexto detalhado:
         # Gerar ID único para o alerta
         alert_id = self._generate_alert_id(rule_name, title, description)
         
-        with self._lock:
-            # Verificar se alerta já existe
-            if alert_id in self.active_alerts:
-                # Atualizar alerta existente
-                existing_alert = self.active_alerts[alert_id]
-                existing_alert.last_triggered = time.time()
-                existing_alert.trigger_count += 1
-                
-                # Verificar cooldown
-                time_since_last = time.time() - existing_alert.last_triggered
-                if time_since_last < (rule.cooldown_minutes * 60) and not force:
-                    return alert_id  # Ainda em cooldown
-                
-                alert = existing_alert
-            else:
-                # Criar novo alerta
-                alert = AlertInstance(
-                    id=alert_id,
-                    rule_name=rule_name,
-                    title=title,
-                    description=description,
-                    severity=rule.severity,
-                    status=AlertStatus.ACTIVE,
-                    created_at=time.time(),
-                    last_triggered=time.time(),
-                    context=context or {}
-                )
-                
-                self.active_alerts[alert_id] = alert
-                self.alert_history.append(alert)
+        current_time = time.time()
+        alert = self.active_alerts.get(alert_id)
+        
+        if alert is None:
+            # Criar novo alerta
+            new_alert = AlertInstance(
+                id=alert_id,
+                rule_name=rule_name,
+                title=title,
+                description=description,
+                severity=rule.severity,
+                status=AlertStatus.ACTIVE,
+                created_at=current_time,
+                last_triggered=current_time,
+                context=context or {}
+            )
             
-            # Verificar escalação
-            if not alert.escalated and rule.escalation_after_minutes:
-                time_since_created = (time.time() - alert.created_at) / 60
-                if time_since_created >= rule.escalation_after_minutes:
-                    if rule.escalation_severity:
-                        alert.severity = rule.escalation_severity
-                    alert.escalated = True
-        
-        # Enviar notificações
-        await self._send_notifications(alert, rule)
+            # Seção crítica curta: só a inserção (outro disparo pode ter criado o alerta)
+            with self._lock:
+                alert = self.active_alerts.setdefault(alert_id, new_alert)
+                if alert is new_alert:
+                    self._active_by_severity[alert.severity] += 1
+                    heapq.heappush(self._expiry_heap, (alert.last_triggered, alert_id))
+                    self.alert_history.append(alert)
+                    self._pending_history.append((
+                        alert.id, alert.rule_name, _SEVERITY_RANK[alert.severity],
+                        alert.created_at, alert.trigger_count
+                    ))
+            
+            if alert is new_alert and rule.escalation_after_minutes:
+                self._schedule_escalation(alert_id, rule.escalation_after_minutes * 60)
+            
+            # Lote cheio: gravar já, sem esperar o flusher periódico
+            if len(self._pending_history) >= HISTORY_FLUSH_BATCH:
+                if self._history_flush_task is None or self._history_flush_task.done():
+                    self._history_flush_task = asyncio.create_task(self.flush_history())
+        else:
+            new_alert = None
+        
+        if alert is not new_alert:
+            # Atualizar alerta existente
+            time_since_last = current_time - alert.last_triggered
+            alert.last_triggered = current_time
+            alert.trigger_count += 1
+            with self._lock:
+                self.alert_history.update_trigger_count(alert)
+            
+            # Verificar cooldown
+            if time_since_last < (rule.cooldown_minutes * 60) and not force:
+                return alert_id  # Ainda em cooldown
+        
+        # Verificar escalação
+        if not alert.escalated and rule.escalation_after_minutes:
+            time_since_created = (current_time - alert.created_at) / 60
+            if time_since_created >= rule.escalation_after_minutes:
+                with self._lock:
+                    self._escalate(alert, rule)
+        
+        # Enviar notificações; disparos repetidos enquanto o envio do mesmo
+        # alerta está em andamento aguardam esse envio em vez de duplicá-lo
+        in_flight = self._in_flight.get(alert_id)
+        if in_flight is not None:
+            await in_flight.wait()
+        else:
+            event = asyncio.Event()
+            self._in_flight[alert_id] = event
+            try:
+                await self._send_notifications(alert, rule)
+            finally:
+                event.set()
+                del self._in_flight[alert_id]
         
         # Registrar métricas
         if metrics_tracker:
@@ -641,76 +1097,153 @@ Contexto detalhado:
         
         return alert_id
     
+    def _escalate(self, alert: AlertInstance, rule: AlertRule):
+        """Escala o alerta mantendo a contagem por severidade (chamar com _lock)"""
+        if rule.escalation_severity:
+            if self.active_alerts.get(alert.id) is alert:
+                self._active_by_severity[alert.severity] -= 1
+                self._active_by_severity[rule.escalation_severity] += 1
+            alert.severity = rule.escalation_severity
+        alert.escalated = True
+    
+    def _schedule_escalation(self, alert_id: str, delay: float):
+        """Agenda a escalação do alerta para daqui a `delay` segundos"""
+        loop = asyncio.get_running_loop()
+        self._escalation_timers[alert_id] = loop.call_later(delay, self._on_escalation_due, alert_id)
+    
+    def _on_escalation_due(self, alert_id: str):
+        """Callback do timer: dispara a escalação em uma task"""
+        self._escalation_timers.pop(alert_id, None)
+        task = asyncio.create_task(self._run_escalation(alert_id))
+        self._escalation_tasks.add(task)
+        task.add_done_callback(self._escalation_tasks.discard)
+    
+    async def _run_escalation(self, alert_id: str):
+        """Escala o alerta (se ainda ativo e não escalado) e re-envia as notificações"""
+        with self._lock:
+            alert = self.active_alerts.get(alert_id)
+            if alert is None or alert.escalated:
+                return
+            rule = self.alert_rules.get(alert.rule_name)
+            if rule is None:
+                return
+            self._escalate(alert, rule)
+        
+        # Re-enviar notificações com severidade escalada
+        await self._send_notifications(alert, rule)
+    
+    def _pop_stale_alerts(self, current_time: float) -> List[str]:
+        """
+        Retira do heap de expiração os alertas vencidos (chamar com _lock)
+        
+        Só percorre o topo do heap. As entradas guardam o last_triggered do
+        momento da inserção: se o alerta voltou a ocorrer desde então, ele é
+        reinserido com o horário atual; entradas de alertas já resolvidos são
+        descartadas.
+        """
+        cutoff = current_time - STALE_ALERT_SECONDS
+        heap = self._expiry_heap
+        stale = []
+        
+        while heap and heap[0][0] < cutoff:
+            entry_time, alert_id = heapq.heappop(heap)
+            alert = self.active_alerts.get(alert_id)
+            if alert is None or entry_time < alert.created_at:
+                continue  # Resolvido (ou recriado com entrada própria)
+            if alert.last_triggered < cutoff:
+                stale.append(alert_id)
+            else:
+                heapq.heappush(heap, (alert.last_triggered, alert_id))
+        
+        return stale
+    
     def _generate_alert_id(self, rule_name: str, title: str, description: str) -> str:
         """Gera ID único para o alerta"""
-        content = f"{rule_name}:{title}:{description}"
-        return hashlib.md5(content.encode()).hexdigest()[:16]
+        # blake2b com digest de 8 bytes já produz os 16 caracteres hex do ID
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(rule_name.encode())
+        digest.update(b':')
+        digest.update(title.encode())
+        digest.update(b':')
+        digest.update(description.encode())
+        return digest.hexdigest()
     
     async def _send_notifications(self, alert: AlertInstance, rule: AlertRule):
         """Envia notificações para todos os canais configurados"""
         channels_to_use = rule.channels if rule.channels else list(self.notification_configs.keys())
         
+        # Montar os envios de todos os canais elegíveis para dispará-los juntos
+        pending = []
+        sends = []
+        
+        alert_rank = _SEVERITY_RANK[alert.severity]
+        
         for channel in channels_to_use:
-            if channel not in self.notification_configs:
-                continue
-            
-            config = self.notification_configs[channel]
-            
-            # Verificar se canal está habilitado
-            if not config.enabled:
+            # Filtros do mais barato ao mais caro: sender/config existentes,
+            # canal habilitado, severidade mínima; só então o template
+            sender = self.notification_senders.get(channel)
+            config = self.notification_configs.get(channel)
+            if sender is None or config is None or not config.enabled:
                 continue
             
             # Verificar severidade mínima
-            severity_levels = {
-                AlertSeverity.LOW: 1,
-                AlertSeverity.MEDIUM: 2,
-                AlertSeverity.HIGH: 3,
-                AlertSeverity.CRITICAL: 4
-            }
-            
-            if severity_levels.get(alert.severity, 1) < severity_levels.get(config.min_severity, 1):
+            if alert_rank < _SEVERITY_RANK[config.min_severity]:
                 continue
             
             # Selecionar template
             template_name = config.template or self._select_template(alert, channel)
             template = self.templates.get(template_name, self.templates['default'])
             
-            # Enviar notificação
-            if channel in self.notification_senders:
-                try:
-                    success = await self.notification_senders[channel].send(alert, template)
-                    
-                    # Registrar resultado
-                    notification_record = {
-                        'channel': channel.value,
-                        'timestamp': time.time(),
-                        'success': success,
-                        'template': template_name
-                    }
-                    
-                    alert.notifications_sent.append(notification_record)
-                    self.notification_stats[f"{channel.value}_{'success' if success else 'failed'}"] += 1
-                    
-                    if structured_logger:
-                        level = LogLevel.INFO if success else LogLevel.ERROR
-                        structured_logger.log(
-                            f"Notification sent via {channel.value}: {'success' if success else 'failed'}",
-                            level,
-                            component=Component.SYSTEM,
-                            context={
-                                'alert_id': alert.id,
-                                'channel': channel.value,
-                                'success': success
-                            }
-                        )
-                
-                except Exception as e:
-                    if structured_logger:
-                        structured_logger.error(
-                            f"Failed to send notification via {channel.value}: {e}",
-                            component=Component.SYSTEM,
-                            error=str(e)
-                        )
+            pending.append((channel, template_name))
+            sends.append(sender.send(alert, template))
+        
+        if not sends:
+            return
+        
+        # Enviar notificações em paralelo: latência total = canal mais lento
+        results = await asyncio.gather(*sends, return_exceptions=True)
+        sent_at = time.time()
+        
+        for (channel, template_name), result in zip(pending, results):
+            if isinstance(result, Exception):
+                if structured_logger:
+                    structured_logger.error(
+                        f"Failed to send notification via {channel.value}: {result}",
+                        component=Component.SYSTEM,
+                        error=str(result)
+                    )
+                continue
+            
+            success = result
+            
+            # Registrar resultado
+            notification_record = {
+                'channel': channel.value,
+                'timestamp': sent_at,
+                'success': success,
+                'template': template_name
+            }
+            
+            alert.notifications_sent.append(notification_record)
+            if success:
+                self._notification_success[_CHANNEL_INDEX[channel]] += 1
+            else:
+                self._notification_failed[_CHANNEL_INDEX[channel]] += 1
+            
+            if structured_logger:
+                # Checar o nível antes de formatar a mensagem e montar o contexto
+                level = LogLevel.INFO if success else LogLevel.ERROR
+                if structured_logger.is_enabled_for(level):
+                    structured_logger.log(
+                        level,
+                        f"Notification sent via {channel.value}: {'success' if success else 'failed'}",
+                        component=Component.SYSTEM,
+                        context={
+                            'alert_id': alert.id,
+                            'channel': channel.value,
+                            'success': success
+                        }
+                    )
     
     def _select_template(self, alert: AlertInstance, channel: NotificationChannel) -> str:
         """Seleciona template apropriado"""
@@ -744,48 +1277,85 @@ Contexto detalhado:
     def resolve_alert(self, alert_id: str) -> bool:
         """Resolve um alerta"""
         with self._lock:
-            if alert_id in self.active_alerts:
-                alert = self.active_alerts[alert_id]
-                alert.status = AlertStatus.RESOLVED
-                alert.resolved_at = time.time()
-                
-                # Remover dos alertas ativos
-                del self.active_alerts[alert_id]
-                
-                if structured_logger:
-                    structured_logger.info(
-                        f"Alert resolved: {alert_id}",
-                        component=Component.SYSTEM
-                    )
-                
-                # Registrar métrica
-                if metrics_tracker:
-                    metrics_tracker.increment_counter("alerts.resolved")
-                
-                return True
+            resolved = self._resolve_locked(alert_id, time.time())
         
-        return False
+        if resolved:
+            if structured_logger and structured_logger.is_enabled_for(LogLevel.INFO):
+                structured_logger.info(
+                    f"Alert resolved: {alert_id}",
+                    component=Component.SYSTEM
+                )
+            
+            # Registrar métrica
+            if metrics_tracker:
+                metrics_tracker.increment_counter("alerts.resolved")
+        
+        return resolved
+    
+    def _resolve_alerts_bulk(self, alert_ids: List[str]) -> int:
+        """Resolve vários alertas com uma única aquisição do lock e um único log"""
+        resolved_at = time.time()
+        with self._lock:
+            resolved = sum(self._resolve_locked(alert_id, resolved_at) for alert_id in alert_ids)
+        
+        if resolved:
+            if structured_logger:
+                structured_logger.info(
+                    f"Auto-resolved {resolved} stale alerts",
+                    component=Component.SYSTEM,
+                    context={'alert_ids': alert_ids}
+                )
+            
+            if metrics_tracker:
+                metrics_tracker.increment_counter("alerts.resolved", resolved)
+        
+        return resolved
+    
+    def _resolve_locked(self, alert_id: str, resolved_at: float) -> bool:
+        """Marca o alerta como resolvido e o remove dos ativos (chamar com _lock)"""
+        alert = self.active_alerts.pop(alert_id, None)
+        if alert is None:
+            return False
+        
+        alert.status = AlertStatus.RESOLVED
+        alert.resolved_at = resolved_at
+        self._active_by_severity[alert.severity] -= 1
+        
+        timer = self._escalation_timers.pop(alert_id, None)
+        if timer is not None:
+            timer.cancel()
+        
+        return True
+    
+    @property
+    def notification_stats(self) -> Dict[str, int]:
+        """Contadores de notificações por canal ('<canal>_success'/'<canal>_failed')"""
+        stats = {}
+        for channel, i in _CHANNEL_INDEX.items():
+            if self._notification_success[i]:
+                stats[f"{channel.value}_success"] = self._notification_success[i]
+            if self._notification_failed[i]:
+                stats[f"{channel.value}_failed"] = self._notification_failed[i]
+        return stats
     
     def get_active_alerts(self) -> List[AlertInstance]:
         """Retorna alertas ativos"""
-        with self._lock:
-            return list(self.active_alerts.values())
+        # Cópia das referências é atômica; leitura não precisa do lock
+        return list(self.active_alerts.values())
     
     def get_alert_stats(self) -> Dict[str, Any]:
         """Retorna estatísticas de alertas"""
-        with self._lock:
-            active_by_severity = defaultdict(int)
-            for alert in self.active_alerts.values():
-                active_by_severity[alert.severity.value] += 1
-            
-            return {
-                'active_alerts': len(self.active_alerts),
-                'total_in_history': len(self.alert_history),
-                'active_by_severity': dict(active_by_severity),
-                'notification_stats': dict(self.notification_stats),
-                'configured_channels': [c.value for c in self.notification_configs.keys()],
-                'configured_rules': len(self.alert_rules)
-            }
+        return {
+            'active_alerts': len(self.active_alerts),
+            'total_in_history': len(self.alert_history),
+            'active_by_severity': {
+                severity.value: count
+                for severity, count in self._active_by_severity.items() if count
+            },
+            'notification_stats': self.notification_stats,
+            'configured_channels': [c.value for c in self.notification_configs.keys()],
+            'configured_rules': len(self.alert_rules)
+        }
     
     def print_alert_dashboard(self):
         """Imprime dashboard de alertas"""
@@ -820,17 +1390,14 @@ Contexto detalhado:
         # Alertas ativos
         if active_alerts:
             print(f"\n🚨 ALERTAS ATIVOS:")
-            for alert in sorted(active_alerts, key=lambda x: x.created_at, reverse=True)[:10]:
-                age_minutes = (time.time() - alert.created_at) / 60
-                status_icon = {
-                    AlertStatus.ACTIVE: "🔴",
-                    AlertStatus.ACKNOWLEDGED: "🟡",
-                    AlertStatus.RESOLVED: "🟢",
-                    AlertStatus.SUPPRESSED: "⚫"
-                }.get(alert.status, "⚪")
+            current_time = time.time()
+            # Só os 10 mais recentes: seleção parcial em vez de ordenar tudo
+            for alert in heapq.nlargest(10, active_alerts, key=attrgetter('created_at')):
+                age_minutes = (current_time - alert.created_at) / 60
+                status_icon = _STATUS_ICONS.get(alert.status, "⚪")
                 
                 print(f"   {status_icon} {alert.title[:50]}...")
-                print(f"      ID: {alert.id} | Severidade: {alert.severity.value.upper()}")
+                print(f"      ID: {alert.id} | Severidade: {_SEVERITY_UPPER[alert.severity]}")
                 print(f"      Idade: {age_minutes:.0f}min | Ocorrências: {alert.trigger_count}")
         
         # Estatísticas de notificações
@@ -841,11 +1408,9 @@ Contexto detalhado:
         
         # Canais configurados
         print(f"\n📢 CANAIS CONFIGURADOS:")
-        for channel_name in stats['configured_channels']:
-            config = self.notification_configs.get(NotificationChannel(channel_name))
-            if config:
-                status = "🟢 ATIVO" if config.enabled else "🔴 INATIVO"
-                print(f"   • {channel_name.upper()}: {status} (min: {config.min_severity.value})")
+        for channel, config in list(self.notification_configs.items()):
+            status = "🟢 ATIVO" if config.enabled else "🔴 INATIVO"
+            print(f"   • {_CHANNEL_UPPER[channel]}: {status} (min: {config.min_severity.value})")
         
         print("="*80)
     
@@ -862,38 +1427,12 @@ Contexto detalhado:
                 try:
                     current_time = time.time()
                     
-                    # Auto-resolver alertas antigos
-                    alerts_to_resolve = []
-                    
+                    # Auto-resolver alertas sem nova ocorrência há mais de 24 horas
                     with self._lock:
-                        for alert_id, alert in self.active_alerts.items():
-                            # Auto-resolver após 24 horas sem nova ocorrência
-                            if current_time - alert.last_triggered > 86400:
-                                alerts_to_resolve.append(alert_id)
+                        alerts_to_resolve = self._pop_stale_alerts(current_time)
                     
-                    # Resolver alertas antigos
-                    for alert_id in alerts_to_resolve:
-                        self.resolve_alert(alert_id)
-                        if structured_logger:
-                            structured_logger.info(
-                                f"Auto-resolved stale alert: {alert_id}",
-                                component=Component.SYSTEM
-                            )
-                    
-                    # Verificar escalações pendentes
-                    with self._lock:
-                        for alert in self.active_alerts.values():
-                            if not alert.escalated:
-                                rule = self.alert_rules.get(alert.rule_name)
-                                if rule and rule.escalation_after_minutes:
-                                    age_minutes = (current_time - alert.created_at) / 60
-                                    if age_minutes >= rule.escalation_after_minutes:
-                                        if rule.escalation_severity:
-                                            alert.severity = rule.escalation_severity
-                                        alert.escalated = True
-                                        
-                                        # Re-enviar notificações com severidade escalada
-                                        await self._send_notifications(alert, rule)
+                    if alerts_to_resolve:
+                        self._resolve_alerts_bulk(alerts_to_resolve)
                     
                     await asyncio.sleep(60)  # Verificar a cada minuto
                     
@@ -902,11 +1441,46 @@ Contexto detalhado:
                         structured_logger.error(f"Alert monitor error: {e}", component=Component.SYSTEM)
                     await asyncio.sleep(60)
         
-        # Iniciar task de monitoramento
-        self._background_tasks = [asyncio.create_task(alert_monitor())]
+        # Iniciar tasks de monitoramento e de gravação do histórico
+        self._background_tasks = [
+            asyncio.create_task(alert_monitor()),
+            asyncio.create_task(self._history_flusher())
+        ]
+    
+    async def _history_flusher(self):
+        """Grava periodicamente o histórico pendente em lote"""
+        while self._running:
+            await asyncio.sleep(HISTORY_FLUSH_INTERVAL)
+            try:
+                await self.flush_history()
+            except Exception as e:
+                if structured_logger:
+                    structured_logger.error(f"Alert history flush failed: {e}", component=Component.SYSTEM)
+    
+    async def flush_history(self):
+        """
+        Grava os registros de histórico pendentes, com um único append por lote
+        
+        O arquivo guarda um registro por alerta criado, com o trigger_count da
+        criação; redisparos atualizam só o histórico em memória. Se a gravação
+        falhar, o lote volta para o início da fila e o erro é propagado.
+        """
+        # Registros que chegam durante a gravação formam o lote seguinte
+        while self._pending_history:
+            batch, self._pending_history = self._pending_history, []
+            data = b''.join(_dumps_bytes(record) + b'\n' for record in batch)
+            try:
+                await asyncio.to_thread(self._write_history, data)
+            except Exception:
+                self._pending_history[:0] = batch
+                raise
+    
+    def _write_history(self, data: bytes):
+        """Append síncrono do histórico (executado fora do event loop)"""
+        _write_file(self.history_path, data, 'ab')
     
     def stop_background_monitoring(self):
-        """Para monitoramento em background"""
+        """Para monitoramento em background (aclose() também grava os registros pendentes)"""
         self._running = False
         
         for task in self._background_tasks:
@@ -914,115 +1488,148 @@ Contexto detalhado:
         
         self._background_tasks.clear()
     
+    async def flush_logs(self):
+        """Grava as entradas de log e de histórico de alertas ainda pendentes"""
+        for sender in self.notification_senders.values():
+            if isinstance(sender, FileSender):
+                await sender.flush()
+        await self.flush_history()
+    
+    async def aclose(self):
+        """Para o monitoramento, grava logs pendentes e libera a sessão HTTP compartilhada"""
+        self.stop_background_monitoring()
+        
+        # Cancelar escalações agendadas
+        for timer in self._escalation_timers.values():
+            timer.cancel()
+        self._escalation_timers.clear()
+        for task in list(self._escalation_tasks):
+            task.cancel()
+        
+        await self.flush_logs()
+        await NotificationSender.close_http_session()
+    
     def export_alerts(self, format: str = 'json') -> str:
         """Exporta alertas para arquivo"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        export_dir = Path("data/alerts/exports")
-        export_dir.mkdir(parents=True, exist_ok=True)
+        filename, export_data = self._build_export(format)
+        self._write_export(filename, export_data)
+        self._log_export(format, filename)
+        return str(filename)
+    
+    async def export_alerts_async(self, format: str = 'json') -> str:
+        """Exporta alertas sem bloquear o event loop (serialização e escrita em thread)"""
+        filename, export_data = self._build_export(format)
+        await asyncio.to_thread(self._write_export, filename, export_data)
+        self._log_export(format, filename)
+        return str(filename)
+    
+    def _build_export(self, format: str) -> Tuple[Path, Dict[str, Any]]:
+        """Monta o snapshot a exportar (no thread chamador, para ser consistente)"""
+        if format != 'json':
+            raise ValueError(f"Unsupported export format: {format}")
         
-        if format == 'json':
-            filename = export_dir / f"alerts_export_{timestamp}.json"
-            
-            export_data = {
-                'timestamp': timestamp,
-                'active_alerts': [asdict(alert) for alert in self.active_alerts.values()],
-                'alert_history': [asdict(alert) for alert in list(self.alert_history)[-100:]],  # Últimos 100
-                'statistics': self.get_alert_stats(),
-                'rules': {name: asdict(rule) for name, rule in self.alert_rules.items()}
-            }
-            
-            # Converter enums para strings
-            def convert_enums(obj):
-                if isinstance(obj, dict):
-                    return {k: convert_enums(v) for k, v in obj.items()}
-                elif isinstance(obj, list):
-                    return [convert_enums(item) for item in obj]
-                elif isinstance(obj, Enum):
-                    return obj.value
-                else:
-                    return obj
-            
-            export_data = convert_enums(export_data)
-            
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
+        filename = self._export_dir / f"alerts_export_{timestamp}.json"
         
+        export_data = {
+            'timestamp': timestamp,
+            'active_alerts': [alert.to_dict() for alert in list(self.active_alerts.values())],
+            'alert_history': self.alert_history.records(last=100),  # Últimos 100
+            'statistics': self.get_alert_stats(),
+            'rules': {name: rule.to_dict() for name, rule in self.alert_rules.items()}
+        }
+        
+        return filename, export_data
+    
+    @staticmethod
+    def _write_export(filename: Path, export_data: Dict[str, Any]):
+        """Serializa e grava a exportação (orjson quando disponível)"""
+        payload = None
+        if HAS_ORJSON:
+            try:
+                payload = orjson.dumps(
+                    export_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            except TypeError:
+                pass
+        if payload is None:
+            # Enums restantes (ex.: dentro de contexto/metadata) viram seus valores
+            payload = json.dumps(
+                export_data, indent=2, ensure_ascii=False, default=_enum_value
+            ).encode('utf-8')
+        
+        _write_file(filename, payload)
+    
+    def _log_export(self, format: str, filename: Path):
+        """Registra a exportação no log estruturado"""
         if structured_logger:
             structured_logger.info(
                 f"Alerts exported to {filename}",
                 component=Component.SYSTEM,
                 context={'format': format, 'filename': str(filename)}
             )
-        
-        return str(filename)
 
 
 # Instância global
 alert_system = AlertSystem()
 
 
-# Configurações padrão para integração
+# Configurações padrão para integração (regras construídas uma vez na carga do módulo)
+_DEFAULT_RULES: Tuple[AlertRule, ...] = (
+    AlertRule(
+        name="scraper_high_error_rate",
+        description="Taxa de erro do scraper muito alta",
+        condition="error_rate > 20%",
+        threshold=20.0,
+        severity=AlertSeverity.HIGH,
+        channels=[NotificationChannel.CONSOLE, NotificationChannel.FILE],
+        cooldown_minutes=30,
+        escalation_after_minutes=120,
+        escalation_severity=AlertSeverity.CRITICAL
+    ),
+    AlertRule(
+        name="circuit_breaker_open",
+        description="Circuit breaker aberto - sistema sobrecarregado",
+        condition="circuit_breaker_state = OPEN",
+        threshold=1.0,
+        severity=AlertSeverity.HIGH,
+        channels=[NotificationChannel.CONSOLE, NotificationChannel.FILE],
+        cooldown_minutes=15
+    ),
+    AlertRule(
+        name="data_quality_degraded",
+        description="Qualidade dos dados degradada",
+        condition="quality_score < 70%",
+        threshold=70.0,
+        severity=AlertSeverity.MEDIUM,
+        channels=[NotificationChannel.CONSOLE, NotificationChannel.FILE],
+        cooldown_minutes=60
+    ),
+    AlertRule(
+        name="system_performance_slow",
+        description="Performance do sistema degradada",
+        condition="avg_response_time > 10s",
+        threshold=10.0,
+        severity=AlertSeverity.MEDIUM,
+        channels=[NotificationChannel.CONSOLE, NotificationChannel.FILE],
+        cooldown_minutes=45
+    ),
+    AlertRule(
+        name="critical_system_failure",
+        description="Falha crítica do sistema",
+        condition="multiple_systems_down",
+        threshold=1.0,
+        severity=AlertSeverity.CRITICAL,
+        channels=[NotificationChannel.CONSOLE, NotificationChannel.FILE],
+        cooldown_minutes=5,
+        escalation_after_minutes=30
+    )
+)
+
+
 def setup_default_alert_rules():
-    """Configura regras de alerta padrão"""
-    default_rules = [
-        AlertRule(
-            name="scraper_high_error_rate",
-            description="Taxa de erro do scraper muito alta",
-            condition="error_rate > 20%",
-            threshold=20.0,
-            severity=AlertSeverity.HIGH,
-            channels=[NotificationChannel.CONSOLE, NotificationChannel.FILE],
-            cooldown_minutes=30,
-            escalation_after_minutes=120,
-            escalation_severity=AlertSeverity.CRITICAL
-        ),
-        AlertRule(
-            name="circuit_breaker_open",
-            description="Circuit breaker aberto - sistema sobrecarregado",
-            condition="circuit_breaker_state = OPEN",
-            threshold=1.0,
-            severity=AlertSeverity.HIGH,
-            channels=[NotificationChannel.CONSOLE, NotificationChannel.FILE],
-            cooldown_minutes=15
-        ),
-        AlertRule(
-            name="data_quality_degraded",
-            description="Qualidade dos dados degradada",
-            condition="quality_score < 70%",
-            threshold=70.0,
-            severity=AlertSeverity.MEDIUM,
-            channels=[NotificationChannel.CONSOLE, NotificationChannel.FILE],
-            cooldown_minutes=60
-        ),
-        AlertRule(
-            name="system_performance_slow",
-            description="Performance do sistema degradada",
-            condition="avg_response_time > 10s",
-            threshold=10.0,
-            severity=AlertSeverity.MEDIUM,
-            channels=[NotificationChannel.CONSOLE, NotificationChannel.FILE],
-            cooldown_minutes=45
-        ),
-        AlertRule(
-            name="critical_system_failure",
-            description="Falha crítica do sistema",
-            condition="multiple_systems_down",
-            threshold=1.0,
-            severity=AlertSeverity.CRITICAL,
-            channels=[NotificationChannel.CONSOLE, NotificationChannel.FILE],
-            cooldown_minutes=5,
-            escalation_after_minutes=30
-        )
-    ]
-    
-    for rule in default_rules:
-        alert_system.add_alert_rule(rule)
-    
-    if structured_logger:
-        structured_logger.info(
-            f"Default alert rules configured: {len(default_rules)}",
-            component=Component.SYSTEM
-        )
+    """Configura regras de alerta padrão (add_alert_rules registra o log)"""
+    alert_system.add_alert_rules(_DEFAULT_RULES)
 
 
 # Função de conveniência para disparar alertas
@@ -147,12 +147,13 @@ class PerformanceTracker:
         self.start_time = time.time()
         self.context.update(context)
         
-        self.logger.debug(
-            f"Started operation: {self.operation}",
-            component=self.component,
-            operation=self.operation,
-            context=self.context
-        )
+        if self.logger.is_enabled_for(LogLevel.DEBUG):
+            self.logger.debug(
+                f"Started operation: {self.operation}",
+                component=self.component,
+                operation=self.operation,
+                context=self.context
+            )
         
         return self
     
@@ -291,8 +292,14 @@ class StructuredLogger:
         
         return record
     
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Indica se mensagens do nível informado seriam registradas"""
+        return self.logger.isEnabledFor(getattr(logging, level.value))
+    
     def log(self, level: LogLevel, message: str, component: Component = Component.SYSTEM, **kwargs):
         """Log genérico com nível especificado"""
+        if not self.is_enabled_for(level):
+            return
         record = self._create_log_record(level, message, component=component.value, **kwargs)
         self.logger.handle(record)
     
@@ -348,12 +355,15 @@ class StructuredLogger:
     def trace_operation(self, operation: str, component: Component = Component.SYSTEM):
         """Context manager para traced operations"""
         with self.trace_context.trace(operation) as trace_id:
-            self.debug(
-                f"Starting traced operation: {operation}",
-                component=component,
-                operation=operation,
-                trace_id=trace_id
-            )
+            # Mensagens de debug só são formatadas se o nível estiver ativo
+            debug_enabled = self.is_enabled_for(LogLevel.DEBUG)
+            if debug_enabled:
+                self.debug(
+                    f"Starting traced operation: {operation}",
+                    component=component,
+                    operation=operation,
+                    trace_id=trace_id
+                )
             try:
                 yield trace_id
             except Exception as e:
@@ -366,18 +376,23 @@ class StructuredLogger:
                 )
                 raise
             finally:
-                self.debug(
-                    f"Finished traced operation: {operation}",
-                    component=component,
-                    operation=operation,
-                    trace_id=trace_id
-                )
+                if debug_enabled:
+                    self.debug(
+                        f"Finished traced operation: {operation}",
+                        component=component,
+                        operation=operation,
+                        trace_id=trace_id
+                    )
     
     def track_performance(self, component: Component, operation: str):
         """Cria um performance tracker"""
         return PerformanceTracker(self, component, operation)
     
     # Métodos utilitários
+    def set_level(self, level: LogLevel):
+        """Altera o nível mínimo do logger (mensagens abaixo dele nem são montadas)"""
+        self.logger.setLevel(getattr(logging, level.value))
+    
     def set_console_level(self, level: LogLevel):
         """Altera o nível de log do console"""
         for handler in self.logger.handlers:
@@ -459,23 +474,27 @@ def log_function_call(component: Component = Component.SYSTEM, level: LogLevel =
             operation = f"{func.__module__}.{func.__name__}"
             
             with structured_logger.track_performance(component, operation) as tracker:
-                structured_logger.log(
-                    level,
-                    f"Calling function: {func.__name__}",
-                    component=component,
-                    operation=operation,
-                    context={'args_count': len(args), 'kwargs_count': len(kwargs)}
-                )
-                
-                try:
-                    result = func(*args, **kwargs)
+                # Checar o nível antes de formatar as mensagens e montar o contexto
+                enabled = structured_logger.is_enabled_for(level)
+                if enabled:
                     structured_logger.log(
                         level,
-                        f"Function completed: {func.__name__}",
+                        f"Calling function: {func.__name__}",
                         component=component,
                         operation=operation,
-                        success=True
+                        context={'args_count': len(args), 'kwargs_count': len(kwargs)}
                     )
+                
+                try:
+                    result = func(*args, **kwargs)
+                    if enabled:
+                        structured_logger.log(
+                            level,
+                            f"Function completed: {func.__name__}",
+                            component=component,
+                            operation=operation,
+                            success=True
+                        )
                     return result
                 except Exception as e:
                     structured_logger.error(
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Teste dos Relatórios de Inteligência de Mercado
+
+Verifica que o cache de análises salariais por vaga não deixa de alimentar
+o histórico do analisador de salários e que a classificação por categoria
+segue a semântica de match, em tempo linear no tamanho do texto.
+"""
+
+import subprocess
+import sys
+import os
+import tempfile
+import time
+from unittest.mock import patch
+
+import pandas as pd
+
+# Adicionar diretório raiz ao path
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+
+JOB = {
+    'titulo': 'Desenvolvedor Python Senior',
+    'empresa': 'Empresa A',
+    'localizacao': 'São Paulo - SP',
+    'salario': 'R$ 8000 - R$ 12000',
+    'descricao': 'Vaga para desenvolvimento de sistemas',
+    'link': 'https://example.com/vaga/1'
+}
+
+
+def test_cached_salary_analysis_is_still_recorded():
+    """Vagas repetidas reaproveitam a extração, mas entram no histórico a cada análise"""
+    print("🧪 TESTE: cache salarial mantém o registro no histórico")
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            from src.business_intelligence.salary_trend_analyzer import SalaryTrendAnalyzer
+            from src.business_intelligence.market_intelligence_reports import MarketIntelligenceReports
+
+            salary_analyzer = SalaryTrendAnalyzer(os.path.join(tmp, 'salary_trends.json'))
+            reports = MarketIntelligenceReports(os.path.join(tmp, 'market_reports.json'))
+            reports.analyzers = {'salary': salary_analyzer}
+
+            history = salary_analyzer.salary_data["historical_data"]
+            samples_before = salary_analyzer.salary_data["statistics"]["total_samples"]
+
+            with patch.object(salary_analyzer, 'extract_job_salary',
+                              wraps=salary_analyzer.extract_job_salary) as extract:
+                first = reports._analyze_job_salary(dict(JOB))
+                second = reports._analyze_job_salary(dict(JOB))
+
+            assert extract.call_count == 1, "extração deveria vir do cache na segunda vez"
+            assert first['salary_avg'] == second['salary_avg'] == 10000
+            assert len(history) == 2
+            assert history[0] is first and history[1] is second
+            assert salary_analyzer.salary_data["statistics"]["total_samples"] == samples_before + 2
+
+            reports.flush()
+        finally:
+            os.chdir(cwd)
+
+    print("✅ Histórico salarial alimentado a cada análise")
+
+
+def test_dashboard_cache_hit_records_salaries():
+    """Dashboard em cache continua alimentando o histórico e não retém a lista de vagas"""
+    print("🧪 TESTE: cache de dashboards")
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            from src.business_intelligence.salary_trend_analyzer import SalaryTrendAnalyzer
+            from src.business_intelligence.market_intelligence_reports import MarketIntelligenceReports
+
+            salary_analyzer = SalaryTrendAnalyzer(os.path.join(tmp, 'salary_trends.json'))
+            reports = MarketIntelligenceReports(os.path.join(tmp, 'market_reports.json'))
+            reports.analyzers = {'salary': salary_analyzer}
+            history = salary_analyzer.salary_data["historical_data"]
+
+            jobs = [dict(JOB), dict(JOB, link='https://example.com/vaga/2', tags=['python'])]
+            first = reports.generate_executive_dashboard(jobs)
+            second = reports.generate_executive_dashboard([dict(job) for job in jobs])
+
+            assert second == first
+            assert reports.reports_data["statistics"]["dashboard_cache_hits"] == 1
+            assert len(history) == 4, "análises do dashboard em cache deveriam ser registradas"
+            assert all(isinstance(entry, dict) for entry in reports._dashboard_cache.values())
+
+            # Alteração no conteúdo gera novo dashboard
+            jobs[1]['tags'].append('django')
+            reports.generate_executive_dashboard(jobs)
+            assert reports.reports_data["statistics"]["dashboard_cache_hits"] == 1
+            assert len(reports._dashboard_cache) == 2
+
+            reports.flush()
+        finally:
+            os.chdir(cwd)
+
+    print("✅ Cache por conteúdo, com registro no histórico")
+
+
+def test_category_codes_on_long_texts():
+    """Descrições longas sem palavra-chave não tornam a classificação quadrática"""
+    print("🧪 TESTE: classificação por categoria em textos longos")
+
+    from src.business_intelligence.market_intelligence_reports import (
+        MarketIntelligenceReports, _first_category_codes
+    )
+
+    pattern = MarketIntelligenceReports._WORK_TYPE_RE
+    texts = pd.Series([
+        'descrição sem modalidade definida ' * 300,
+        'vaga pj ' + 'detalhes ' * 1000 + 'clt',
+        'estagio ou contrato temporario',
+        ''
+    ])
+
+    start = time.perf_counter()
+    codes = _first_category_codes(texts, pattern)
+    elapsed = time.perf_counter() - start
+
+    expected = [
+        list(MarketIntelligenceReports._WORK_TYPE_KEYWORDS).index(match.lastgroup) if match else 4
+        for match in map(pattern.match, texts)
+    ]
+    assert list(codes) == expected == [4, 0, 2, 4]
+    assert elapsed < 0.5, f"classificação levou {elapsed:.2f}s"
+
+    print("✅ Classificação linear e igual ao match")
+
+
+def test_analyzers_loaded_on_first_use():
+    """Importar os relatórios não carrega os demais módulos de BI; acessar analyzers carrega"""
+    print("🧪 TESTE: analisadores de BI carregados sob demanda")
+
+    # Processo separado: os módulos podem já ter sido importados por outros testes
+    script = (
+        "import sys\n"
+        "from src.business_intelligence.market_intelligence_reports import market_intelligence\n"
+        "loaded = {m for m in sys.modules if m.startswith('src.business_intelligence.')}\n"
+        "assert loaded == {'src.business_intelligence.market_intelligence_reports'}, loaded\n"
+        "from src.business_intelligence import regional_heatmap, salary_trend_analyzer\n"
+        "assert market_intelligence.analyzers['regional'] is regional_heatmap\n"
+        "assert market_intelligence.analyzers['salary'] is salary_trend_analyzer\n"
+        "assert type(salary_trend_analyzer).__name__ == 'SalaryTrendAnalyzer'\n"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        result = subprocess.run(
+            [sys.executable, '-c', script], cwd=tmp, capture_output=True, text=True,
+            env=dict(os.environ, PYTHONPATH=ROOT)
+        )
+    assert result.returncode == 0, result.stderr
+
+    print("✅ Analisadores carregados só no primeiro uso")
+
+
+def main():
+    test_cached_salary_analysis_is_still_recorded()
+    test_dashboard_cache_hit_records_salaries()
+    test_category_codes_on_long_texts()
+    test_analyzers_loaded_on_first_use()
+
+
+if __name__ == "__main__":
+    main()
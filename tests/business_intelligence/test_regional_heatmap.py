@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Teste do Mapa de Calor Regional
+
+Compara a agregação vetorizada de analyze_jobs_by_region com uma agregação
+de referência linha a linha e verifica a normalização de regiões.
+"""
+
+import random
+import statistics
+import sys
+import os
+import tempfile
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+# Adicionar diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+LOCATIONS = [
+    'São Paulo - SP', 'Rio de Janeiro, RJ', 'Campinas', 'Home Office', 'remoto',
+    'Belo Horizonte/MG', 'Curitiba', '', None, 'Brasilia DF', 'Niterói', 'sp',
+    'Espírito Santo'
+]
+SALARIES = [
+    'R$ 5.000', 'R$ 3000 - R$ 6000', 'a combinar', 'Não informado', '5k', '10 mil',
+    'R$ 8.500,00', None, '', 'R$ 60000', 'R$ 1.200'
+]
+TITLES = ['Dev Python', 'Dev Java', 'Analista', 'QA', 'Dev Python Sr', 'DBA', 'PO', '']
+COMPANIES = ['A', 'B', 'C', 'D', 'E', '']
+
+
+def _make_heatmap(tmp: str):
+    """Cria um RegionalHeatmap gravando no diretório temporário"""
+    from src.business_intelligence.regional_heatmap import RegionalHeatmap
+    return RegionalHeatmap(os.path.join(tmp, 'regional_heatmap.json'))
+
+
+def _make_jobs(rng: random.Random, count: int):
+    base = datetime(2026, 1, 1)
+    jobs = []
+    for _ in range(count):
+        day = int(rng.triangular(0, 12, rng.choice([0, 12])))
+        jobs.append({
+            'titulo': rng.choice(TITLES),
+            'empresa': rng.choice(COMPANIES),
+            'localizacao': rng.choice(LOCATIONS),
+            'salario': rng.choice(SALARIES),
+            'data_coleta': rng.choice([
+                (base + timedelta(days=day, hours=rng.randint(0, 23))).isoformat(),
+                None,
+                'data inválida'
+            ])
+        })
+    return jobs
+
+
+def _reference_growth(timestamps):
+    """Tendência de crescimento calculada linha a linha"""
+    if len(timestamps) < 10:
+        return 'stable'
+
+    daily_counts = defaultdict(int)
+    for timestamp in timestamps:
+        try:
+            daily_counts[datetime.fromisoformat(timestamp).date()] += 1
+        except (TypeError, ValueError):
+            continue
+
+    counts = [count for _, count in sorted(daily_counts.items())][-7:]
+    if len(counts) < 3:
+        return 'stable'
+
+    first_half = statistics.mean(counts[:len(counts) // 2])
+    second_half = statistics.mean(counts[len(counts) // 2:])
+    if second_half > first_half * 1.2:
+        return 'growing'
+    if second_half < first_half * 0.8:
+        return 'declining'
+    return 'stable'
+
+
+def _reference_aggregation(heatmap, jobs):
+    """Agregação de referência: uma vaga por vez, com os métodos escalares"""
+    groups = {}
+    for job in jobs:
+        region = heatmap.normalize_region(job.get('localizacao') or '')
+        group = groups.setdefault(region, {'titles': [], 'companies': [], 'salaries': [], 'timestamps': []})
+        group['titles'].append(job.get('titulo') or '')
+        group['companies'].append(job.get('empresa') or '')
+        group['timestamps'].append(job.get('data_coleta', datetime.now().isoformat()))
+        salary = heatmap.extract_salary_value(job.get('salario') or '')
+        if salary:
+            group['salaries'].append(salary)
+
+    reference = {}
+    for region, group in groups.items():
+        salaries = group['salaries']
+        job_count = len(group['titles'])
+        growth = _reference_growth(group['timestamps'])
+        competition = heatmap._calculate_competition_level(job_count, len(set(group['companies'])))
+        avg_salary = statistics.mean(salaries) if salaries else 0
+        reference[region] = {
+            'job_count': job_count,
+            'avg_salary': avg_salary,
+            'salary_range': (min(salaries), max(salaries)) if salaries else (0, 0),
+            'top_positions': [title for title, _ in Counter(group['titles']).most_common(5)],
+            'growth_trend': growth,
+            'competition_level': competition
+        }
+    return reference
+
+
+def test_vectorized_aggregation_matches_reference():
+    """analyze_jobs_by_region agrega igual à referência linha a linha"""
+    print("🧪 TESTE: agregação regional vetorizada x referência")
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            heatmap = _make_heatmap(tmp)
+            rng = random.Random(7)
+
+            for _ in range(20):
+                jobs = _make_jobs(rng, rng.randint(0, 150))
+                result = heatmap.analyze_jobs_by_region(jobs)
+                reference = _reference_aggregation(heatmap, jobs)
+
+                assert list(result) == list(reference)
+                for region, expected in reference.items():
+                    data = result[region]
+                    assert data.job_count == expected['job_count']
+                    assert abs(data.avg_salary - expected['avg_salary']) < 1e-6
+                    assert data.salary_range == expected['salary_range']
+                    assert data.top_positions == expected['top_positions']
+                    assert data.growth_trend == expected['growth_trend'], region
+                    assert data.competition_level == expected['competition_level']
+                    assert data.opportunity_score == heatmap._calculate_opportunity_score(
+                        data.job_count, data.avg_salary, data.competition_level, data.growth_trend
+                    )
+
+            heatmap.flush()
+        finally:
+            os.chdir(cwd)
+
+    print("✅ Agregação equivalente")
+
+
+def test_missing_collection_date_is_not_counted_as_today():
+    """Só vagas sem data_coleta recebem a data atual; None não conta como hoje"""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            heatmap = _make_heatmap(tmp)
+            frame = heatmap._jobs_to_frame([
+                {'titulo': 'Dev', 'data_coleta': None},
+                {'titulo': 'Dev'}
+            ])
+        finally:
+            os.chdir(cwd)
+
+    assert pd.isna(frame['data_coleta'].iloc[0])
+    assert frame['data_coleta'].iloc[1].startswith(datetime.now().date().isoformat())
+    print("✅ data_coleta ausente e None tratadas separadamente")
+
+
+def test_abbreviations_match_whole_words_only():
+    """Siglas de estado só casam como palavra inteira"""
+    print("🧪 TESTE: normalização de regiões por palavra inteira")
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            heatmap = _make_heatmap(tmp)
+        finally:
+            os.chdir(cwd)
+
+    cases = {
+        'São Paulo - SP': 'São Paulo',
+        'Espírito Santo': 'Outras',
+        'Vespasiano': 'Outras',
+        'Rio de Janeiro/RJ': 'Rio de Janeiro',
+        'Uberlândia, MG': 'Minas Gerais',
+        'Brasília - DF': 'Brasília',
+        'Campinas': 'São Paulo',
+        'Remoto - São Paulo, SP': 'São Paulo',
+        'Home Office': 'Remoto',
+        '': 'Não especificado',
+        None: 'Não especificado'
+    }
+
+    vectorized = heatmap.normalize_region_series(pd.Series(list(cases)))
+    for (location, expected), bulk in zip(cases.items(), vectorized):
+        assert heatmap.normalize_region(location) == expected, location
+        assert bulk == expected, location
+
+    print("✅ Siglas casadas só como palavra inteira")
+
+
+def main():
+    test_vectorized_aggregation_matches_reference()
+    test_missing_collection_date_is_not_counted_as_today()
+    test_abbreviations_match_whole_words_only()
+
+
+if __name__ == "__main__":
+    main()
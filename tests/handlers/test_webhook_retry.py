@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Teste do retry de envio de webhooks
+
+Verifica o back-off com Retry-After, a repetição só de erros transitórios
+e que o POST bloqueante roda fora do event loop.
+"""
+
+import asyncio
+import sys
+import os
+import tempfile
+import threading
+from unittest.mock import AsyncMock, patch
+
+# Adicionar diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import requests
+
+from src.handlers.webhook_handler import WebhookHandler
+
+
+class ScriptedWebhookHandler(WebhookHandler):
+    """WebhookHandler cujo POST devolve respostas (ou erros) roteirizados"""
+
+    def __init__(self, responses):
+        super().__init__()
+        self.responses = list(responses)
+        self.calls = 0
+        self.post_threads = []
+
+    def _post_once(self, url, data, headers):
+        self.calls += 1
+        self.post_threads.append(threading.get_ident())
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def _run_post(responses):
+    """Executa _post_with_retry num diretório temporário, sem esperas reais"""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            handler = ScriptedWebhookHandler(responses)
+            with patch('src.handlers.webhook_handler.asyncio.sleep', new=AsyncMock()) as sleep:
+                async def post():
+                    return await handler._post_with_retry(
+                        'https://example.com/hook', b'{}', {}
+                    ), threading.get_ident()
+                try:
+                    result, loop_thread = asyncio.run(post())
+                except Exception as e:
+                    result, loop_thread = e, None
+            return handler, sleep, result, loop_thread
+        finally:
+            os.chdir(cwd)
+
+
+def test_retry_after_is_honored():
+    """429 com Retry-After espera o tempo indicado e repete"""
+    handler, sleep, result, loop_thread = _run_post([(429, '2'), (200, None)])
+
+    assert result is True
+    assert handler.calls == 2
+    sleep.assert_awaited_once_with(2.0)
+    assert loop_thread not in handler.post_threads, "POST executado no thread do event loop"
+    print("✅ Retry-After respeitado")
+
+
+def test_retry_after_is_capped():
+    """Retry-After acima do máximo da estratégia é limitado a max_delay"""
+    handler, sleep, result, _ = _run_post([(503, '3600'), (204, None)])
+
+    assert result is True
+    sleep.assert_awaited_once_with(WebhookHandler.RETRY_STRATEGY.max_delay)
+    print("✅ Retry-After limitado")
+
+
+def test_connection_errors_are_retried():
+    """Falhas de conexão e timeout são repetidas"""
+    handler, _, result, _ = _run_post([
+        requests.ConnectionError("recusada"),
+        requests.Timeout("timeout"),
+        (200, None)
+    ])
+
+    assert result is True
+    assert handler.calls == 3
+    print("✅ Erros transitórios repetidos")
+
+
+def test_configuration_errors_are_not_retried():
+    """URL sem esquema falha na primeira tentativa"""
+    handler, sleep, result, _ = _run_post([requests.exceptions.MissingSchema("sem esquema")])
+
+    assert isinstance(result, requests.exceptions.MissingSchema)
+    assert handler.calls == 1
+    sleep.assert_not_awaited()
+    print("✅ Erro de configuração não repetido")
+
+
+def test_client_errors_are_not_retried():
+    """Status 4xx (exceto 429) não é repetido"""
+    handler, _, result, _ = _run_post([(404, None)])
+
+    assert result is False
+    assert handler.calls == 1
+    print("✅ 404 não repetido")
+
+
+def main():
+    test_retry_after_is_honored()
+    test_retry_after_is_capped()
+    test_connection_errors_are_retried()
+    test_configuration_errors_are_not_retried()
+    test_client_errors_are_not_retried()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Teste da persistência do Sistema de Feedback do Usuário
+
+Verifica a gravação das interações (individuais e em lote) no banco SQLite
+e a migração única do arquivo JSON legado.
+"""
+
+import json
+import sys
+import os
+import tempfile
+
+# Adicionar diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+JOB = {
+    'job_id': 'vaga-1',
+    'titulo': 'Desenvolvedor Python',
+    'empresa': 'Empresa A',
+    'localizacao': 'São Paulo',
+    'skills': ['python', 'django']
+}
+
+
+def _make_system(tmp: str):
+    """Cria um UserFeedbackSystem com os dados no diretório temporário"""
+    from src.ml.user_feedback_system import UserFeedbackSystem
+    return UserFeedbackSystem(os.path.join(tmp, 'ml', 'user_feedback.json'))
+
+
+def _in_tmp(test):
+    """Executa o teste com o diretório temporário como diretório atual"""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            test(tmp)
+        finally:
+            os.chdir(cwd)
+
+
+def test_batched_interactions_persisted():
+    """record_interactions grava o lote numa transação e o estado sobrevive a uma nova instância"""
+    print("🧪 TESTE: lote de interações persistido no SQLite")
+
+    def scenario(tmp):
+        system = _make_system(tmp)
+        system.record_interaction('u1', JOB, 'view', 0.5)
+        created = system.record_interactions('u1', [
+            {'job_data': JOB, 'interaction_type': 'like', 'match_score': 0.8,
+             'skills_overlap': ['python'], 'metadata': {'source': 'lista'}},
+            {'job_data': dict(JOB, job_id='vaga-2'), 'interaction_type': 'apply'}
+        ])
+
+        assert [i.interaction_type for i in created] == ['like', 'apply']
+        assert created[0].timestamp == created[1].timestamp
+        assert created[0].metadata['source'] == 'lista'
+        assert created[0].metadata['company'] == 'Empresa A'
+        assert created[1].match_score == 0.0
+        assert system.record_interactions('u1', []) == []
+        system.conn.close()
+
+        reopened = _make_system(tmp)
+        interactions = reopened.feedback_data["interactions"]
+        assert [i['interaction_type'] for i in interactions] == ['view', 'like', 'apply']
+        assert interactions[1]['metadata']['source'] == 'lista'
+
+        prefs = reopened.feedback_data["user_preferences"]['u1']
+        assert prefs['total_interactions'] == 3
+        assert prefs['interaction_patterns'] == {'view': 1, 'like': 1, 'apply': 1}
+        assert prefs['preferred_skills'] == {'python': 0.3}
+        assert reopened.feedback_data["last_update"] is not None
+        reopened.conn.close()
+
+    _in_tmp(scenario)
+    print("✅ Interações e preferências recarregadas do banco")
+
+
+def test_instances_sharing_database_keep_each_others_updates():
+    """Duas instâncias no mesmo banco somam as preferências em vez de sobrescrevê-las"""
+    print("🧪 TESTE: instâncias concorrentes no mesmo banco")
+
+    def scenario(tmp):
+        first = _make_system(tmp)
+        second = _make_system(tmp)
+
+        first.record_interaction('u2', JOB, 'like', 0.8, ['python'])
+        second.record_interaction('u2', JOB, 'apply', 0.9, ['python'])
+
+        prefs = second.feedback_data["user_preferences"]['u2']
+        assert prefs['total_interactions'] == 2
+        assert prefs['interaction_patterns'] == {'like': 1, 'apply': 1}
+        assert abs(prefs['preferred_skills']['python'] - 1.0) < 1e-9
+        first.conn.close()
+        second.conn.close()
+
+        reopened = _make_system(tmp)
+        assert reopened.feedback_data["user_preferences"]['u2']['total_interactions'] == 2
+        assert len(reopened.feedback_data["interactions"]) == 2
+        reopened.conn.close()
+
+    _in_tmp(scenario)
+    print("✅ Atualizações das duas instâncias preservadas")
+
+
+def test_legacy_json_migrated_once():
+    """O JSON legado é importado uma vez e renomeado; limpar o banco não o reimporta"""
+    print("🧪 TESTE: migração única do JSON legado")
+
+    def scenario(tmp):
+        legacy_path = os.path.join(tmp, 'ml', 'user_feedback.json')
+        os.makedirs(os.path.dirname(legacy_path))
+        with open(legacy_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'interactions': [{'user_id': 'u1', 'job_id': 'vaga-0', 'interaction_type': 'like'}],
+                'user_preferences': {'u1': {'learning_confidence': 0.05, 'total_interactions': 1}}
+            }, f)
+
+        system = _make_system(tmp)
+        assert len(system.feedback_data["interactions"]) == 1
+        assert not os.path.exists(legacy_path)
+        assert os.path.exists(legacy_path + '.migrated')
+
+        # Banco sem interações não reimporta o arquivo já migrado
+        system.conn.execute('DELETE FROM interactions')
+        system.conn.close()
+        reopened = _make_system(tmp)
+        assert reopened.feedback_data["interactions"] == []
+        assert 'u1' in reopened.feedback_data["user_preferences"]
+        reopened.conn.close()
+
+    _in_tmp(scenario)
+    print("✅ JSON legado migrado uma única vez")
+
+
+def main():
+    test_batched_interactions_persisted()
+    test_instances_sharing_database_keep_each_others_updates()
+    test_legacy_json_migrated_once()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Teste do envio HTTP do Sistema de Alertas
+
+Verifica que o aiohttp só é importado no primeiro envio HTTP e que a sessão
+HTTP compartilhada de um event loop anterior é fechada ao ser substituída.
+"""
+
+import asyncio
+import gc
+import subprocess
+import sys
+import os
+import threading
+import warnings
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+# Adicionar diretório raiz ao path
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+
+def test_aiohttp_imported_on_first_http_send():
+    """Importar o sistema de alertas não carrega o aiohttp; o primeiro envio HTTP carrega"""
+    print("🧪 TESTE: aiohttp importado sob demanda")
+
+    # Processo separado: o aiohttp pode já ter sido importado por outros testes
+    script = (
+        "import sys\n"
+        "from src.systems import alert_system\n"
+        "assert 'aiohttp' not in sys.modules\n"
+        "assert alert_system.HAS_AIOHTTP is None\n"
+        "module = alert_system.NotificationSender._load_aiohttp()\n"
+        "assert module is sys.modules['aiohttp']\n"
+        "assert alert_system.HAS_AIOHTTP is True\n"
+        "assert alert_system.NotificationSender._load_aiohttp() is module\n"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', script], cwd=ROOT, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+
+    print("✅ aiohttp carregado só no primeiro envio")
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    """Responde 200 a qualquer POST"""
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_session_from_previous_loop_is_closed():
+    """Trocar de event loop fecha a sessão anterior em vez de vazá-la"""
+    print("🧪 TESTE: sessão HTTP de loop anterior fechada")
+
+    from src.systems.alert_system import NotificationSender, NotificationConfig, NotificationChannel
+
+    if NotificationSender._load_aiohttp() is None:
+        print("⚠️ aiohttp não instalado, teste ignorado")
+        return
+
+    server = HTTPServer(('127.0.0.1', 0), _OkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/hook"
+    sender = NotificationSender(NotificationConfig(channel=NotificationChannel.WEBHOOK))
+
+    try:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+
+            assert asyncio.run(sender._post_json(url, {'n': 1})) == 200
+            first_session = NotificationSender._http_session
+            assert asyncio.run(sender._post_json(url, {'n': 2})) == 200
+
+            assert NotificationSender._http_session is not first_session
+            assert first_session.closed
+            del first_session
+            gc.collect()
+
+        asyncio.run(NotificationSender.close_http_session())
+        unclosed = [str(w.message) for w in caught if 'Unclosed' in str(w.message)]
+        assert not unclosed, unclosed
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print("✅ Sessão anterior fechada")
+
+
+def main():
+    test_aiohttp_imported_on_first_http_send()
+    test_session_from_previous_loop_is_closed()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Teste da persistência do Sistema de Alertas
+
+Verifica que as gravações em lote (log do FileSender e histórico de alertas)
+não perdem entradas que chegam durante uma gravação em andamento nem
+entradas de gravações que falharam.
+"""
+
+import asyncio
+import json
+import time
+import sys
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+# Adicionar diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.systems.alert_system import (
+    AlertSystem, AlertRule, FileSender, NotificationConfig, NotificationChannel,
+    AlertInstance, AlertSeverity, AlertStatus, AlertHistoryBuffer
+)
+
+
+def _make_alert(alert_id: str) -> AlertInstance:
+    now = time.time()
+    return AlertInstance(
+        id=alert_id,
+        rule_name="test_rule",
+        title="Alerta de Teste",
+        description="Descrição",
+        severity=AlertSeverity.MEDIUM,
+        status=AlertStatus.ACTIVE,
+        created_at=now,
+        last_triggered=now
+    )
+
+
+class SlowFileSender(FileSender):
+    """FileSender com escrita lenta, para abrir a janela de gravação em andamento"""
+
+    def _write_batch(self, data: bytes):
+        time.sleep(0.05)
+        super()._write_batch(data)
+
+
+def test_file_sender_keeps_entries_sent_during_flush():
+    """Alertas enviados durante uma gravação entram no lote seguinte"""
+    print("🧪 TESTE: FileSender não perde alertas durante a gravação")
+
+    async def scenario(log_path: Path):
+        sender = SlowFileSender(NotificationConfig(
+            channel=NotificationChannel.FILE,
+            config={'file_path': str(log_path)}
+        ))
+
+        first = asyncio.create_task(sender._send_notification(_make_alert("a1"), None))
+        await asyncio.sleep(0.01)  # Primeira gravação em andamento
+        second = asyncio.create_task(sender._send_notification(_make_alert("a2"), None))
+        assert await asyncio.gather(first, second) == [True, True]
+
+        return sender
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = Path(tmp) / "alerts.log"
+        sender = asyncio.run(scenario(log_path))
+
+        lines = log_path.read_text(encoding='utf-8').splitlines()
+        assert len(lines) == 2, f"esperadas 2 linhas, gravadas {len(lines)}"
+        assert not sender._pending
+
+    print("✅ Todas as entradas gravadas")
+
+
+class FailingFileSender(FileSender):
+    """FileSender cuja primeira gravação falha"""
+
+    def __init__(self, config: NotificationConfig):
+        super().__init__(config)
+        self.failures = 1
+
+    def _write_batch(self, data: bytes):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("disco cheio")
+        super()._write_batch(data)
+
+
+def test_file_sender_reports_failed_writes():
+    """Envio só conta como sucesso após a gravação; lote com falha volta para a fila"""
+    print("🧪 TESTE: FileSender informa falhas de gravação")
+
+    async def scenario(log_path: Path):
+        sender = FailingFileSender(NotificationConfig(
+            channel=NotificationChannel.FILE,
+            config={'file_path': str(log_path)}
+        ))
+
+        assert await sender._send_notification(_make_alert("a1"), None) is False
+        assert len(sender._pending) == 1
+        assert await sender._send_notification(_make_alert("a2"), None) is True
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = Path(tmp) / "alerts.log"
+        asyncio.run(scenario(log_path))
+
+        lines = log_path.read_text(encoding='utf-8').splitlines()
+        assert [json.loads(line)['alert_id'] for line in lines] == ["a1", "a2"]
+
+    print("✅ Falha informada e entrada regravada")
+
+
+def test_history_written_on_shutdown():
+    """aclose() grava no histórico todos os alertas disparados antes do próximo flush periódico"""
+    print("🧪 TESTE: histórico completo após o encerramento")
+
+    async def scenario() -> AlertSystem:
+        alert_system = AlertSystem("test_alerts_config")
+        alert_system.add_alert_rule(AlertRule(
+            name="test_alert",
+            description="Alerta de teste",
+            condition="test_value > 10",
+            threshold=10.0,
+            severity=AlertSeverity.LOW,
+            channels=[NotificationChannel.FILE],
+            escalation_after_minutes=0
+        ))
+
+        alert_system.start_background_monitoring()
+        for i in range(5):
+            await alert_system.trigger_alert(
+                rule_name="test_alert",
+                title=f"Alerta {i}",
+                description="Disparo de teste",
+                context={'test_value': 15}
+            )
+        await alert_system.aclose()
+
+        return alert_system
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            alert_system = asyncio.run(scenario())
+
+            history = alert_system.history_path.read_text(encoding='utf-8').splitlines()
+            assert len(history) == 5, f"esperados 5 registros, gravados {len(history)}"
+            assert not alert_system._pending_history
+
+            file_sender = alert_system.notification_senders[NotificationChannel.FILE]
+            log_lines = file_sender.file_path.read_text(encoding='utf-8').splitlines()
+            assert len(log_lines) == 5, f"esperadas 5 linhas de log, gravadas {len(log_lines)}"
+        finally:
+            os.chdir(cwd)
+
+    print("✅ Histórico e log completos após aclose()")
+
+
+def test_failed_history_write_keeps_batch():
+    """Falha ao gravar o histórico devolve o lote à fila, antes dos registros novos"""
+    print("🧪 TESTE: histórico mantido após falha de gravação")
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            alert_system = AlertSystem("test_alerts_config")
+            alert_system._pending_history = [("a1",), ("a2",)]
+
+            with patch.object(alert_system, '_write_history', side_effect=OSError("disco cheio")):
+                try:
+                    asyncio.run(alert_system.flush_history())
+                except OSError:
+                    pass
+                else:
+                    raise AssertionError("erro de gravação deveria ser propagado")
+
+            alert_system._pending_history.append(("a3",))
+            asyncio.run(alert_system.flush_history())
+
+            history = alert_system.history_path.read_text(encoding='utf-8').splitlines()
+            assert history == ['["a1"]', '["a2"]', '["a3"]'], history
+        finally:
+            os.chdir(cwd)
+
+    print("✅ Lote regravado na tentativa seguinte")
+
+
+def test_export_dir_created_on_first_export():
+    """Instanciar o sistema não cria o diretório de exportação; a primeira exportação cria"""
+    print("🧪 TESTE: diretório de exportação criado sob demanda")
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            alert_system = AlertSystem("test_alerts_config")
+            assert not alert_system._export_dir.exists()
+
+            with patch.object(Path, 'mkdir', autospec=True, side_effect=Path.mkdir) as mkdir:
+                filename = Path(alert_system.export_alerts())
+                alert_system.export_alerts()
+            assert filename.parent == alert_system._export_dir
+            assert filename.exists()
+            # Só as chamadas do sistema de alertas (mkdir com parents se chama recursivamente)
+            export_mkdirs = [
+                c for c in mkdir.call_args_list
+                if c.args[0] == alert_system._export_dir and c.kwargs.get('parents')
+            ]
+            assert len(export_mkdirs) == 1, "mkdir deveria rodar só na primeira exportação"
+        finally:
+            os.chdir(cwd)
+
+    print("✅ Diretório criado só na exportação")
+
+
+def test_history_buffer_tracks_retriggers():
+    """Redisparos atualizam o registro em memória; slots sobrescritos são esquecidos"""
+    print("🧪 TESTE: trigger_count atualizado no histórico")
+
+    buffer = AlertHistoryBuffer(capacity=2)
+    first, second = _make_alert("a1"), _make_alert("a2")
+    buffer.append(first)
+    buffer.append(second)
+
+    first.trigger_count = 3
+    buffer.update_trigger_count(first)
+    assert [r['trigger_count'] for r in buffer.records()] == [3, 1]
+
+    buffer.append(_make_alert("a3"))  # Sobrescreve o registro de a1
+    first.trigger_count = 4
+    buffer.update_trigger_count(first)
+    assert [r['id'] for r in buffer.records()] == ["a2", "a3"]
+    assert [r['trigger_count'] for r in buffer.records()] == [1, 1]
+
+    print("✅ Registro atualizado a cada redisparo")
+
+
+def test_retrigger_updates_history_record():
+    """trigger_alert repetido reflete a contagem no histórico em memória"""
+    async def scenario() -> AlertSystem:
+        alert_system = AlertSystem("test_alerts_config")
+        alert_system.add_alert_rule(AlertRule(
+            name="test_alert",
+            description="Alerta de teste",
+            condition="test_value > 10",
+            threshold=10.0,
+            severity=AlertSeverity.LOW,
+            channels=[],
+            escalation_after_minutes=0
+        ))
+        for _ in range(3):
+            await alert_system.trigger_alert(
+                rule_name="test_alert", title="Alerta", description="Disparo repetido"
+            )
+        await alert_system.aclose()
+        return alert_system
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            alert_system = asyncio.run(scenario())
+        finally:
+            os.chdir(cwd)
+
+    assert alert_system.alert_history.capacity == 10000
+    records = alert_system.alert_history.records()
+    assert len(records) == 1
+    assert records[0]['trigger_count'] == 3
+    print("✅ Histórico com contagem de redisparos")
+
+
+def main():
+    test_file_sender_keeps_entries_sent_during_flush()
+    test_file_sender_reports_failed_writes()
+    test_history_written_on_shutdown()
+    test_failed_history_write_keeps_batch()
+    test_export_dir_created_on_first_export()
+    test_history_buffer_tracks_retriggers()
+    test_retrigger_updates_history_record()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Teste dos níveis do Logger Estruturado
+
+Verifica que mensagens de debug abaixo do nível do logger não chegam a ser
+montadas nos caminhos de tracing e de performance.
+"""
+
+import sys
+import os
+import tempfile
+from unittest.mock import patch
+
+# Adicionar diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.systems.structured_logger import StructuredLogger, LogLevel, Component
+
+
+def test_disabled_debug_builds_no_records():
+    """Com nível INFO, trace_operation e track_performance só montam o registro INFO"""
+    print("🧪 TESTE: debug desativado não monta registros")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        logger = StructuredLogger("test_structured_logger", log_dir=tmp)
+        logger.set_level(LogLevel.INFO)
+
+        try:
+            with patch.object(logger, '_create_log_record',
+                              wraps=logger._create_log_record) as create_record:
+                with logger.trace_operation("operacao", Component.SYSTEM):
+                    pass
+                assert create_record.call_count == 0
+
+                with logger.track_performance(Component.SYSTEM, "operacao"):
+                    pass
+                levels = [call.args[0] for call in create_record.call_args_list]
+                assert levels == [LogLevel.INFO], levels
+
+            logger.set_level(LogLevel.DEBUG)
+            assert logger.is_enabled_for(LogLevel.DEBUG)
+        finally:
+            for handler in logger.logger.handlers:
+                handler.close()
+
+    print("✅ Registros de debug não montados")
+
+
+def main():
+    test_disabled_debug_builds_no_records()
+
+
+if __name__ == "__main__":
+    main()